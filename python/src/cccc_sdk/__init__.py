@@ -3,7 +3,17 @@ from __future__ import annotations
 from importlib.metadata import PackageNotFoundError, version
 
 from .client import CCCCClient
+from .context_index import ContextSnapshot
+from .context_ops import InvalidContextOpsError
+from .context_txn import ContextTxn
 from .errors import CCCCSDKError, DaemonAPIError, DaemonUnavailableError, IncompatibleDaemonError
+from .inbox import InboxCounters, InboxCounts
+from .memory import ContextGuard, DailyFlushBuffer
+from .outbox import Outbox
+from .space import SpaceJobWaiter
+from .tail import TailFollower
+from .terminal import TermSession
+from .tools import ToolCall, ToolExecutor
 
 
 def _detect_version() -> str:
@@ -18,8 +28,21 @@ __version__ = _detect_version()
 __all__ = [
     "CCCCClient",
     "CCCCSDKError",
+    "ContextGuard",
+    "ContextSnapshot",
+    "ContextTxn",
+    "DailyFlushBuffer",
     "DaemonAPIError",
     "DaemonUnavailableError",
     "IncompatibleDaemonError",
+    "InvalidContextOpsError",
+    "InboxCounters",
+    "InboxCounts",
+    "Outbox",
+    "SpaceJobWaiter",
+    "TailFollower",
+    "TermSession",
+    "ToolCall",
+    "ToolExecutor",
     "__version__",
 ]
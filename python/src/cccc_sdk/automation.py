@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from .errors import DaemonAPIError
+
+if TYPE_CHECKING:
+    from .client import CCCCClient
+
+
+def _rule_id(rule: Dict[str, Any]) -> str:
+    return str(rule.get("id") or rule.get("rule_id") or "")
+
+
+def diff_automation(current: Dict[str, Any], desired: Dict[str, Any], *, prune: bool = False) -> List[Dict[str, Any]]:
+    """Compute the minimal `group_automation_manage` actions turning `current` into `desired`.
+
+    Both arguments are rulesets (`{"rules": [...], "snippets": {...}}`); rules
+    are matched by `id`. Only fields present in a desired rule are compared,
+    so daemon-maintained fields do not cause churn. A rule whose only change
+    is `enabled` becomes `set_rule_enabled`; other changes become
+    `update_rule` with the desired fields merged over the current rule.
+    Current rules missing from `desired` are deleted only with `prune`.
+    Snippet changes cannot be expressed per item, so they collapse the batch
+    into one `replace_all_rules`.
+    """
+    cur_rules = {_rule_id(r): dict(r) for r in current.get("rules") or [] if isinstance(r, dict) and _rule_id(r)}
+    want_rules = [dict(r) for r in desired.get("rules") or [] if isinstance(r, dict)]
+    for r in want_rules:
+        if not _rule_id(r):
+            raise ValueError("desired automation rules need an `id`")
+
+    actions: List[Dict[str, Any]] = []
+    final: Dict[str, Dict[str, Any]] = dict(cur_rules)
+    for want in want_rules:
+        rid = _rule_id(want)
+        have = cur_rules.get(rid)
+        if have is None:
+            actions.append({"type": "create_rule", "rule": want})
+            final[rid] = want
+            continue
+        changed = [k for k, v in want.items() if have.get(k) != v]
+        if not changed:
+            continue
+        if changed == ["enabled"]:
+            actions.append({"type": "set_rule_enabled", "rule_id": rid, "enabled": bool(want["enabled"])})
+        else:
+            actions.append({"type": "update_rule", "rule": {**have, **want}})
+        final[rid] = {**have, **want}
+    if prune:
+        wanted_ids = {_rule_id(r) for r in want_rules}
+        for rid in cur_rules:
+            if rid not in wanted_ids:
+                actions.append({"type": "delete_rule", "rule_id": rid})
+                final.pop(rid, None)
+
+    if "snippets" in desired:
+        cur_snippets = dict(current.get("snippets") or {})
+        want_snippets = dict(desired.get("snippets") or {})
+        if not prune:
+            want_snippets = {**cur_snippets, **want_snippets}
+        if want_snippets != cur_snippets:
+            ruleset = {"rules": list(final.values()), "snippets": want_snippets}
+            return [{"type": "replace_all_rules", "ruleset": ruleset}]
+    return actions
+
+
+@dataclass(frozen=True)
+class AutomationGroupResult:
+    group_id: str
+    actions: List[Dict[str, Any]] = field(default_factory=list)
+    version: Optional[int] = None  # version after apply (or the version read, on dry run / no-op)
+    applied: bool = False
+    error_code: str = ""
+    error: str = ""
+
+    @property
+    def ok(self) -> bool:
+        return not self.error_code
+
+
+@dataclass
+class AutomationReport:
+    dry_run: bool = False
+    groups: List[AutomationGroupResult] = field(default_factory=list)
+
+    @property
+    def changed(self) -> List[AutomationGroupResult]:
+        return [g for g in self.groups if g.actions]
+
+    @property
+    def failed(self) -> List[AutomationGroupResult]:
+        return [g for g in self.groups if not g.ok]
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed
+
+
+def reconcile_automation(
+    client: "CCCCClient",
+    desired: Dict[str, Dict[str, Any]],
+    *,
+    prune: bool = False,
+    dry_run: bool = False,
+    max_workers: int = 8,
+    by: str = "user",
+) -> AutomationReport:
+    """Reconcile automation rules for many groups: `desired` maps group_id -> ruleset spec.
+
+    Each group's `group_automation_state` is read in parallel, diffed with
+    `diff_automation`, and any changes are sent as one `group_automation_manage`
+    batch guarded by `expected_version`. Groups already in sync cost one read.
+    With `dry_run`, the planned actions are reported and nothing is written.
+    """
+
+    def one(group_id: str) -> AutomationGroupResult:
+        try:
+            state = client.group_automation_state(group_id=group_id, by=by)
+            version = state.get("version")
+            actions = diff_automation(dict(state.get("ruleset") or {}), dict(desired[group_id]), prune=prune)
+            if dry_run or not actions:
+                return AutomationGroupResult(group_id, actions, version)
+            res = client.group_automation_manage(
+                group_id=group_id,
+                by=by,
+                actions=actions,
+                expected_version=int(version) if version is not None else None,
+            )
+            return AutomationGroupResult(group_id, actions, res.get("version"), applied=True)
+        except DaemonAPIError as e:
+            return AutomationGroupResult(group_id, error_code=e.code, error=e.message)
+        except Exception as e:
+            return AutomationGroupResult(group_id, error_code="error", error=str(e))
+
+    group_ids = [str(g) for g in desired]
+    report = AutomationReport(dry_run=bool(dry_run))
+    if not group_ids:
+        return report
+    with ThreadPoolExecutor(max_workers=max(1, min(int(max_workers), len(group_ids)))) as pool:
+        report.groups = list(pool.map(one, group_ids))
+    return report
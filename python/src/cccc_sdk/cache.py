@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Generic, Hashable, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+    evictions: int = 0
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.misses
+
+    @property
+    def hit_ratio(self) -> float:
+        return (self.hits / self.lookups) if self.lookups else 0.0
+
+
+@dataclass(frozen=True)
+class SearchCacheStats(CacheStats):
+    daemon_took_ms: float = 0.0  # sum of `took_ms` reported by the daemon on misses
+    saved_took_ms: float = 0.0  # sum of cached `took_ms` served from memory on hits
+
+
+@dataclass(frozen=True)
+class SpaceQueryCacheStats(CacheStats):
+    coalesced: int = 0  # callers that joined an identical in-flight query
+    degraded_uncached: int = 0  # degraded answers passed through without caching
+
+
+class TTLCache(Generic[V]):
+    """A small thread-safe LRU cache with per-entry TTL and hit/miss counters."""
+
+    def __init__(
+        self,
+        *,
+        ttl_s: Optional[float] = None,
+        max_entries: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl_s = float(ttl_s) if ttl_s is not None else None
+        self._max_entries = max(1, int(max_entries))
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._data: "OrderedDict[Hashable, Tuple[Optional[float], V]]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+    def get(self, key: Hashable) -> Tuple[bool, Optional[V]]:
+        """Return `(found, value)` and count a hit or miss."""
+        with self._lock:
+            item = self._data.get(key)
+            if item is not None:
+                expires_at, value = item
+                if expires_at is None or expires_at > self._clock():
+                    self._data.move_to_end(key)
+                    self._hits += 1
+                    return True, value
+                del self._data[key]
+            self._misses += 1
+            return False, None
+
+    def peek(self, key: Hashable) -> Optional[V]:
+        """Return a live value without touching LRU order or counters."""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at is not None and expires_at <= self._clock():
+                return None
+            return value
+
+    def put(self, key: Hashable, value: V, *, ttl_s: Optional[float] = None) -> None:
+        ttl = self._ttl_s if ttl_s is None else float(ttl_s)
+        expires_at = (self._clock() + ttl) if ttl is not None else None
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self._max_entries:
+                self._data.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, key: Hashable) -> bool:
+        with self._lock:
+            if self._data.pop(key, None) is None:
+                return False
+            self._invalidations += 1
+            return True
+
+    def invalidate_where(self, predicate: Callable[[Any], bool]) -> int:
+        """Drop every entry whose key matches `predicate`; return how many were dropped."""
+        with self._lock:
+            keys = [k for k in self._data if predicate(k)]
+            for k in keys:
+                del self._data[k]
+            self._invalidations += len(keys)
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._invalidations += len(self._data)
+            self._data.clear()
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                invalidations=self._invalidations,
+                evictions=self._evictions,
+            )
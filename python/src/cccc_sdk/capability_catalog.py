@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import re
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Set
+
+if TYPE_CHECKING:
+    from .client import CCCCClient
+
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+_MAX_PREFIX = 16  # longer query tokens are matched on their first 16 chars, then verified
+_FACETS = ("kind", "source_id", "trust_tier", "qualification_status", "policy_level")
+
+
+def _tokens(text: str) -> List[str]:
+    return _TOKEN.findall(str(text or "").lower())
+
+
+class CapabilityCatalog:
+    """Local, indexed snapshot of `capability_overview(include_indexed=True)`.
+
+    Items are indexed by token prefix (over capability id, name, kind, source
+    id, trust tier, tags and tool names) and by exact facet values, so
+    type-ahead searches are set intersections in memory instead of daemon
+    calls. Enable it with `CCCCClient(capability_catalog=True)`: the client's
+    own `capability_import` / `capability_uninstall` mark single records
+    dirty (re-fetched on the next search), while `capability_allowlist_update`
+    / `capability_allowlist_reset` mark the whole snapshot stale.
+    """
+
+    def __init__(self, client: "CCCCClient", *, limit: int = 2000) -> None:
+        self._client = client
+        self._limit = int(limit)
+        self._lock = threading.RLock()
+        self._items: Dict[str, Dict[str, Any]] = {}
+        self._prefix: Dict[str, Set[str]] = {}
+        self._facets: Dict[str, Dict[str, Set[str]]] = {f: {} for f in _FACETS}
+        self._loaded = False
+        self._dirty: Dict[str, int] = {}  # capability_id -> mark sequence
+        self._marks = 0
+        self.allowlist_revision = ""
+        self.loads = 0  # full capability_overview fetches
+        self.refreshes = 0  # single-record refetches
+
+    def __len__(self) -> int:
+        self._ensure_fresh()
+        return len(self._items)
+
+    def get(self, capability_id: str) -> Optional[Dict[str, Any]]:
+        self._ensure_fresh()
+        return self._items.get(str(capability_id))
+
+    def search(
+        self,
+        query: str = "",
+        *,
+        kind: str = "",
+        source_id: str = "",
+        trust_tier: str = "",
+        qualification_status: str = "",
+        policy_level: str = "",
+        limit: int = 50,
+    ) -> List[Dict[str, Any]]:
+        """Prefix search: every query token must prefix-match some indexed token.
+
+        Results are ranked by whether the name starts with the query, then by
+        name; facet arguments filter by exact value.
+        """
+        self._ensure_fresh()
+        with self._lock:
+            candidates: List[Set[str]] = []
+            facets = {
+                "kind": kind,
+                "source_id": source_id,
+                "trust_tier": trust_tier,
+                "qualification_status": qualification_status,
+                "policy_level": policy_level,
+            }
+            for facet, value in facets.items():
+                if value:
+                    candidates.append(self._facets[facet].get(str(value), set()))
+            q_tokens = _tokens(query)
+            for tok in q_tokens:
+                hits = self._prefix.get(tok[:_MAX_PREFIX], set())
+                if len(tok) > _MAX_PREFIX:
+                    hits = {cid for cid in hits if any(t.startswith(tok) for t in self._item_tokens(cid))}
+                candidates.append(hits)
+            if candidates:
+                candidates.sort(key=len)
+                ids = set(candidates[0])
+                for other in candidates[1:]:
+                    ids &= other
+                    if not ids:
+                        break
+            else:
+                ids = set(self._items)
+            q = " ".join(q_tokens)
+            items = [self._items[cid] for cid in ids]
+
+        def rank(it: Dict[str, Any]) -> Any:
+            name = str(it.get("name") or "")
+            return (not " ".join(_tokens(name)).startswith(q), name)
+
+        items.sort(key=rank)
+        return items[: max(0, int(limit))]
+
+    # ------------------------------------------------------------------
+    # Refresh
+    # ------------------------------------------------------------------
+
+    def load(self) -> None:
+        """(Re)fetch the full catalog and rebuild the indexes."""
+        res = self._client.capability_overview(limit=self._limit, include_indexed=True)
+        with self._lock:
+            self._items.clear()
+            self._prefix.clear()
+            self._facets = {f: {} for f in _FACETS}
+            for item in res.get("items") or []:
+                if isinstance(item, dict) and item.get("capability_id"):
+                    self._index(dict(item))
+            self.allowlist_revision = str(res.get("allowlist_revision") or "")
+            self._dirty.clear()
+            self._loaded = True
+            self.loads += 1
+
+    def mark_dirty(self, capability_id: str) -> None:
+        with self._lock:
+            self._marks += 1
+            self._dirty[str(capability_id)] = self._marks
+
+    def mark_stale(self) -> None:
+        with self._lock:
+            self._loaded = False
+
+    def _ensure_fresh(self) -> None:
+        with self._lock:
+            if not self._loaded:
+                self.load()
+                return
+            dirty = dict(self._dirty)
+        for cid in sorted(dirty):
+            # An id stays dirty until its refetch succeeds, so a failed call is retried next time.
+            res = self._client.capability_overview(query=cid, limit=50, include_indexed=True)
+            found = [it for it in res.get("items") or [] if isinstance(it, dict) and it.get("capability_id") == cid]
+            with self._lock:
+                self.refreshes += 1
+                if not found:
+                    # The targeted query may not match ids; fall back to a full reload.
+                    self.load()
+                    return
+                self._unindex(cid)
+                self._index(dict(found[0]))
+                if self._dirty.get(cid) == dirty[cid]:  # not re-marked while we were fetching
+                    del self._dirty[cid]
+
+    # ------------------------------------------------------------------
+    # Index maintenance
+    # ------------------------------------------------------------------
+
+    def _item_tokens(self, cid: str) -> Set[str]:
+        item = self._items.get(cid) or {}
+        fields: Iterable[Any] = (
+            cid,
+            item.get("name"),
+            item.get("kind"),
+            item.get("source_id"),
+            item.get("trust_tier"),
+            *(item.get("tags") or []),
+            *(item.get("tool_names") or []),
+        )
+        out: Set[str] = set()
+        for value in fields:
+            out.update(_tokens(str(value or "")))
+        return out
+
+    def _index(self, item: Dict[str, Any]) -> None:
+        cid = str(item["capability_id"])
+        self._items[cid] = item
+        for tok in self._item_tokens(cid):
+            for n in range(1, min(len(tok), _MAX_PREFIX) + 1):
+                self._prefix.setdefault(tok[:n], set()).add(cid)
+        for facet in _FACETS:
+            self._facets[facet].setdefault(str(item.get(facet) or ""), set()).add(cid)
+
+    def _unindex(self, cid: str) -> None:
+        if cid not in self._items:
+            return
+        for tok in self._item_tokens(cid):
+            for n in range(1, min(len(tok), _MAX_PREFIX) + 1):
+                bucket = self._prefix.get(tok[:n])
+                if bucket is not None:
+                    bucket.discard(cid)
+        item = self._items.pop(cid)
+        for facet in _FACETS:
+            self._facets[facet].get(str(item.get(facet) or ""), set()).discard(cid)
@@ -3,8 +3,23 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Set
 
+from .capability_catalog import CapabilityCatalog
+from .context_cache import ContextCache
+from .context_ops import InvalidContextOpsError, validate_context_ops
 from .errors import DaemonAPIError, IncompatibleDaemonError
-from .transport import DaemonEndpoint, call_daemon, discover_endpoint, open_events_stream
+from .memory_cache import MemorySearchCache
+from .metadata_cache import MetadataCache
+from .space_cache import SpaceQueryCache
+from .terminal import TermSession
+from .transport import (
+    DaemonEndpoint,
+    _default_home,
+    call_daemon,
+    call_daemon_projected,
+    discover_endpoint,
+    open_events_stream,
+    open_term_attach,
+)
 
 
 class CCCCClient:
@@ -16,18 +31,85 @@ class CCCCClient:
         cccc_home: Optional[str] = None,
         endpoint: Optional[DaemonEndpoint] = None,
         timeout_s: float = 30.0,
+        context_cache_ttl_s: Optional[float] = None,
+        memory_search_cache_size: int = 0,
+        memory_search_cache_ttl_s: Optional[float] = 60.0,
+        space_query_cache_size: int = 0,
+        space_query_cache_ttl_s: Optional[float] = 60.0,
+        capability_catalog: bool = False,
+        metadata_cache_ttls: Optional[Dict[str, float]] = None,
     ) -> None:
         self._timeout_s = float(timeout_s)
         self._home = Path(cccc_home).expanduser() if cccc_home else None
         self._endpoint = endpoint or discover_endpoint(self._home)
+        self._context_cache = ContextCache(ttl_s=context_cache_ttl_s) if context_cache_ttl_s else None
+        self._memory_search_cache = (
+            MemorySearchCache(max_entries=memory_search_cache_size, ttl_s=memory_search_cache_ttl_s)
+            if memory_search_cache_size > 0
+            else None
+        )
+        self._space_query_cache = (
+            SpaceQueryCache(
+                max_entries=space_query_cache_size, ttl_s=space_query_cache_ttl_s, wait_timeout_s=self._timeout_s
+            )
+            if space_query_cache_size > 0
+            else None
+        )
+        self._capability_catalog = CapabilityCatalog(self) if capability_catalog else None
+        self._metadata_cache = MetadataCache(ttls=metadata_cache_ttls) if metadata_cache_ttls is not None else None
 
     @property
     def endpoint(self) -> DaemonEndpoint:
         return self._endpoint
 
-    def call_raw(self, op: str, args: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    @property
+    def context_cache(self) -> Optional[ContextCache]:
+        """The `context_get` cache (None unless `context_cache_ttl_s` was set)."""
+        return self._context_cache
+
+    @property
+    def memory_search_cache(self) -> Optional[MemorySearchCache]:
+        """The `memory_reme_search` cache (None unless `memory_search_cache_size` > 0)."""
+        return self._memory_search_cache
+
+    @property
+    def space_query_cache(self) -> Optional[SpaceQueryCache]:
+        """The `group_space_query` cache (None unless `space_query_cache_size` > 0)."""
+        return self._space_query_cache
+
+    @property
+    def capability_catalog(self) -> Optional[CapabilityCatalog]:
+        """Local capability catalog index (None unless `capability_catalog=True`; loads on first use)."""
+        return self._capability_catalog
+
+    @property
+    def metadata_cache(self) -> Optional[MetadataCache]:
+        """The `groups` / `group_show` / `actor_list` cache (None unless `metadata_cache_ttls` was given)."""
+        return self._metadata_cache
+
+    @property
+    def home(self) -> Path:
+        """CCCC home directory (explicit `cccc_home`, else `CCCC_HOME`, else `~/.cccc`)."""
+        return (self._home or _default_home()).expanduser()
+
+    def _invalidate_metadata(self, group_id: str) -> None:
+        if self._metadata_cache is not None:
+            self._metadata_cache.invalidate(group_id)
+
+    def call_raw(
+        self,
+        op: str,
+        args: Optional[Dict[str, Any]] = None,
+        *,
+        projection: Optional[List[str]] = None,
+        timeout_s: Optional[float] = None,
+    ) -> Dict[str, Any]:
         req = {"v": 1, "op": str(op), "args": dict(args or {})}
-        resp = call_daemon(endpoint=self._endpoint, request=req, timeout_s=self._timeout_s)
+        timeout = self._timeout_s if timeout_s is None else float(timeout_s)
+        if projection:
+            resp = call_daemon_projected(endpoint=self._endpoint, request=req, timeout_s=timeout, paths=projection)
+        else:
+            resp = call_daemon(endpoint=self._endpoint, request=req, timeout_s=timeout)
         if bool(resp.get("ok")):
             return resp
         err = resp.get("error") if isinstance(resp.get("error"), dict) else {}
@@ -38,9 +120,22 @@ class CCCCClient:
             raw=resp if isinstance(resp, dict) else None,
         )
 
-    def call(self, op: str, args: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        """Call an IPC op and return only the `result` payload."""
-        resp = self.call_raw(op, args)
+    def call(
+        self,
+        op: str,
+        args: Optional[Dict[str, Any]] = None,
+        *,
+        projection: Optional[List[str]] = None,
+        timeout_s: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Call an IPC op and return only the `result` payload.
+
+        `projection` takes dotted paths rooted at the response envelope (e.g.
+        `["result.tasks_summary", "result.coordination.brief"]`); the response is
+        then parsed incrementally and unrequested subtrees are never materialized.
+        `timeout_s` overrides the client-wide socket timeout for this call.
+        """
+        resp = self.call_raw(op, args, projection=projection, timeout_s=timeout_s)
         out = resp.get("result")
         return dict(out) if isinstance(out, dict) else {}
 
@@ -96,11 +191,18 @@ class CCCCClient:
     def ping(self) -> Dict[str, Any]:
         return self.call("ping")
 
-    def groups(self) -> Dict[str, Any]:
-        return self.call("groups")
+    def groups(self, *, fresh: bool = False) -> Dict[str, Any]:
+        cache = self._metadata_cache
+        if cache is None or fresh:
+            return self.call("groups")
+        return cache.get("groups", "", lambda: self.call("groups"))
 
-    def group_show(self, group_id: str) -> Dict[str, Any]:
-        return self.call("group_show", {"group_id": str(group_id)})
+    def group_show(self, group_id: str, *, fresh: bool = False) -> Dict[str, Any]:
+        args = {"group_id": str(group_id)}
+        cache = self._metadata_cache
+        if cache is None or fresh:
+            return self.call("group_show", args)
+        return cache.get("group_show", str(group_id), lambda: self.call("group_show", args))
 
     def attach(self, *, path: str, group_id: str = "", by: str = "user") -> Dict[str, Any]:
         args: Dict[str, Any] = {"path": str(path), "by": str(by)}
@@ -109,19 +211,27 @@ class CCCCClient:
         return self.call("attach", args)
 
     def group_create(self, *, title: str = "", topic: str = "", by: str = "user") -> Dict[str, Any]:
-        return self.call("group_create", {"title": str(title), "topic": str(topic), "by": str(by)})
+        res = self.call("group_create", {"title": str(title), "topic": str(topic), "by": str(by)})
+        self._invalidate_metadata(str(res.get("group_id") or ""))
+        return res
 
     def group_update(self, *, group_id: str, patch: Dict[str, Any], by: str = "user") -> Dict[str, Any]:
-        return self.call("group_update", {"group_id": str(group_id), "by": str(by), "patch": dict(patch)})
+        res = self.call("group_update", {"group_id": str(group_id), "by": str(by), "patch": dict(patch)})
+        self._invalidate_metadata(str(group_id))
+        return res
 
     def group_delete(self, *, group_id: str, by: str = "user") -> Dict[str, Any]:
-        return self.call("group_delete", {"group_id": str(group_id), "by": str(by)})
+        res = self.call("group_delete", {"group_id": str(group_id), "by": str(by)})
+        self._invalidate_metadata(str(group_id))
+        return res
 
     def group_use(self, *, group_id: str, path: str, by: str = "user") -> Dict[str, Any]:
         return self.call("group_use", {"group_id": str(group_id), "path": str(path), "by": str(by)})
 
     def group_set_state(self, *, group_id: str, state: str, by: str = "user") -> Dict[str, Any]:
-        return self.call("group_set_state", {"group_id": str(group_id), "state": str(state), "by": str(by)})
+        res = self.call("group_set_state", {"group_id": str(group_id), "state": str(state), "by": str(by)})
+        self._invalidate_metadata(str(group_id))
+        return res
 
     def group_settings_update(self, *, group_id: str, patch: Dict[str, Any], by: str = "user") -> Dict[str, Any]:
         return self.call("group_settings_update", {"group_id": str(group_id), "by": str(by), "patch": dict(patch)})
@@ -170,14 +280,59 @@ class CCCCClient:
             args["expected_version"] = int(expected_version)
         return self.call("group_automation_reset_baseline", args)
 
+    def group_template_export(self, *, group_id: str) -> Dict[str, Any]:
+        return self.call("group_template_export", {"group_id": str(group_id)})
+
+    def group_template_preview(self, *, group_id: str, template: str, by: str = "user") -> Dict[str, Any]:
+        return self.call("group_template_preview", {"group_id": str(group_id), "by": str(by), "template": str(template)})
+
+    def group_template_import_replace(
+        self,
+        *,
+        group_id: str,
+        template: str,
+        confirm: str,
+        by: str = "user",
+    ) -> Dict[str, Any]:
+        args = {"group_id": str(group_id), "by": str(by), "confirm": str(confirm), "template": str(template)}
+        res = self.call("group_template_import_replace", args)
+        self._invalidate_metadata(str(group_id))
+        return res
+
+    def group_create_from_template(
+        self,
+        *,
+        path: str,
+        template: str,
+        title: str = "",
+        topic: str = "",
+        by: str = "user",
+    ) -> Dict[str, Any]:
+        args: Dict[str, Any] = {"path": str(path), "by": str(by), "template": str(template)}
+        if title:
+            args["title"] = str(title)
+        if topic:
+            args["topic"] = str(topic)
+        res = self.call("group_create_from_template", args)
+        self._invalidate_metadata(str(res.get("group_id") or ""))
+        return res
+
     def group_start(self, *, group_id: str, by: str = "user") -> Dict[str, Any]:
-        return self.call("group_start", {"group_id": str(group_id), "by": str(by)})
+        res = self.call("group_start", {"group_id": str(group_id), "by": str(by)})
+        self._invalidate_metadata(str(group_id))
+        return res
 
     def group_stop(self, *, group_id: str, by: str = "user") -> Dict[str, Any]:
-        return self.call("group_stop", {"group_id": str(group_id), "by": str(by)})
+        res = self.call("group_stop", {"group_id": str(group_id), "by": str(by)})
+        self._invalidate_metadata(str(group_id))
+        return res
 
-    def actor_list(self, group_id: str) -> Dict[str, Any]:
-        return self.call("actor_list", {"group_id": str(group_id)})
+    def actor_list(self, group_id: str, *, fresh: bool = False) -> Dict[str, Any]:
+        args = {"group_id": str(group_id)}
+        cache = self._metadata_cache
+        if cache is None or fresh:
+            return self.call("actor_list", args)
+        return cache.get("actor_list", str(group_id), lambda: self.call("actor_list", args))
 
     def actor_add(
         self,
@@ -219,7 +374,9 @@ class CCCCClient:
             args["default_scope_key"] = str(default_scope_key)
         if submit:
             args["submit"] = str(submit)
-        return self.call("actor_add", args)
+        res = self.call("actor_add", args)
+        self._invalidate_metadata(str(group_id))
+        return res
 
     def actor_update(
         self,
@@ -241,19 +398,29 @@ class CCCCClient:
             args["profile_id"] = str(profile_id)
         if profile_action:
             args["profile_action"] = str(profile_action)
-        return self.call("actor_update", args)
+        res = self.call("actor_update", args)
+        self._invalidate_metadata(str(group_id))
+        return res
 
     def actor_remove(self, *, group_id: str, actor_id: str, by: str = "user") -> Dict[str, Any]:
-        return self.call("actor_remove", {"group_id": str(group_id), "actor_id": str(actor_id), "by": str(by)})
+        res = self.call("actor_remove", {"group_id": str(group_id), "actor_id": str(actor_id), "by": str(by)})
+        self._invalidate_metadata(str(group_id))
+        return res
 
     def actor_start(self, *, group_id: str, actor_id: str, by: str = "user") -> Dict[str, Any]:
-        return self.call("actor_start", {"group_id": str(group_id), "actor_id": str(actor_id), "by": str(by)})
+        res = self.call("actor_start", {"group_id": str(group_id), "actor_id": str(actor_id), "by": str(by)})
+        self._invalidate_metadata(str(group_id))
+        return res
 
     def actor_stop(self, *, group_id: str, actor_id: str, by: str = "user") -> Dict[str, Any]:
-        return self.call("actor_stop", {"group_id": str(group_id), "actor_id": str(actor_id), "by": str(by)})
+        res = self.call("actor_stop", {"group_id": str(group_id), "actor_id": str(actor_id), "by": str(by)})
+        self._invalidate_metadata(str(group_id))
+        return res
 
     def actor_restart(self, *, group_id: str, actor_id: str, by: str = "user") -> Dict[str, Any]:
-        return self.call("actor_restart", {"group_id": str(group_id), "actor_id": str(actor_id), "by": str(by)})
+        res = self.call("actor_restart", {"group_id": str(group_id), "actor_id": str(actor_id), "by": str(by)})
+        self._invalidate_metadata(str(group_id))
+        return res
 
     def actor_env_private_keys(self, *, group_id: str, actor_id: str, by: str = "user") -> Dict[str, Any]:
         """List configured private env keys for an actor (keys only; never returns values)."""
@@ -503,10 +670,16 @@ class CCCCClient:
             args["overlay"] = dict(overlay)
         if expected_revision:
             args["expected_revision"] = str(expected_revision)
-        return self.call("capability_allowlist_update", args)
+        res = self.call("capability_allowlist_update", args)
+        if self._capability_catalog is not None:
+            self._capability_catalog.mark_stale()
+        return res
 
     def capability_allowlist_reset(self, *, by: str = "user") -> Dict[str, Any]:
-        return self.call("capability_allowlist_reset", {"by": str(by)})
+        res = self.call("capability_allowlist_reset", {"by": str(by)})
+        if self._capability_catalog is not None:
+            self._capability_catalog.mark_stale()
+        return res
 
     def capability_import(
         self,
@@ -535,7 +708,10 @@ class CCCCClient:
             args["ttl_seconds"] = int(ttl_seconds)
         if reason:
             args["reason"] = str(reason)
-        return self.call("capability_import", args)
+        res = self.call("capability_import", args)
+        if self._capability_catalog is not None and not dry_run:
+            self._capability_catalog.mark_dirty(str(res.get("capability_id") or record.get("capability_id") or ""))
+        return res
 
     def capability_uninstall(
         self,
@@ -555,7 +731,10 @@ class CCCCClient:
             args["actor_id"] = str(actor_id)
         if reason:
             args["reason"] = str(reason)
-        return self.call("capability_uninstall", args)
+        res = self.call("capability_uninstall", args)
+        if self._capability_catalog is not None:
+            self._capability_catalog.mark_dirty(str(capability_id))
+        return res
 
     def capability_tool_call(
         self,
@@ -565,6 +744,7 @@ class CCCCClient:
         arguments: Optional[Dict[str, Any]] = None,
         actor_id: str = "",
         by: str = "user",
+        timeout_s: Optional[float] = None,
     ) -> Dict[str, Any]:
         args: Dict[str, Any] = {
             "group_id": str(group_id),
@@ -575,7 +755,7 @@ class CCCCClient:
             args["arguments"] = dict(arguments)
         if actor_id:
             args["actor_id"] = str(actor_id)
-        return self.call("capability_tool_call", args)
+        return self.call("capability_tool_call", args, timeout_s=timeout_s)
 
     def group_space_status(self, *, group_id: str, provider: str = "notebooklm") -> Dict[str, Any]:
         return self.call("group_space_status", {"group_id": str(group_id), "provider": str(provider)})
@@ -629,7 +809,10 @@ class CCCCClient:
             args["payload"] = dict(payload)
         if idempotency_key:
             args["idempotency_key"] = str(idempotency_key)
-        return self.call("group_space_ingest", args)
+        res = self.call("group_space_ingest", args)
+        if self._space_query_cache is not None:
+            self._space_query_cache.invalidate(str(group_id), str(lane))
+        return res
 
     def group_space_query(
         self,
@@ -639,7 +822,9 @@ class CCCCClient:
         query: str,
         options: Optional[Dict[str, Any]] = None,
         provider: str = "notebooklm",
+        fresh: bool = False,
     ) -> Dict[str, Any]:
+        """Query a Group Space lane (served from `space_query_cache` when enabled, unless `fresh`)."""
         args: Dict[str, Any] = {
             "group_id": str(group_id),
             "provider": str(provider),
@@ -648,7 +833,10 @@ class CCCCClient:
         }
         if options is not None:
             args["options"] = dict(options)
-        return self.call("group_space_query", args)
+        cache = self._space_query_cache
+        if cache is None or fresh:
+            return self.call("group_space_query", args)
+        return cache.get(str(group_id), args, lambda: self.call("group_space_query", args))
 
     def group_space_sources(
         self,
@@ -759,7 +947,7 @@ class CCCCClient:
         provider: str = "notebooklm",
         by: str = "user",
     ) -> Dict[str, Any]:
-        return self.call(
+        res = self.call(
             "group_space_sync",
             {
                 "group_id": str(group_id),
@@ -770,6 +958,9 @@ class CCCCClient:
                 "by": str(by),
             },
         )
+        if self._space_query_cache is not None and str(action) == "run":
+            self._space_query_cache.invalidate(str(group_id), str(lane))
+        return res
 
     def group_space_provider_credential_status(self, *, provider: str = "notebooklm", by: str = "user") -> Dict[str, Any]:
         return self.call("group_space_provider_credential_status", {"provider": str(provider), "by": str(by)})
@@ -836,6 +1027,7 @@ class CCCCClient:
         priority: str = "normal",
         reply_required: bool = False,
         path: str = "",
+        client_id: str = "",
     ) -> Dict[str, Any]:
         args: Dict[str, Any] = {
             "group_id": str(group_id),
@@ -848,6 +1040,8 @@ class CCCCClient:
             args["to"] = [str(x) for x in to]
         if path:
             args["path"] = str(path)
+        if client_id:
+            args["client_id"] = str(client_id)
         return self.call("send", args)
 
     def reply(
@@ -860,6 +1054,7 @@ class CCCCClient:
         to: Optional[List[str]] = None,
         priority: str = "normal",
         reply_required: bool = False,
+        client_id: str = "",
     ) -> Dict[str, Any]:
         args: Dict[str, Any] = {
             "group_id": str(group_id),
@@ -871,6 +1066,8 @@ class CCCCClient:
         }
         if to is not None:
             args["to"] = [str(x) for x in to]
+        if client_id:
+            args["client_id"] = str(client_id)
         return self.call("reply", args)
 
     def chat_ack(self, *, group_id: str, actor_id: str, event_id: str, by: Optional[str] = None) -> Dict[str, Any]:
@@ -934,17 +1131,209 @@ class CCCCClient:
             },
         )
 
-    def context_get(self, *, group_id: str) -> Dict[str, Any]:
-        return self.call("context_get", {"group_id": str(group_id)})
+    def context_get(self, *, group_id: str, fresh: bool = False) -> Dict[str, Any]:
+        """Return the group context (served from `context_cache` when enabled, unless `fresh`)."""
+        gid = str(group_id)
+        cache = self._context_cache
+        if cache is None:
+            return self.call("context_get", {"group_id": gid})
+        if fresh:
+            cache.invalidate(gid)
+        return cache.get(gid, lambda: self.call("context_get", {"group_id": gid}))
 
     def context_sync(
-        self, *, group_id: str, ops: List[Dict[str, Any]], by: str = "system", dry_run: bool = False
+        self,
+        *,
+        group_id: str,
+        ops: List[Dict[str, Any]],
+        by: str = "system",
+        dry_run: bool = False,
+        if_version: str = "",
+        validate: bool = True,
     ) -> Dict[str, Any]:
-        return self.call(
-            "context_sync",
-            {"group_id": str(group_id), "by": str(by), "ops": list(ops), "dry_run": bool(dry_run)},
-        )
+        """Apply context ops. Ops are validated locally first (see `context_ops`);
+        a malformed batch raises `InvalidContextOpsError` without a daemon round trip."""
+        if validate:
+            errors = validate_context_ops(ops)
+            if errors:
+                raise InvalidContextOpsError(errors)
+        args: Dict[str, Any] = {"group_id": str(group_id), "by": str(by), "ops": list(ops), "dry_run": bool(dry_run)}
+        if if_version:
+            args["if_version"] = str(if_version)
+        res = self.call("context_sync", args)
+        if self._context_cache is not None and not dry_run:
+            self._context_cache.note_version(str(group_id), str(res.get("version") or ""))
+        if self._space_query_cache is not None and not dry_run:
+            # Coordination context feeds the work lane.
+            self._space_query_cache.invalidate(str(group_id), "work")
+        return res
+
+    def memory_reme_layout_get(self, *, group_id: str) -> Dict[str, Any]:
+        return self.call("memory_reme_layout_get", {"group_id": str(group_id)})
+
+    def memory_reme_index_sync(self, *, group_id: str, mode: str = "scan") -> Dict[str, Any]:
+        res = self.call("memory_reme_index_sync", {"group_id": str(group_id), "mode": str(mode)})
+        if self._memory_search_cache is not None:
+            self._memory_search_cache.invalidate(str(group_id))
+        return res
+
+    def memory_reme_search(
+        self,
+        *,
+        group_id: str,
+        query: str,
+        max_results: Optional[int] = None,
+        min_score: Optional[float] = None,
+        sources: Optional[List[str]] = None,
+        vector_weight: Optional[float] = None,
+        candidate_multiplier: Optional[int] = None,
+        fresh: bool = False,
+        timeout_s: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Search group memory (served from `memory_search_cache` when enabled, unless `fresh`)."""
+        args: Dict[str, Any] = {"group_id": str(group_id), "query": str(query)}
+        if max_results is not None:
+            args["max_results"] = int(max_results)
+        if min_score is not None:
+            args["min_score"] = float(min_score)
+        if sources is not None:
+            args["sources"] = [str(x) for x in sources]
+        if vector_weight is not None:
+            args["vector_weight"] = float(vector_weight)
+        if candidate_multiplier is not None:
+            args["candidate_multiplier"] = int(candidate_multiplier)
+        cache = self._memory_search_cache
+        if cache is None or fresh:
+            return self.call("memory_reme_search", args, timeout_s=timeout_s)
+        return dict(cache.get(str(group_id), args, lambda: self.call("memory_reme_search", args, timeout_s=timeout_s)))
+
+    def memory_reme_get(
+        self, *, group_id: str, path: str, offset: Optional[int] = None, limit: Optional[int] = None
+    ) -> Dict[str, Any]:
+        args: Dict[str, Any] = {"group_id": str(group_id), "path": str(path)}
+        if offset is not None:
+            args["offset"] = int(offset)
+        if limit is not None:
+            args["limit"] = int(limit)
+        return self.call("memory_reme_get", args)
 
+    def memory_reme_context_check(
+        self,
+        *,
+        group_id: str,
+        messages: List[Dict[str, Any]],
+        context_window_tokens: Optional[int] = None,
+        reserve_tokens: Optional[int] = None,
+        keep_recent_tokens: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        args: Dict[str, Any] = {"group_id": str(group_id), "messages": [dict(m) for m in messages]}
+        if context_window_tokens is not None:
+            args["context_window_tokens"] = int(context_window_tokens)
+        if reserve_tokens is not None:
+            args["reserve_tokens"] = int(reserve_tokens)
+        if keep_recent_tokens is not None:
+            args["keep_recent_tokens"] = int(keep_recent_tokens)
+        return self.call("memory_reme_context_check", args)
+
+    def memory_reme_compact(
+        self,
+        *,
+        group_id: str,
+        messages_to_summarize: List[Dict[str, Any]],
+        turn_prefix_messages: Optional[List[Dict[str, Any]]] = None,
+        previous_summary: str = "",
+        language: str = "",
+        return_prompt: Optional[bool] = None,
+    ) -> Dict[str, Any]:
+        args: Dict[str, Any] = {
+            "group_id": str(group_id),
+            "messages_to_summarize": [dict(m) for m in messages_to_summarize],
+        }
+        if turn_prefix_messages is not None:
+            args["turn_prefix_messages"] = [dict(m) for m in turn_prefix_messages]
+        if previous_summary:
+            args["previous_summary"] = str(previous_summary)
+        if language:
+            args["language"] = str(language)
+        if return_prompt is not None:
+            args["return_prompt"] = bool(return_prompt)
+        return self.call("memory_reme_compact", args)
+
+    def memory_reme_daily_flush(
+        self,
+        *,
+        group_id: str,
+        messages: List[Dict[str, Any]],
+        date: str = "",
+        version: str = "",
+        language: str = "",
+        return_prompt: Optional[bool] = None,
+        signal_pack: Optional[Dict[str, Any]] = None,
+        signal_pack_token_budget: Optional[int] = None,
+        dedup_intent: str = "",
+        dedup_query: str = "",
+    ) -> Dict[str, Any]:
+        args: Dict[str, Any] = {"group_id": str(group_id), "messages": [dict(m) for m in messages]}
+        if date:
+            args["date"] = str(date)
+        if version:
+            args["version"] = str(version)
+        if language:
+            args["language"] = str(language)
+        if return_prompt is not None:
+            args["return_prompt"] = bool(return_prompt)
+        if signal_pack is not None:
+            args["signal_pack"] = dict(signal_pack)
+        if signal_pack_token_budget is not None:
+            args["signal_pack_token_budget"] = int(signal_pack_token_budget)
+        if dedup_intent:
+            args["dedup_intent"] = str(dedup_intent)
+        if dedup_query:
+            args["dedup_query"] = str(dedup_query)
+        res = self.call("memory_reme_daily_flush", args)
+        if self._memory_search_cache is not None and str(res.get("status") or "") != "silent":
+            self._memory_search_cache.invalidate(str(group_id))
+        return res
+
+    def memory_reme_write(
+        self,
+        *,
+        group_id: str,
+        target: str,
+        content: str,
+        date: str = "",
+        mode: str = "",
+        idempotency_key: str = "",
+        actor_id: str = "",
+        source_refs: Optional[List[str]] = None,
+        tags: Optional[List[str]] = None,
+        supersedes: Optional[List[str]] = None,
+        dedup_intent: str = "",
+        dedup_query: str = "",
+    ) -> Dict[str, Any]:
+        args: Dict[str, Any] = {"group_id": str(group_id), "target": str(target), "content": str(content)}
+        if date:
+            args["date"] = str(date)
+        if mode:
+            args["mode"] = str(mode)
+        if idempotency_key:
+            args["idempotency_key"] = str(idempotency_key)
+        if actor_id:
+            args["actor_id"] = str(actor_id)
+        if source_refs is not None:
+            args["source_refs"] = [str(x) for x in source_refs]
+        if tags is not None:
+            args["tags"] = [str(x) for x in tags]
+        if supersedes is not None:
+            args["supersedes"] = [str(x) for x in supersedes]
+        if dedup_intent:
+            args["dedup_intent"] = str(dedup_intent)
+        if dedup_query:
+            args["dedup_query"] = str(dedup_query)
+        res = self.call("memory_reme_write", args)
+        if self._memory_search_cache is not None and str(res.get("status") or "") != "silent":
+            self._memory_search_cache.invalidate(str(group_id))
+        return res
 
     # ---------------------------------------------------------------------
     # events_stream (push stream)
@@ -1023,3 +1412,97 @@ class CCCCClient:
                 sock.close()
             except Exception:
                 pass
+
+    # ---------------------------------------------------------------------
+    # Terminal (diagnostics + PTY attach)
+    # ---------------------------------------------------------------------
+
+    def terminal_tail(
+        self,
+        *,
+        group_id: str,
+        actor_id: str,
+        by: str = "user",
+        max_chars: int = 0,
+        strip_ansi: Optional[bool] = None,
+        compact: Optional[bool] = None,
+    ) -> Dict[str, Any]:
+        args: Dict[str, Any] = {"group_id": str(group_id), "actor_id": str(actor_id), "by": str(by)}
+        if max_chars:
+            args["max_chars"] = int(max_chars)
+        if strip_ansi is not None:
+            args["strip_ansi"] = bool(strip_ansi)
+        if compact is not None:
+            args["compact"] = bool(compact)
+        return self.call("terminal_tail", args)
+
+    def terminal_clear(self, *, group_id: str, actor_id: str, by: str = "user") -> Dict[str, Any]:
+        return self.call("terminal_clear", {"group_id": str(group_id), "actor_id": str(actor_id), "by": str(by)})
+
+    def debug_tail_logs(self, *, component: str, group_id: str = "", by: str = "user", lines: int = 0) -> Dict[str, Any]:
+        args: Dict[str, Any] = {"component": str(component), "by": str(by)}
+        if group_id:
+            args["group_id"] = str(group_id)
+        if lines:
+            args["lines"] = int(lines)
+        return self.call("debug_tail_logs", args)
+
+    def debug_clear_logs(self, *, component: str, group_id: str = "", by: str = "user") -> Dict[str, Any]:
+        args: Dict[str, Any] = {"component": str(component), "by": str(by)}
+        if group_id:
+            args["group_id"] = str(group_id)
+        return self.call("debug_clear_logs", args)
+
+    def term_resize(self, *, group_id: str, actor_id: str, cols: int, rows: int) -> Dict[str, Any]:
+        args = {"group_id": str(group_id), "actor_id": str(actor_id), "cols": int(cols), "rows": int(rows)}
+        return self.call("term_resize", args)
+
+    def term_attach(
+        self,
+        *,
+        group_id: str,
+        actor_id: str,
+        chunk_bytes: int = 65536,
+        scrollback_bytes: int = 0,
+        timeout_s: Optional[float] = None,
+    ) -> TermSession:
+        """Attach to an actor's PTY and return a streaming `TermSession`.
+
+        After the handshake the socket has no read timeout (PTY output may be
+        idle for long periods); use `TermSession.fileno()` with a selector to
+        multiplex many sessions.
+        """
+        req = {"v": 1, "op": "term_attach", "args": {"group_id": str(group_id), "actor_id": str(actor_id)}}
+        sock, resp, rest = open_term_attach(
+            endpoint=self._endpoint,
+            request=req,
+            timeout_s=float(timeout_s or self._timeout_s),
+            chunk_bytes=chunk_bytes,
+        )
+        if not bool(resp.get("ok")):
+            try:
+                sock.close()
+            except Exception:
+                pass
+            err = resp.get("error") if isinstance(resp.get("error"), dict) else {}
+            raise DaemonAPIError(
+                code=str(err.get("code") or "error"),
+                message=str(err.get("message") or "daemon error"),
+                details=dict(err.get("details") or {}) if isinstance(err.get("details"), dict) else {},
+                raw=resp,
+            )
+        try:
+            sock.settimeout(None)
+        except Exception:
+            pass
+        result = resp.get("result") if isinstance(resp.get("result"), dict) else {}
+        return TermSession(
+            self,
+            sock,
+            dict(result),
+            group_id=str(group_id),
+            actor_id=str(actor_id),
+            initial=rest,
+            chunk_bytes=chunk_bytes,
+            scrollback_bytes=scrollback_bytes,
+        )
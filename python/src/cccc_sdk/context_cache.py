@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import copy
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .cache import CacheStats, TTLCache
+
+
+class ContextCache:
+    """Per-group cache of `context_get` results, validated by context `version`.
+
+    Entries are dropped when:
+    - a `context_sync` made through the client returns a different `version`,
+    - a `context.*` event for the group is observed (see `observe()`),
+    - the TTL (a safety net for changes made by other writers) expires.
+
+    Callers get deep copies, so mutating a returned document never leaks into
+    later hits. A load that overlaps an invalidation is returned but not
+    cached, since it may predate the change.
+    """
+
+    def __init__(self, *, ttl_s: float = 5.0, max_groups: int = 256) -> None:
+        self._cache: TTLCache[Dict[str, Any]] = TTLCache(ttl_s=float(ttl_s), max_entries=int(max_groups))
+        self._lock = threading.Lock()
+        self._epoch = 0
+        self._generation: Dict[str, int] = {}
+
+    def get(self, group_id: str, loader: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """Return the cached context for `group_id`, calling `loader()` on a miss."""
+        gid = str(group_id)
+        found, doc = self._cache.get(gid)
+        if found and doc is not None:
+            return copy.deepcopy(doc)
+        with self._lock:
+            version = self._version(gid)
+        doc = loader()
+        with self._lock:
+            if self._version(gid) == version:
+                self._cache.put(gid, copy.deepcopy(doc))
+        return doc
+
+    def version(self, group_id: str) -> str:
+        doc = self._cache.peek(str(group_id))
+        return str(doc.get("version") or "") if doc is not None else ""
+
+    def note_version(self, group_id: str, version: str) -> None:
+        """Record a version observed elsewhere (e.g. a `context_sync` result)."""
+        version = str(version or "")
+        # Also bump when nothing is cached: a load may be in flight with the old document.
+        if version and version != self.version(group_id):
+            self.invalidate(str(group_id))
+
+    def observe(self, item: Dict[str, Any]) -> None:
+        """Invalidate on `context.*` events (accepts a raw event or an events_stream item)."""
+        event = item.get("event") if isinstance(item.get("event"), dict) else item
+        if str(event.get("kind") or "").startswith("context."):
+            self.invalidate(str(event.get("group_id") or ""))
+
+    def invalidate(self, group_id: Optional[str] = None) -> None:
+        with self._lock:
+            if group_id is None:
+                self._epoch += 1
+            elif group_id:
+                self._generation[str(group_id)] = self._generation.get(str(group_id), 0) + 1
+        if group_id is None:
+            self._cache.clear()
+        elif group_id:
+            self._cache.invalidate(str(group_id))
+
+    def _version(self, gid: str) -> Tuple[int, int]:
+        # Bumped by invalidate(); a load only caches if this did not change meanwhile.
+        return (self._epoch, self._generation.get(gid, 0))
+
+    def stats(self) -> CacheStats:
+        return self._cache.stats()
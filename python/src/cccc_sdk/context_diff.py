@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from .context_ops import OP_SCHEMAS
+
+if TYPE_CHECKING:
+    from .client import CCCCClient
+
+
+BRIEF_FIELDS = ("objective", "current_focus", "constraints", "project_brief", "project_brief_stale")
+TASK_FIELDS = (
+    "title",
+    "outcome",
+    "parent_id",
+    "assignee",
+    "priority",
+    "blocked_by",
+    "waiting_on",
+    "handoff_to",
+    "notes",
+    "checklist",
+)
+AGENT_STATE_FIELDS = (
+    "active_task_id",
+    "focus",
+    "blockers",
+    "next_action",
+    "what_changed",
+    "open_loops",
+    "commitments",
+    "environment_summary",
+    "user_model",
+    "persona_notes",
+    "resume_hint",
+)
+META_FIELDS = ("project_status",)
+
+
+def _norm(value: Any) -> Any:
+    """Normalize a field value for comparison (None / "" / [] are equivalent)."""
+    if value is None or value == "" or value == []:
+        return None
+    if isinstance(value, list):
+        return [_norm_checklist_item(x) if isinstance(x, dict) else x for x in value]
+    return value
+
+
+def _norm_checklist_item(item: Dict[str, Any]) -> Tuple[str, str]:
+    return (str(item.get("text") or ""), str(item.get("status") or "pending"))
+
+
+def _changed(current: Dict[str, Any], desired: Dict[str, Any], fields: Tuple[str, ...]) -> Dict[str, Any]:
+    return {k: desired[k] for k in fields if k in desired and _norm(desired[k]) != _norm(current.get(k))}
+
+
+def _patch(op: str, patch: Dict[str, Any]) -> Dict[str, Any]:
+    """Turn null desired values into the op's typed "empty" value (context_get may return nulls)."""
+    schema = OP_SCHEMAS[op][0]
+    out: Dict[str, Any] = {}
+    for k, v in patch.items():
+        kind = schema.get(k)
+        if v is not None or kind == "str?":
+            out[k] = v
+        elif kind == "str":
+            out[k] = ""
+        elif kind in ("str[]", "checklist"):
+            out[k] = []
+        elif kind == "bool":
+            out[k] = False
+        # enums have no neutral value: leave the field untouched
+    return out
+
+
+def _context_tasks(doc: Dict[str, Any]) -> List[Dict[str, Any]]:
+    coord = doc.get("coordination") if isinstance(doc.get("coordination"), dict) else {}
+    tasks = coord.get("tasks") if "tasks" in coord else doc.get("tasks")
+    return [t for t in (tasks or []) if isinstance(t, dict)]
+
+
+def _context_brief(doc: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    coord = doc.get("coordination") if isinstance(doc.get("coordination"), dict) else {}
+    brief = coord.get("brief") if "brief" in coord else doc.get("brief")
+    return dict(brief) if isinstance(brief, dict) else None
+
+
+def _flat_agent_state(state: Dict[str, Any]) -> Dict[str, Any]:
+    out: Dict[str, Any] = {}
+    for part in ("hot", "warm"):
+        if isinstance(state.get(part), dict):
+            out.update(state[part])
+    out.update({k: v for k, v in state.items() if k in AGENT_STATE_FIELDS})
+    return out
+
+
+def diff_context(
+    current: Dict[str, Any],
+    desired: Dict[str, Any],
+    *,
+    archive_missing: bool = False,
+) -> List[Dict[str, Any]]:
+    """Compute the minimal `context_sync` ops turning `current` into `desired`.
+
+    Both documents use the `context_get` result shape (`coordination.brief`,
+    `coordination.tasks`, `agent_states`, `meta`); `brief` / `tasks` at the top
+    level are also accepted. Only keys present in `desired` are compared, so a
+    partial desired document leaves everything else untouched.
+
+    Tasks are matched by `id` (or by `title` when the desired task has no id);
+    unmatched desired tasks become `task.create`. Tasks missing from `desired`
+    are left alone unless `archive_missing=True`. Leaving `archived` uses
+    `task.restore` (plus a `task.move` when the target differs from
+    `archived_from`). Null desired values clear the field with its typed empty
+    value, so documents taken from `context_get` diff into valid ops.
+    """
+    ops: List[Dict[str, Any]] = []
+
+    # Tasks: create -> update -> move.
+    if "tasks" in desired or "tasks" in (desired.get("coordination") or {}):
+        cur_tasks = _context_tasks(current)
+        by_id = {str(t.get("id")): t for t in cur_tasks if t.get("id")}
+        by_title: Dict[str, Dict[str, Any]] = {}
+        for t in cur_tasks:
+            by_title.setdefault(str(t.get("title") or ""), t)
+        creates: List[Dict[str, Any]] = []
+        updates: List[Dict[str, Any]] = []
+        moves: List[Dict[str, Any]] = []
+        seen: set = set()
+        for want in _context_tasks(desired):
+            tid = str(want.get("id") or "")
+            have = by_id.get(tid) if tid else by_title.get(str(want.get("title") or ""))
+            if have is None:
+                op: Dict[str, Any] = {"op": "task.create"}
+                op.update({k: want[k] for k in TASK_FIELDS if k in want and want[k] is not None})
+                if want.get("status"):
+                    op["status"] = want["status"]
+                creates.append(op)
+                continue
+            hid = str(have.get("id") or "")
+            seen.add(hid)
+            patch = _patch("task.update", _changed(have, want, TASK_FIELDS))
+            if patch:
+                updates.append({"op": "task.update", "task_id": hid, **patch})
+            status = str(want.get("status") or "")
+            have_status = str(have.get("status") or "")
+            if status and status != have_status:
+                if have_status == "archived":
+                    # Restore returns the task to `archived_from`; move on only if that is not the target.
+                    moves.append({"op": "task.restore", "task_id": hid})
+                    if status != str(have.get("archived_from") or ""):
+                        moves.append({"op": "task.move", "task_id": hid, "status": status})
+                else:
+                    moves.append({"op": "task.move", "task_id": hid, "status": status})
+        if archive_missing:
+            for hid, have in by_id.items():
+                if hid not in seen and str(have.get("status") or "") != "archived":
+                    moves.append({"op": "task.move", "task_id": hid, "status": "archived"})
+        ops.extend(creates + updates + moves)
+
+    want_brief = _context_brief(desired)
+    if want_brief is not None:
+        patch = _patch("coordination.brief.update", _changed(_context_brief(current) or {}, want_brief, BRIEF_FIELDS))
+        if patch:
+            ops.append({"op": "coordination.brief.update", **patch})
+
+    if isinstance(desired.get("agent_states"), list):
+        cur_states = {
+            str(s.get("id") or s.get("actor_id") or ""): _flat_agent_state(s)
+            for s in (current.get("agent_states") or [])
+            if isinstance(s, dict)
+        }
+        for want_state in desired["agent_states"]:
+            if not isinstance(want_state, dict):
+                continue
+            aid = str(want_state.get("id") or want_state.get("actor_id") or "")
+            if not aid:
+                continue
+            patch = _patch(
+                "agent_state.update",
+                _changed(cur_states.get(aid, {}), _flat_agent_state(want_state), AGENT_STATE_FIELDS),
+            )
+            if patch:
+                ops.append({"op": "agent_state.update", "actor_id": aid, **patch})
+
+    if isinstance(desired.get("meta"), dict):
+        cur_meta = current.get("meta") if isinstance(current.get("meta"), dict) else {}
+        patch = _changed(cur_meta, desired["meta"], META_FIELDS)
+        if patch:
+            ops.append({"op": "meta.merge", "data": patch})
+
+    return ops
+
+
+def sync_desired_context(
+    client: "CCCCClient",
+    *,
+    group_id: str,
+    desired: Dict[str, Any],
+    by: str = "system",
+    dry_run: bool = False,
+    archive_missing: bool = False,
+) -> Dict[str, Any]:
+    """Diff `desired` against a fresh `context_get` and send only the needed ops.
+
+    Returns the `context_sync` result plus `ops`. When nothing changed, no
+    `context_sync` call is made.
+    """
+    current = client.context_get(group_id=str(group_id), fresh=True)
+    ops = diff_context(current, desired, archive_missing=archive_missing)
+    if not ops:
+        return {"success": True, "dry_run": bool(dry_run), "changes": [], "version": current.get("version"), "ops": []}
+    res = client.context_sync(group_id=str(group_id), ops=ops, by=str(by), dry_run=bool(dry_run))
+    return {**res, "ops": ops}
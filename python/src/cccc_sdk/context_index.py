@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from .context_diff import AGENT_STATE_FIELDS
+
+if TYPE_CHECKING:
+    from .client import CCCCClient
+
+
+TASK_STATUSES = ("planned", "active", "done", "archived")
+_HOT_FIELDS = ("active_task_id", "focus", "blockers", "next_action")
+
+# Ordered sets: dict keys keep insertion order and give O(1) add/remove.
+_IdSet = Dict[str, None]
+
+
+class ContextSnapshot:
+    """A local, indexed copy of a group's context (from `context_get`).
+
+    Tasks are indexed by id, status, assignee and parent; agent states by actor
+    id, so scheduler queries ("active tasks for X", "children of T") are O(1)
+    lookups plus the size of the answer instead of a scan over every task.
+
+    After a `context_sync`, call `apply_sync(ops, result)` (or use `sync()`) to
+    update the snapshot in place instead of refetching. The daemon does not
+    return ids for `task.create` as a stable contract, so a batch that creates
+    tasks marks the snapshot `stale`; `sync()` refetches in that case.
+    """
+
+    def __init__(self, context: Dict[str, Any]) -> None:
+        self._reset(context)
+
+    def _reset(self, context: Dict[str, Any]) -> None:
+        self.version = str(context.get("version") or "")
+        self.stale = False
+        coord = context.get("coordination") if isinstance(context.get("coordination"), dict) else {}
+        self.brief: Dict[str, Any] = dict(coord.get("brief") or {})
+        self.recent_decisions: List[Dict[str, Any]] = list(coord.get("recent_decisions") or [])
+        self.recent_handoffs: List[Dict[str, Any]] = list(coord.get("recent_handoffs") or [])
+        self.meta: Dict[str, Any] = dict(context.get("meta") or {})
+
+        self._tasks: Dict[str, Dict[str, Any]] = {}
+        self._by_status: Dict[str, _IdSet] = {}
+        self._by_assignee: Dict[str, _IdSet] = {}
+        self._by_parent: Dict[str, _IdSet] = {}
+        for task in coord.get("tasks") or []:
+            if isinstance(task, dict) and task.get("id"):
+                self._index_task(dict(task))
+
+        self._agent_states: Dict[str, Dict[str, Any]] = {}
+        for state in context.get("agent_states") or []:
+            if isinstance(state, dict) and state.get("id"):
+                self._agent_states[str(state["id"])] = {
+                    "id": str(state["id"]),
+                    "hot": dict(state.get("hot") or {}),
+                    "warm": dict(state.get("warm") or {}),
+                    "updated_at": state.get("updated_at"),
+                }
+
+    @classmethod
+    def load(cls, client: "CCCCClient", *, group_id: str) -> "ContextSnapshot":
+        return cls(client.context_get(group_id=str(group_id)))
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def task(self, task_id: str) -> Optional[Dict[str, Any]]:
+        return self._tasks.get(str(task_id))
+
+    def tasks(self, *, status: str = "", assignee: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Tasks filtered by status and/or assignee (smallest index drives the scan)."""
+        if assignee is not None:
+            mine = self._by_assignee.get(str(assignee or ""), {})
+            if not status:
+                return [self._tasks[i] for i in mine]
+            in_status = self._by_status.get(str(status), {})
+            small, other = (mine, in_status) if len(mine) <= len(in_status) else (in_status, mine)
+            return [self._tasks[i] for i in small if i in other]
+        if status:
+            return [self._tasks[i] for i in self._by_status.get(str(status), {})]
+        return list(self._tasks.values())
+
+    def active_tasks_for(self, actor_id: str) -> List[Dict[str, Any]]:
+        return self.tasks(status="active", assignee=str(actor_id))
+
+    def children(self, task_id: str) -> List[Dict[str, Any]]:
+        return [self._tasks[i] for i in self._by_parent.get(str(task_id), {})]
+
+    def roots(self) -> List[Dict[str, Any]]:
+        return self.children("")
+
+    def count(self, status: str) -> int:
+        return len(self._by_status.get(str(status), {}))
+
+    def tasks_summary(self) -> Dict[str, int]:
+        out = {s: self.count(s) for s in TASK_STATUSES}
+        out["total"] = len(self._tasks)
+        out["root_count"] = len(self._by_parent.get("", {}))
+        return out
+
+    def agent_state(self, actor_id: str) -> Optional[Dict[str, Any]]:
+        return self._agent_states.get(str(actor_id))
+
+    def agent_states(self) -> List[Dict[str, Any]]:
+        return list(self._agent_states.values())
+
+    # ------------------------------------------------------------------
+    # Incremental updates
+    # ------------------------------------------------------------------
+
+    def apply_sync(self, ops: List[Dict[str, Any]], result: Dict[str, Any]) -> None:
+        """Apply a successful (non-dry-run) `context_sync` batch to the snapshot."""
+        if bool(result.get("dry_run")):
+            return
+        changes = result.get("changes")
+        if isinstance(changes, list) and changes:
+            indexes = [c.get("index") for c in changes if isinstance(c, dict)]
+            applied = [ops[i] for i in indexes if isinstance(i, int) and 0 <= i < len(ops)]
+        else:
+            applied = list(ops)
+        for op in applied:
+            self.apply_op(op)
+        if result.get("version"):
+            self.version = str(result["version"])
+
+    def apply_op(self, op: Dict[str, Any]) -> None:
+        name = str(op.get("op") or "")
+        fields = {k: v for k, v in op.items() if k not in ("op", "task_id", "actor_id")}
+        if name == "task.create":
+            self.stale = True  # new task id is only known to the daemon
+        elif name in ("task.update", "task.move", "task.restore"):
+            task = self._tasks.get(str(op.get("task_id") or ""))
+            if task is None:
+                self.stale = True
+                return
+            self._unindex_task(task)
+            if name == "task.update":
+                fields.pop("status", None)  # task.update does not change lifecycle status
+                task.update(fields)
+            elif name == "task.move":
+                if op.get("status") == "archived" and task.get("status") != "archived":
+                    task["archived_from"] = task.get("status")
+                task["status"] = op.get("status")
+            else:
+                task["status"] = task.pop("archived_from", None) or "planned"
+            self._index_task(task)
+        elif name in ("agent_state.update", "agent_state.clear"):
+            aid = str(op.get("actor_id") or op.get("agent_id") or "")
+            state = self._agent_states.setdefault(aid, {"id": aid, "hot": {}, "warm": {}, "updated_at": None})
+            if name == "agent_state.clear":
+                state["hot"], state["warm"] = {}, {}
+                return
+            for k, v in fields.items():
+                if k in AGENT_STATE_FIELDS:
+                    state["hot" if k in _HOT_FIELDS else "warm"][k] = v
+        elif name == "coordination.brief.update":
+            self.brief.update(fields)
+        elif name == "coordination.note.add":
+            note = {"summary": op.get("summary"), "task_id": op.get("task_id")}
+            (self.recent_decisions if op.get("kind") == "decision" else self.recent_handoffs).append(note)
+        elif name == "meta.merge":
+            self.meta.update(dict(op.get("data") or {}))
+
+    def sync(
+        self,
+        client: "CCCCClient",
+        *,
+        group_id: str,
+        ops: List[Dict[str, Any]],
+        by: str = "system",
+    ) -> Dict[str, Any]:
+        """Run `context_sync` and keep this snapshot current (refetch only when stale)."""
+        res = client.context_sync(group_id=str(group_id), ops=ops, by=str(by), if_version=self.version)
+        self.apply_sync(ops, res)
+        if self.stale:
+            self._reset(client.context_get(group_id=str(group_id), fresh=True))
+        return res
+
+    # ------------------------------------------------------------------
+    # Index maintenance
+    # ------------------------------------------------------------------
+
+    def _index_task(self, task: Dict[str, Any]) -> None:
+        tid = str(task["id"])
+        self._tasks[tid] = task
+        self._by_status.setdefault(str(task.get("status") or ""), {})[tid] = None
+        self._by_assignee.setdefault(str(task.get("assignee") or ""), {})[tid] = None
+        self._by_parent.setdefault(str(task.get("parent_id") or ""), {})[tid] = None
+
+    def _unindex_task(self, task: Dict[str, Any]) -> None:
+        tid = str(task["id"])
+        self._by_status.get(str(task.get("status") or ""), {}).pop(tid, None)
+        self._by_assignee.get(str(task.get("assignee") or ""), {}).pop(tid, None)
+        self._by_parent.get(str(task.get("parent_id") or ""), {}).pop(tid, None)
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from .errors import CCCCSDKError
+
+# Field schemas derived from CCCC_CONTEXT_OPS_V1 §3.
+#   "str"      -> string
+#   "str?"     -> string or null
+#   "bool"     -> boolean
+#   "str[]"    -> list of strings
+#   "checklist"-> list of {id?, text, status?}
+#   "meta"     -> meta.merge `data` (restricted keys)
+#   ("enum", values) -> one of values
+TASK_STATUSES = ("planned", "active", "done", "archived")
+CHECKLIST_STATUSES = ("pending", "in_progress", "done")
+TASK_WAITING_ON = ("none", "user", "actor", "external")
+NOTE_KINDS = ("decision", "handoff")
+META_KEYS = ("project_status",)
+
+_TASK_FIELDS: Dict[str, Any] = {
+    "title": "str",
+    "outcome": "str",
+    "parent_id": "str?",
+    "assignee": "str?",
+    "priority": "str",
+    "blocked_by": "str[]",
+    "waiting_on": ("enum", TASK_WAITING_ON),
+    "handoff_to": "str?",
+    "notes": "str",
+    "checklist": "checklist",
+}
+
+OP_SCHEMAS: Dict[str, Tuple[Dict[str, Any], Tuple[str, ...]]] = {
+    "coordination.brief.update": (
+        {
+            "objective": "str",
+            "current_focus": "str",
+            "constraints": "str[]",
+            "project_brief": "str",
+            "project_brief_stale": "bool",
+        },
+        (),
+    ),
+    "coordination.note.add": (
+        {"kind": ("enum", NOTE_KINDS), "summary": "str", "task_id": "str?"},
+        ("kind", "summary"),
+    ),
+    "task.create": ({**_TASK_FIELDS, "status": ("enum", TASK_STATUSES)}, ("title",)),
+    "task.update": ({"task_id": "str", **_TASK_FIELDS}, ("task_id",)),
+    "task.move": ({"task_id": "str", "status": ("enum", TASK_STATUSES)}, ("task_id", "status")),
+    "task.restore": ({"task_id": "str"}, ("task_id",)),
+    "agent_state.update": (
+        {
+            "actor_id": "str",
+            "active_task_id": "str?",
+            "focus": "str",
+            "blockers": "str[]",
+            "next_action": "str",
+            "what_changed": "str",
+            "open_loops": "str[]",
+            "commitments": "str[]",
+            "environment_summary": "str",
+            "user_model": "str",
+            "persona_notes": "str",
+            "resume_hint": "str",
+        },
+        ("actor_id",),
+    ),
+    "agent_state.clear": ({"actor_id": "str"}, ("actor_id",)),
+    "meta.merge": ({"data": "meta"}, ("data",)),
+}
+
+
+@dataclass(frozen=True)
+class OpError:
+    index: int
+    op: str
+    field: str
+    code: str  # "invalid_op" | "unknown_op" | "missing_field" | "invalid_type" | "invalid_enum" | "forbidden_key"
+    message: str
+
+
+class InvalidContextOpsError(CCCCSDKError):
+    """Raised when a `context_sync` batch fails local validation (nothing was sent)."""
+
+    def __init__(self, errors: List[OpError]) -> None:
+        self.errors = list(errors)
+        head = "; ".join(f"ops[{e.index}].{e.field or 'op'}: {e.message}" for e in self.errors[:3])
+        more = f" (+{len(self.errors) - 3} more)" if len(self.errors) > 3 else ""
+        super().__init__(f"invalid context ops: {head}{more}")
+
+
+def _is_str(v: Any) -> bool:
+    return isinstance(v, str)
+
+
+def _check_field(kind: Any, value: Any) -> Optional[Tuple[str, str]]:
+    """Return (code, message) if `value` does not satisfy `kind`."""
+    if isinstance(kind, tuple) and kind[0] == "enum":
+        if value not in kind[1]:
+            return "invalid_enum", f"must be one of {', '.join(kind[1])}"
+        return None
+    if kind == "str":
+        return None if _is_str(value) else ("invalid_type", "must be a string")
+    if kind == "str?":
+        return None if value is None or _is_str(value) else ("invalid_type", "must be a string or null")
+    if kind == "bool":
+        return None if isinstance(value, bool) else ("invalid_type", "must be a boolean")
+    if kind == "str[]":
+        if isinstance(value, list) and all(_is_str(x) for x in value):
+            return None
+        return "invalid_type", "must be a list of strings"
+    if kind == "checklist":
+        if not isinstance(value, list):
+            return "invalid_type", "must be a list of checklist items"
+        for item in value:
+            if not isinstance(item, dict) or not _is_str(item.get("text")):
+                return "invalid_type", "checklist items need a string `text`"
+            if "id" in item and not _is_str(item["id"]):
+                return "invalid_type", "checklist item `id` must be a string"
+            if "status" in item and item["status"] not in CHECKLIST_STATUSES:
+                return "invalid_enum", f"checklist status must be one of {', '.join(CHECKLIST_STATUSES)}"
+        return None
+    return None
+
+
+def validate_context_ops(ops: Any) -> List[OpError]:
+    """Validate a `context_sync` ops list against CCCC_CONTEXT_OPS_V1 (no daemon call).
+
+    Checks op names, required fields, field types, enums and the restricted
+    `meta.merge` keys. Unknown extra fields are tolerated (spec §2). Returns a
+    list of structured errors; empty means the batch is well-formed (permission
+    and referential checks still happen on the daemon).
+    """
+    if not isinstance(ops, list):
+        return [OpError(-1, "", "ops", "invalid_type", "ops must be a list")]
+    errors: List[OpError] = []
+    for i, op in enumerate(ops):
+        if not isinstance(op, dict) or not _is_str(op.get("op")):
+            errors.append(OpError(i, "", "op", "invalid_op", "each op must be an object with a string `op`"))
+            continue
+        name = op["op"]
+        schema = OP_SCHEMAS.get(name)
+        if schema is None:
+            errors.append(OpError(i, name, "op", "unknown_op", f"unknown op {name!r}"))
+            continue
+        fields, required = schema
+        for field in required:
+            value = op.get(field)
+            if field == "actor_id" and value is None:
+                value = op.get("agent_id")  # legacy alias tolerated by the daemon
+            if value is None or (_is_str(value) and not value.strip()):
+                errors.append(OpError(i, name, field, "missing_field", "is required"))
+        for field, kind in fields.items():
+            if field not in op or (field in required and op.get(field) is None):
+                continue
+            if kind == "meta":
+                data = op[field]
+                if not isinstance(data, dict):
+                    errors.append(OpError(i, name, field, "invalid_type", "must be an object"))
+                    continue
+                for key, value in data.items():
+                    if key not in META_KEYS:
+                        errors.append(OpError(i, name, f"data.{key}", "forbidden_key", "only project_status is allowed"))
+                    elif value is not None and not _is_str(value):
+                        errors.append(OpError(i, name, f"data.{key}", "invalid_type", "must be a string or null"))
+                continue
+            problem = _check_field(kind, op[field])
+            if problem is not None:
+                errors.append(OpError(i, name, field, problem[0], problem[1]))
+    return errors
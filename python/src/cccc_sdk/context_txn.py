@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, List, Optional
+
+from .context_ops import InvalidContextOpsError, validate_context_ops
+from .errors import DaemonAPIError
+
+if TYPE_CHECKING:
+    from .client import CCCCClient
+
+
+RebaseFn = Callable[[List[Dict[str, Any]], Dict[str, Any]], List[Dict[str, Any]]]
+
+_MERGE_FIELDS_OPS = ("task.update", "agent_state.update", "coordination.brief.update")
+
+
+@dataclass(frozen=True)
+class TxnStats:
+    flushes: int = 0
+    ops_in: int = 0
+    ops_out: int = 0
+    conflicts: int = 0
+    retries: int = 0
+
+
+def _op_key(op: Dict[str, Any]) -> Optional[Hashable]:
+    name = str(op.get("op") or "")
+    if name.startswith("task.") and name != "task.create":
+        return ("task", str(op.get("task_id") or ""))
+    if name.startswith("agent_state."):
+        return ("agent_state", str(op.get("actor_id") or op.get("agent_id") or ""))
+    if name == "coordination.brief.update":
+        return ("brief",)
+    if name == "meta.merge":
+        return ("meta",)
+    return None  # task.create / coordination.note.add never coalesce
+
+
+def coalesce_ops(ops: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Merge redundant context ops while preserving batch semantics.
+
+    An op is folded into an earlier one only when that earlier op is the most
+    recent op touching the same target (task / actor / brief / meta):
+    - repeated `task.update`, `agent_state.update`, `coordination.brief.update`
+      merge their fields (later values win);
+    - repeated `task.move` keep the last status;
+    - repeated `meta.merge` merge their `data`;
+    - `agent_state.clear` supersedes an immediately preceding update.
+    """
+    out: List[Dict[str, Any]] = []
+    last: Dict[Hashable, int] = {}
+    for raw in ops:
+        op = dict(raw)
+        key = _op_key(op)
+        idx = last.get(key) if key is not None else None
+        name = str(op.get("op") or "")
+        if idx is not None:
+            prev = out[idx]
+            prev_name = str(prev.get("op") or "")
+            if name == prev_name and name in _MERGE_FIELDS_OPS:
+                prev.update(op)
+                continue
+            if name == prev_name == "task.move":
+                prev["status"] = op.get("status")
+                continue
+            if name == prev_name == "meta.merge":
+                prev["data"] = {**dict(prev.get("data") or {}), **dict(op.get("data") or {})}
+                continue
+            if name == "agent_state.clear" and prev_name == "agent_state.update":
+                out[idx] = op
+                continue
+        out.append(op)
+        if key is not None:
+            last[key] = len(out) - 1
+    return out
+
+
+class ContextTxn:
+    """Accumulate context ops from many threads and flush them as one `context_sync`.
+
+    Flushes use optimistic concurrency (`if_version`, CONTEXT_OPS §4). On
+    `version_conflict` the context is re-read, ops are rebased (via `rebase`
+    when given; context ops are patches, so by default they are re-sent as-is)
+    and the batch is retried with bounded, jittered exponential backoff.
+
+    Usable as a context manager: pending ops are flushed on a clean exit.
+    """
+
+    def __init__(
+        self,
+        client: "CCCCClient",
+        *,
+        group_id: str,
+        by: str = "system",
+        max_retries: int = 5,
+        backoff_s: float = 0.05,
+        max_backoff_s: float = 1.0,
+        linger_s: Optional[float] = None,
+        rebase: Optional[RebaseFn] = None,
+    ) -> None:
+        self._client = client
+        self._group_id = str(group_id)
+        self._by = str(by)
+        self._max_retries = max(0, int(max_retries))
+        self._backoff_s = max(0.0, float(backoff_s))
+        self._max_backoff_s = max(self._backoff_s, float(max_backoff_s))
+        self._linger_s = float(linger_s) if linger_s else None
+        self._rebase = rebase
+
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._ops: List[Dict[str, Any]] = []
+        self._timer: Optional[threading.Timer] = None
+        self._version = ""
+        self.last_error: Optional[BaseException] = None
+
+        self._flushes = 0
+        self._ops_in = 0
+        self._ops_out = 0
+        self._conflicts = 0
+        self._retries = 0
+
+    def __enter__(self) -> "ContextTxn":
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        if exc_type is None:
+            self.flush()
+
+    def add(self, op: Dict[str, Any]) -> None:
+        self.extend([op])
+
+    def extend(self, ops: List[Dict[str, Any]]) -> None:
+        """Queue ops; a malformed op raises `InvalidContextOpsError` here, not at flush."""
+        errors = validate_context_ops(list(ops))
+        if errors:
+            raise InvalidContextOpsError(errors)
+        items = [dict(x) for x in ops]
+        with self._lock:
+            self._ops.extend(items)
+            self._ops_in += len(items)
+            if self._linger_s and self._timer is None:
+                self._timer = threading.Timer(self._linger_s, self._flush_from_timer)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._ops)
+
+    def stats(self) -> TxnStats:
+        with self._lock:
+            return TxnStats(
+                flushes=self._flushes,
+                ops_in=self._ops_in,
+                ops_out=self._ops_out,
+                conflicts=self._conflicts,
+                retries=self._retries,
+            )
+
+    def flush(self) -> Optional[Dict[str, Any]]:
+        """Send all pending ops as one coalesced `context_sync` (None if nothing pending)."""
+        with self._flush_lock:
+            with self._lock:
+                ops, self._ops = self._ops, []
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+            ops = coalesce_ops(ops)
+            if not ops:
+                return None
+            try:
+                return self._commit(ops)
+            except BaseException:
+                with self._lock:
+                    self._ops[:0] = ops  # keep them for the caller to retry
+                raise
+
+    def _commit(self, ops: List[Dict[str, Any]]) -> Dict[str, Any]:
+        version = self._version or str(self._client.context_get(group_id=self._group_id).get("version") or "")
+        attempt = 0
+        while True:
+            try:
+                res = self._client.context_sync(group_id=self._group_id, ops=ops, by=self._by, if_version=version)
+                with self._lock:
+                    self._flushes += 1
+                    self._ops_out += len(ops)
+                self._version = str(res.get("version") or "")
+                return res
+            except DaemonAPIError as e:
+                if str(e.code or "") != "version_conflict":
+                    raise
+                with self._lock:
+                    self._conflicts += 1
+                if attempt >= self._max_retries:
+                    self._version = ""
+                    raise
+            attempt += 1
+            delay = min(self._max_backoff_s, self._backoff_s * (2 ** (attempt - 1)))
+            time.sleep(delay * (0.5 + random.random() / 2))
+            with self._lock:
+                self._retries += 1
+            ctx = self._client.context_get(group_id=self._group_id, fresh=True)
+            version = str(ctx.get("version") or "")
+            if self._rebase is not None:
+                ops = coalesce_ops(self._rebase(ops, ctx))
+                if not ops:
+                    return {"success": True, "dry_run": False, "changes": [], "version": version}
+
+    def _flush_from_timer(self) -> None:
+        try:
+            self.flush()
+        except Exception as e:
+            self.last_error = e
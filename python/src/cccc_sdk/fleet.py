@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from itertools import chain
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from .errors import DaemonAPIError
+
+if TYPE_CHECKING:
+    from .client import CCCCClient
+
+
+FLEET_ACTIONS = ("start", "stop", "restart", "update")
+
+
+@dataclass(frozen=True)
+class FleetSelector:
+    """Which groups (and optionally actors) a fleet operation targets.
+
+    Filters match fields of the `groups` / `actor_list` records: a scalar must
+    be equal, a list/tuple/set means "one of", and a callable is a predicate.
+    The operation works on actors when `actor_ids` or `actor_filter` is set
+    (or `actors=True`), and on whole groups otherwise.
+    """
+
+    group_ids: Optional[List[str]] = None  # None = every group from `groups`
+    group_filter: Dict[str, Any] = field(default_factory=dict)
+    actor_ids: Optional[List[str]] = None
+    actor_filter: Dict[str, Any] = field(default_factory=dict)
+    actors: bool = False
+
+    @property
+    def actor_scope(self) -> bool:
+        return self.actors or self.actor_ids is not None or bool(self.actor_filter)
+
+
+@dataclass(frozen=True)
+class FleetOutcome:
+    group_id: str
+    actor_id: str  # "" for group-level actions
+    ok: bool
+    result: Dict[str, Any] = field(default_factory=dict)
+    error_code: str = ""
+    error: str = ""
+
+
+@dataclass
+class FleetReport:
+    action: str
+    outcomes: List[FleetOutcome] = field(default_factory=list)
+    dry_run: bool = False
+
+    @property
+    def succeeded(self) -> List[FleetOutcome]:
+        return [o for o in self.outcomes if o.ok]
+
+    @property
+    def failed(self) -> List[FleetOutcome]:
+        return [o for o in self.outcomes if not o.ok]
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed
+
+
+def _matches(record: Dict[str, Any], filters: Dict[str, Any]) -> bool:
+    for key, want in filters.items():
+        have = record.get(key)
+        if callable(want):
+            if not want(have):
+                return False
+        elif isinstance(want, (list, tuple, set, frozenset)):
+            if have not in want:
+                return False
+        elif have != want:
+            return False
+    return True
+
+
+def resolve_targets(
+    client: "CCCCClient",
+    selector: FleetSelector,
+    *,
+    pool: Optional[ThreadPoolExecutor] = None,
+    failures: Optional[List[FleetOutcome]] = None,
+) -> List[Tuple[str, str]]:
+    """Expand a selector into `(group_id, actor_id)` pairs (actor_id is "" for group scope).
+
+    In actor scope, a group whose `actor_list` fails is appended to `failures`
+    as a failed outcome (actor_id "") and skipped; without `failures` the
+    first such error is raised.
+    """
+    if selector.group_ids is not None and not selector.group_filter:
+        group_ids = list(dict.fromkeys(str(g) for g in selector.group_ids))
+    else:
+        wanted = set(str(g) for g in selector.group_ids) if selector.group_ids is not None else None
+        group_ids = [
+            str(g.get("group_id") or "")
+            for g in client.groups().get("groups") or []
+            if isinstance(g, dict)
+            and g.get("group_id")
+            and (wanted is None or str(g["group_id"]) in wanted)
+            and _matches(g, selector.group_filter)
+        ]
+    if not selector.actor_scope:
+        return [(gid, "") for gid in group_ids]
+
+    def actors_of(gid: str) -> Tuple[List[Tuple[str, str]], Optional[FleetOutcome]]:
+        wanted = set(selector.actor_ids) if selector.actor_ids is not None else None
+        out = []
+        try:
+            actors = client.actor_list(gid).get("actors") or []
+        except Exception as e:
+            if failures is None:
+                raise
+            return out, _failure(gid, "", e)
+        for a in actors:
+            aid = str(a.get("id") or "") if isinstance(a, dict) else ""
+            if aid and (wanted is None or aid in wanted) and _matches(a, selector.actor_filter):
+                out.append((gid, aid))
+        return out, None
+
+    targets: List[Tuple[str, str]] = []
+    for chunk, failed in map(actors_of, group_ids) if pool is None else pool.map(actors_of, group_ids):
+        targets.extend(chunk)
+        if failed is not None and failures is not None:
+            failures.append(failed)
+    return targets
+
+
+def iter_fleet(
+    client: "CCCCClient",
+    selector: FleetSelector,
+    action: str,
+    *,
+    patch: Optional[Dict[str, Any]] = None,
+    max_workers: int = 8,
+    by: str = "user",
+) -> Iterator[FleetOutcome]:
+    """Run `action` on every selected target with bounded parallelism; yield outcomes as they finish.
+
+    Group scope: `start` / `stop` -> `group_start` / `group_stop`, `restart` ->
+    stop then start, `update` -> `group_update(patch)`. Actor scope: the
+    matching `actor_*` op (`update` -> `actor_update(patch)`). Failures are
+    yielded as outcomes, never raised; groups whose actors could not be
+    listed come first, with an empty actor_id.
+    """
+    _check_action(action, patch)
+    with ThreadPoolExecutor(max_workers=max(1, int(max_workers)), thread_name_prefix="cccc-fleet") as pool:
+        failures: List[FleetOutcome] = []
+        targets = resolve_targets(client, selector, pool=pool, failures=failures)
+        yield from failures
+        yield from _run_targets(client, pool, targets, str(action), dict(patch or {}), str(by))
+
+
+def run_fleet(
+    client: "CCCCClient",
+    selector: FleetSelector,
+    action: str,
+    *,
+    patch: Optional[Dict[str, Any]] = None,
+    max_workers: int = 8,
+    by: str = "user",
+    dry_run: bool = False,
+    on_progress: Optional[Callable[[FleetOutcome, int, int], None]] = None,
+) -> FleetReport:
+    """Run a fleet action and collect a report; `on_progress(outcome, done, total)` streams progress.
+
+    With `dry_run`, only the targets are resolved (each reported as ok with an
+    empty result) and nothing is changed. Groups whose actors could not be
+    listed are reported as failed outcomes in both modes.
+    """
+    _check_action(action, patch)
+    report = FleetReport(action=str(action), dry_run=bool(dry_run))
+    with ThreadPoolExecutor(max_workers=max(1, int(max_workers)), thread_name_prefix="cccc-fleet") as pool:
+        failures: List[FleetOutcome] = []
+        targets = resolve_targets(client, selector, pool=pool, failures=failures)
+        if dry_run:
+            report.outcomes = failures + [FleetOutcome(g, a, True) for g, a in targets]
+            return report
+        total = len(failures) + len(targets)
+        outcomes = chain(failures, _run_targets(client, pool, targets, str(action), dict(patch or {}), str(by)))
+        for outcome in outcomes:
+            report.outcomes.append(outcome)
+            if on_progress is not None:
+                on_progress(outcome, len(report.outcomes), total)
+    return report
+
+
+def _check_action(action: str, patch: Optional[Dict[str, Any]]) -> None:
+    if str(action) not in FLEET_ACTIONS:
+        raise ValueError(f"unknown fleet action {action!r} (expected one of {', '.join(FLEET_ACTIONS)})")
+    if str(action) == "update" and not patch:
+        raise ValueError("fleet action 'update' requires a patch")
+
+
+def _run_targets(
+    client: "CCCCClient",
+    pool: ThreadPoolExecutor,
+    targets: List[Tuple[str, str]],
+    action: str,
+    patch: Dict[str, Any],
+    by: str,
+) -> Iterator[FleetOutcome]:
+    def run_one(target: Tuple[str, str]) -> FleetOutcome:
+        gid, aid = target
+        try:
+            return FleetOutcome(gid, aid, True, _apply(client, action, gid, aid, patch, by))
+        except Exception as e:
+            return _failure(gid, aid, e)
+
+    for fut in as_completed([pool.submit(run_one, t) for t in targets]):
+        yield fut.result()
+
+
+def _failure(group_id: str, actor_id: str, exc: Exception) -> FleetOutcome:
+    if isinstance(exc, DaemonAPIError):
+        return FleetOutcome(group_id, actor_id, False, error_code=exc.code, error=exc.message)
+    return FleetOutcome(group_id, actor_id, False, error_code="error", error=str(exc))
+
+
+def _apply(
+    client: "CCCCClient", action: str, group_id: str, actor_id: str, patch: Dict[str, Any], by: str
+) -> Dict[str, Any]:
+    if actor_id:
+        if action == "update":
+            return client.actor_update(group_id=group_id, actor_id=actor_id, patch=patch, by=by)
+        fn = {"start": client.actor_start, "stop": client.actor_stop, "restart": client.actor_restart}[action]
+        return fn(group_id=group_id, actor_id=actor_id, by=by)
+    if action == "update":
+        return client.group_update(group_id=group_id, patch=patch, by=by)
+    if action == "restart":
+        client.group_stop(group_id=group_id, by=by)
+        return client.group_start(group_id=group_id, by=by)
+    fn = {"start": client.group_start, "stop": client.group_stop}[action]
+    return fn(group_id=group_id, by=by)
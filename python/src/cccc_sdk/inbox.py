@@ -0,0 +1,302 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Deque, Dict, Iterable, List, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+    from .client import CCCCClient
+
+
+COUNTER_EVENT_KINDS = frozenset({"chat.message", "chat.read", "chat.ack", "system.notify", "system.notify_ack"})
+
+
+@dataclass(frozen=True)
+class InboxCounts:
+    unread: int = 0
+    attention: int = 0  # attention chat.message not yet acked (chat.ack)
+    notify_ack: int = 0  # system.notify with requires_ack not yet acked
+
+
+def resolve_recipients(
+    to: Optional[Iterable[Any]],
+    *,
+    actors: Dict[str, str],
+    sender: str = "",
+) -> Set[str]:
+    """Resolve CCCS §5 recipient tokens into concrete recipient ids.
+
+    `actors` maps actor_id -> role ("foreman" | "peer"). The human user is `"user"`.
+    Empty/absent `to` is a broadcast (equivalent to `@all`). The sender never
+    receives its own message.
+    """
+    tokens = [str(x).strip() for x in (to or []) if str(x).strip()]
+    if not tokens:
+        tokens = ["@all"]
+    out: Set[str] = set()
+    for t in tokens:
+        if t == "@all":
+            out.update(actors.keys())
+        elif t == "@peers":
+            out.update(a for a, role in actors.items() if role != "foreman")
+        elif t == "@foreman":
+            out.update(a for a, role in actors.items() if role == "foreman")
+        elif t in ("@user", "user"):
+            out.add("user")
+        elif not t.startswith("@"):
+            out.add(t)
+        # Unknown selectors are ignored (forward-compatible).
+    out.discard(str(sender or ""))
+    return out
+
+
+def _ledger_sort_key(event: Dict[str, Any]) -> Tuple[int, str]:
+    seq = event.get("seq")
+    return (int(seq) if isinstance(seq, int) else 0, str(event.get("ts") or ""))
+
+
+class InboxCounters:
+    """Live per-actor unread / attention counters fed by `events_stream`.
+
+    Seed once from `inbox_list` (see `seed()`), then feed stream events through
+    `apply()` or run `follow()` / `start()`. Count queries are O(1) and never
+    touch the daemon.
+
+    Counters are best-effort (the stream may drop or duplicate events); call
+    `seed()` again after a reconnect, or when actors join or leave, to
+    reconcile counts and the roster used for broadcasts.
+    """
+
+    def __init__(
+        self,
+        client: "CCCCClient",
+        *,
+        group_id: str,
+        actors: Optional[Dict[str, str]] = None,
+        include_user: bool = True,
+        by: str = "user",
+        max_tracked_events: int = 50_000,
+    ) -> None:
+        self._client = client
+        self._group_id = str(group_id)
+        self._by = str(by)
+        self._include_user = bool(include_user)
+        self._actors: Dict[str, str] = {str(k): str(v) for k, v in (actors or {}).items()}
+        self._fixed_actors = bool(actors)  # an explicit roster is never refreshed
+        self._max_tracked = max(1, int(max_tracked_events))
+
+        self._lock = threading.Lock()
+        self._seq = 0
+        self._order: Dict[str, int] = {}
+        self._order_window: Deque[Tuple[int, str]] = deque()
+        self._unread: Dict[str, "OrderedDict[str, int]"] = {}
+        self._attention: Dict[str, Set[str]] = {}
+        self._notify_ack: Dict[str, Set[str]] = {}
+        self._last_event_id = ""
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    @property
+    def group_id(self) -> str:
+        return self._group_id
+
+    @property
+    def last_event_id(self) -> str:
+        return self._last_event_id
+
+    # ------------------------------------------------------------------
+    # Queries (O(1))
+    # ------------------------------------------------------------------
+
+    def unread(self, actor_id: str) -> int:
+        with self._lock:
+            return len(self._unread.get(str(actor_id), ()))
+
+    def attention(self, actor_id: str) -> int:
+        with self._lock:
+            return len(self._attention.get(str(actor_id), ()))
+
+    def counts(self, actor_id: str) -> InboxCounts:
+        aid = str(actor_id)
+        with self._lock:
+            return InboxCounts(
+                unread=len(self._unread.get(aid, ())),
+                attention=len(self._attention.get(aid, ())),
+                notify_ack=len(self._notify_ack.get(aid, ())),
+            )
+
+    def snapshot(self) -> Dict[str, InboxCounts]:
+        with self._lock:
+            ids = set(self._unread) | set(self._attention) | set(self._notify_ack)
+            return {
+                aid: InboxCounts(
+                    unread=len(self._unread.get(aid, ())),
+                    attention=len(self._attention.get(aid, ())),
+                    notify_ack=len(self._notify_ack.get(aid, ())),
+                )
+                for aid in sorted(ids)
+            }
+
+    # ------------------------------------------------------------------
+    # Seeding
+    # ------------------------------------------------------------------
+
+    def seed(self, *, limit: int = 1000) -> None:
+        """Reset counters from one `actor_list` + one `inbox_list` per recipient.
+
+        Unless a non-empty roster was passed to the constructor, the roster is reloaded
+        on every call, so actors added or removed since the last seed are
+        picked up for broadcasts.
+        """
+        if not self._fixed_actors:
+            res = self._client.actor_list(self._group_id)
+            actors = res.get("actors") if isinstance(res.get("actors"), list) else []
+            roles = {
+                str(a.get("id")).strip(): str(a.get("role") or "peer")
+                for a in actors
+                if isinstance(a, dict) and str(a.get("id") or "").strip()
+            }
+            with self._lock:
+                self._actors = roles
+
+        with self._lock:
+            recipients: List[str] = list(self._actors.keys())
+        if self._include_user:
+            recipients.append("user")
+
+        fetched: Dict[str, List[Dict[str, Any]]] = {}
+        for aid in recipients:
+            res = self._client.inbox_list(group_id=self._group_id, actor_id=aid, by=self._by, limit=int(limit))
+            msgs = res.get("messages") if isinstance(res.get("messages"), list) else []
+            fetched[aid] = [m for m in msgs if isinstance(m, dict)]
+
+        # Order the union of all inboxes once so per-actor unread lists stay
+        # sorted by ledger position (required by the chat.read watermark).
+        events: Dict[str, Dict[str, Any]] = {}
+        for msgs in fetched.values():
+            for ev in msgs:
+                eid = str(ev.get("id") or "").strip()
+                if eid:
+                    events.setdefault(eid, ev)
+        ordered = sorted(events.values(), key=_ledger_sort_key)
+
+        with self._lock:
+            self._unread.clear()
+            self._attention.clear()
+            self._notify_ack.clear()
+            for ev in ordered:
+                self._remember(str(ev.get("id")).strip())
+            for aid, msgs in fetched.items():
+                for ev in sorted(msgs, key=_ledger_sort_key):
+                    eid = str(ev.get("id") or "").strip()
+                    if eid:
+                        self._add_for(aid, eid, ev)
+            if ordered:
+                self._last_event_id = str(ordered[-1].get("id")).strip()
+
+    # ------------------------------------------------------------------
+    # Stream feeding
+    # ------------------------------------------------------------------
+
+    def apply(self, event: Dict[str, Any]) -> None:
+        """Apply one CCCS event (or an events_stream item wrapping one)."""
+        if str(event.get("t") or "") == "event" and isinstance(event.get("event"), dict):
+            event = event["event"]
+        kind = str(event.get("kind") or "")
+        if kind not in COUNTER_EVENT_KINDS:
+            return
+        data = event.get("data") if isinstance(event.get("data"), dict) else {}
+        eid = str(event.get("id") or "").strip()
+
+        with self._lock:
+            if eid:
+                self._last_event_id = eid
+            if kind in ("chat.message", "system.notify"):
+                if not eid or eid in self._order:
+                    return  # duplicate delivery
+                self._remember(eid)
+                if kind == "chat.message":
+                    recipients = resolve_recipients(
+                        data.get("to") if isinstance(data.get("to"), list) else None,
+                        actors=self._actors,
+                        sender=str(event.get("by") or ""),
+                    )
+                else:
+                    target = str(data.get("target_actor_id") or "").strip()
+                    recipients = {target} if target else set(self._actors.keys())
+                if not self._include_user:
+                    recipients.discard("user")
+                for aid in recipients:
+                    self._add_for(aid, eid, event)
+            elif kind == "chat.read":
+                self._mark_read(str(data.get("actor_id") or ""), str(data.get("event_id") or ""))
+            elif kind == "chat.ack":
+                self._attention.get(str(data.get("actor_id") or ""), set()).discard(str(data.get("event_id") or ""))
+            elif kind == "system.notify_ack":
+                self._notify_ack.get(str(data.get("actor_id") or ""), set()).discard(
+                    str(data.get("notify_event_id") or "")
+                )
+
+    def follow(self, *, timeout_s: Optional[float] = None) -> None:
+        """Consume `events_stream` until it ends or `stop()` is called (blocking)."""
+        for item in self._client.events_stream(
+            group_id=self._group_id,
+            by=self._by,
+            kinds=set(COUNTER_EVENT_KINDS),
+            since_event_id=self._last_event_id,
+            timeout_s=timeout_s,
+        ):
+            if self._stop.is_set():
+                break
+            self.apply(item)
+
+    def start(self, *, seed: bool = True) -> "InboxCounters":
+        """Seed (optionally) and follow the stream on a daemon thread."""
+        if seed:
+            self.seed()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.follow, name=f"cccc-inbox-{self._group_id}", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    # ------------------------------------------------------------------
+    # Internals (caller holds the lock)
+    # ------------------------------------------------------------------
+
+    def _remember(self, eid: str) -> None:
+        if eid in self._order:
+            return
+        self._seq += 1
+        self._order[eid] = self._seq
+        self._order_window.append((self._seq, eid))
+        while len(self._order_window) > self._max_tracked:
+            _, old = self._order_window.popleft()
+            self._order.pop(old, None)
+
+    def _add_for(self, aid: str, eid: str, event: Dict[str, Any]) -> None:
+        pos = self._order.get(eid)
+        if not aid or pos is None:
+            return  # evicted from the tracking window (older than `max_tracked_events`)
+        self._unread.setdefault(aid, OrderedDict())[eid] = pos
+        data = event.get("data") if isinstance(event.get("data"), dict) else {}
+        kind = str(event.get("kind") or "")
+        if kind == "chat.message" and str(data.get("priority") or "normal") == "attention":
+            self._attention.setdefault(aid, set()).add(eid)
+        elif kind == "system.notify" and bool(data.get("requires_ack")):
+            self._notify_ack.setdefault(aid, set()).add(eid)
+
+    def _mark_read(self, aid: str, eid: str) -> None:
+        # chat.read is an inclusive watermark: drop everything up to `eid`.
+        unread = self._unread.get(aid)
+        pos = self._order.get(eid)
+        if not unread or pos is None:
+            return
+        while unread:
+            _, first_pos = next(iter(unread.items()))
+            if first_pos > pos:
+                break
+            unread.popitem(last=False)
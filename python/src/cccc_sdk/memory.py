@@ -0,0 +1,533 @@
+from __future__ import annotations
+
+import hashlib
+import heapq
+import json
+import threading
+import time
+from collections import OrderedDict
+from datetime import date as _date
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+    from .client import CCCCClient
+
+
+def iter_memory_lines(
+    client: "CCCCClient",
+    *,
+    group_id: str,
+    path: str,
+    offset: int = 1,
+    limit: int = 200,
+    min_limit: int = 50,
+    max_limit: int = 5000,
+    target_bytes: int = 256_000,
+    prefetch: bool = True,
+) -> Iterator[str]:
+    """Yield lines of a memory file lazily via paged `memory_reme_get` calls.
+
+    The page size adapts to the observed bytes-per-line so each response stays
+    near `target_bytes`, is clipped to the remaining `total_lines`, and (with
+    `prefetch`) the next window is fetched on a background thread while the
+    caller consumes the current one. Memory use is bounded by ~two pages.
+    """
+    gid, p = str(group_id), str(path)
+    min_limit = max(1, int(min_limit))
+    max_limit = max(min_limit, int(max_limit))
+
+    def fetch(off: int, lim: int) -> Dict[str, Any]:
+        return client.memory_reme_get(group_id=gid, path=p, offset=off, limit=lim)
+
+    pool: Optional[ThreadPoolExecutor] = ThreadPoolExecutor(max_workers=1) if prefetch else None
+    try:
+        off = max(1, int(offset))
+        lim = max(1, int(limit))
+        page = fetch(off, lim)
+        while True:
+            content = str(page.get("content") or "")
+            total = int(page.get("total_lines") or 0)
+            off = int(page.get("offset") or off)
+            # Advance by what the daemon actually served (it may clamp `limit`),
+            # not by what was requested.
+            expected: Optional[int] = None
+            if total:
+                expected = max(0, total - off + 1)
+            if page.get("limit") is not None:
+                served_limit = max(0, int(page["limit"]))
+                expected = served_limit if expected is None else min(expected, served_limit)
+            # The daemon's line model is "\n"-separated (splitlines() would also split on \r, \x0b, \u2028).
+            lines = content.split("\n")
+            if lines[-1] == "" and (expected is None or len(lines) > expected):
+                lines.pop()  # terminating newline, not an extra blank line
+            if expected is not None:
+                del lines[expected:]
+            next_off = off + len(lines)
+
+            pending: Optional[Future] = None
+            next_lim = lim
+            if lines and (not total or next_off <= total):
+                avg = max(1.0, len(content.encode("utf-8")) / max(1, len(lines)))
+                next_lim = int(min(max_limit, max(min_limit, target_bytes / avg)))
+                if total:
+                    next_lim = max(1, min(next_lim, total - next_off + 1))
+                if pool is not None:
+                    pending = pool.submit(fetch, next_off, next_lim)
+
+            for line in lines:
+                yield line
+
+            if not lines or (total and next_off > total):
+                return
+            page = pending.result() if pending is not None else fetch(next_off, next_lim)
+            off, lim = next_off, next_lim
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=False)
+
+
+# ---------------------------------------------------------------------------
+# Context-window guard
+# ---------------------------------------------------------------------------
+
+_MESSAGE_OVERHEAD_TOKENS = 4  # role/name framing per message
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap, deliberately high token estimate for `text`.
+
+    One token per 3 UTF-8 bytes over-counts typical English (~4 chars/token)
+    and matches CJK (3 bytes/char, ~1 token/char), so the estimate errs on the
+    side of "closer to the threshold" rather than missing a compaction.
+    """
+    if not text:
+        return 0
+    return -(-len(text.encode("utf-8")) // 3)
+
+
+def estimate_message_tokens(message: Dict[str, Any]) -> int:
+    return (
+        _MESSAGE_OVERHEAD_TOKENS
+        + estimate_tokens(str(message.get("content") or ""))
+        + estimate_tokens(str(message.get("name") or ""))
+    )
+
+
+@dataclass(frozen=True)
+class ContextGuardStats:
+    checks: int = 0
+    daemon_calls: int = 0
+
+    @property
+    def skipped(self) -> int:
+        return self.checks - self.daemon_calls
+
+
+class ContextGuard:
+    """Track a conversation locally and call `memory_reme_context_check` only when needed.
+
+    Messages are appended with `add()` and their estimated size is kept as a
+    running total. `check()` answers `needs_compaction=False` locally while the
+    estimate stays below `threshold * (1 - margin)`; within the margin (or before
+    the threshold is known) it sends the full history to the daemon. The
+    threshold is learned from the first daemon answer unless `threshold_tokens`
+    is given. After compacting, call `replace()` with the surviving messages.
+    """
+
+    def __init__(
+        self,
+        client: "CCCCClient",
+        *,
+        group_id: str,
+        context_window_tokens: Optional[int] = None,
+        reserve_tokens: Optional[int] = None,
+        keep_recent_tokens: Optional[int] = None,
+        threshold_tokens: Optional[int] = None,
+        margin: float = 0.15,
+        messages: Optional[List[Dict[str, Any]]] = None,
+    ) -> None:
+        self._client = client
+        self._group_id = str(group_id)
+        self._context_window_tokens = context_window_tokens
+        self._reserve_tokens = reserve_tokens
+        self._keep_recent_tokens = keep_recent_tokens
+        self.threshold: Optional[int] = int(threshold_tokens) if threshold_tokens is not None else None
+        self._margin = min(max(float(margin), 0.0), 1.0)
+        self._lock = threading.Lock()
+        self._messages: List[Dict[str, Any]] = []
+        self._estimate = 0
+        self._checks = 0
+        self._daemon_calls = 0
+        if messages:
+            self.extend(messages)
+
+    @property
+    def messages(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return list(self._messages)
+
+    @property
+    def estimated_tokens(self) -> int:
+        return self._estimate
+
+    def add(self, message: Dict[str, Any]) -> None:
+        msg = dict(message)
+        with self._lock:
+            self._messages.append(msg)
+            self._estimate += estimate_message_tokens(msg)
+
+    def extend(self, messages: Iterable[Dict[str, Any]]) -> None:
+        for m in messages:
+            self.add(m)
+
+    def replace(self, messages: Iterable[Dict[str, Any]]) -> None:
+        """Reset the history (e.g. to `left_messages` plus a summary after compaction)."""
+        with self._lock:
+            self._messages = [dict(m) for m in messages]
+            self._estimate = sum(estimate_message_tokens(m) for m in self._messages)
+
+    def check(self, *, force: bool = False) -> Dict[str, Any]:
+        """Return a `memory_reme_context_check`-shaped result.
+
+        Local answers carry `estimated=True` and only `needs_compaction`,
+        `token_count` (the estimate) and `threshold`.
+        """
+        with self._lock:
+            self._checks += 1
+            estimate = self._estimate
+            threshold = self.threshold
+            if not force and threshold is not None and estimate < threshold * (1.0 - self._margin):
+                return {"needs_compaction": False, "token_count": estimate, "threshold": threshold, "estimated": True}
+            messages = list(self._messages)
+            self._daemon_calls += 1
+        res = self._client.memory_reme_context_check(
+            group_id=self._group_id,
+            messages=messages,
+            context_window_tokens=self._context_window_tokens,
+            reserve_tokens=self._reserve_tokens,
+            keep_recent_tokens=self._keep_recent_tokens,
+        )
+        if res.get("threshold") is not None:
+            self.threshold = int(res["threshold"])
+        return res
+
+    def stats(self) -> ContextGuardStats:
+        with self._lock:
+            return ContextGuardStats(checks=self._checks, daemon_calls=self._daemon_calls)
+
+
+# ---------------------------------------------------------------------------
+# Daily flush buffer
+# ---------------------------------------------------------------------------
+
+
+def message_hash(message: Dict[str, Any]) -> str:
+    """Stable content hash of a chat message (role, name, content)."""
+    canon = json.dumps(
+        [str(message.get("role") or ""), str(message.get("name") or ""), str(message.get("content") or "")],
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(canon.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class DailyFlushStats:
+    written: int = 0
+    silent: int = 0  # daemon answered status="silent"
+    skipped_local: int = 0  # duplicate batches that never left the client
+    deduped_messages: int = 0
+
+    @property
+    def daemon_calls(self) -> int:
+        return self.written + self.silent
+
+    @property
+    def written_ratio(self) -> float:
+        total = self.written + self.silent + self.skipped_local
+        return (self.written / total) if total else 0.0
+
+
+class DailyFlushBuffer:
+    """Batch messages for `memory_reme_daily_flush` and drop known duplicates locally.
+
+    Messages accumulate until their estimated size reaches `max_tokens` or the
+    oldest one is `max_age_s` old (checked on `add()`, or by the background
+    thread from `start()`). Each message is content-hashed; messages already
+    flushed for the same date are dropped (without an explicit `date`, the
+    local calendar day at flush time), and a batch with nothing new is
+    answered locally as `status="silent", reason="local_content_hash"`
+    instead of reaching the daemon's `persistence_content_hash` check.
+    """
+
+    def __init__(
+        self,
+        client: "CCCCClient",
+        *,
+        group_id: str,
+        max_tokens: int = 2000,
+        max_age_s: float = 300.0,
+        date: str = "",
+        version: str = "",
+        language: str = "",
+        dedup_intent: str = "",
+        max_hashes: int = 4096,
+        clock: Callable[[], float] = time.monotonic,
+        today: Callable[[], str] = lambda: _date.today().isoformat(),
+    ) -> None:
+        self._client = client
+        self._group_id = str(group_id)
+        self._max_tokens = max(1, int(max_tokens))
+        self._max_age_s = float(max_age_s)
+        self._date = str(date or "")
+        self._version = str(version or "")
+        self._language = str(language or "")
+        self._dedup_intent = str(dedup_intent or "")
+        self._max_hashes = max(1, int(max_hashes))
+        self._clock = clock
+        self._today = today
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._buf: List[Dict[str, Any]] = []
+        self._buf_tokens = 0
+        self._oldest: Optional[float] = None
+        self._seen: "OrderedDict[Tuple[str, str], None]" = OrderedDict()
+        self._written = 0
+        self._silent = 0
+        self._skipped_local = 0
+        self._deduped = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._buf)
+
+    def due(self) -> bool:
+        with self._lock:
+            if not self._buf:
+                return False
+            if self._buf_tokens >= self._max_tokens:
+                return True
+            return self._oldest is not None and self._clock() - self._oldest >= self._max_age_s
+
+    def add(self, message: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Buffer one message; flush and return the result if a budget was reached."""
+        msg = dict(message)
+        with self._lock:
+            if not self._buf:
+                self._oldest = self._clock()
+            self._buf.append(msg)
+            self._buf_tokens += estimate_message_tokens(msg)
+        return self.flush() if self.due() else None
+
+    def extend(self, messages: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        out = []
+        for m in messages:
+            res = self.add(m)
+            if res is not None:
+                out.append(res)
+        return out
+
+    def flush(self) -> Optional[Dict[str, Any]]:
+        """Send buffered, not-yet-seen messages now. Returns None when the buffer is empty.
+
+        On a daemon error the batch is put back in front of the buffer.
+        """
+        with self._flush_lock:
+            with self._lock:
+                batch, self._buf = self._buf, []
+                self._buf_tokens, self._oldest = 0, None
+            if not batch:
+                return None
+            # Dedup is per daily file: a long-running buffer must not drop tomorrow's repeats.
+            scope = self._date or str(self._today())
+            fresh: List[Dict[str, Any]] = []
+            hashes: List[str] = []
+            with self._lock:
+                batch_hashes = set()
+                for m in batch:
+                    h = message_hash(m)
+                    if (scope, h) in self._seen or h in batch_hashes:
+                        self._deduped += 1
+                        continue
+                    batch_hashes.add(h)
+                    fresh.append(m)
+                    hashes.append(h)
+                if not fresh:
+                    self._skipped_local += 1
+                    return {"status": "silent", "reason": "local_content_hash"}
+            try:
+                res = self._client.memory_reme_daily_flush(
+                    group_id=self._group_id,
+                    messages=fresh,
+                    date=self._date,
+                    version=self._version,
+                    language=self._language,
+                    dedup_intent=self._dedup_intent,
+                )
+            except Exception:
+                with self._lock:
+                    self._buf[:0] = batch
+                    self._buf_tokens += sum(estimate_message_tokens(m) for m in batch)
+                    self._oldest = self._oldest or self._clock()
+                raise
+            with self._lock:
+                if str(res.get("status") or "") == "silent":
+                    self._silent += 1
+                else:
+                    self._written += 1
+                for h in hashes:
+                    self._seen[(scope, h)] = None
+                while len(self._seen) > self._max_hashes:
+                    self._seen.popitem(last=False)
+            return res
+
+    def stats(self) -> DailyFlushStats:
+        with self._lock:
+            return DailyFlushStats(
+                written=self._written,
+                silent=self._silent,
+                skipped_local=self._skipped_local,
+                deduped_messages=self._deduped,
+            )
+
+    def start(self, *, interval_s: float = 1.0) -> "DailyFlushBuffer":
+        """Enforce the age budget from a background thread."""
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, args=(float(interval_s),), name="cccc-daily-flush", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, *, flush: bool = True, timeout_s: Optional[float] = None) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout_s)
+        if flush:
+            self.flush()
+
+    def _run(self, interval_s: float) -> None:
+        while not self._stop.wait(interval_s):
+            if self.due():
+                try:
+                    self.flush()
+                except Exception:
+                    # Keep the buffer (flush re-queued it) and retry next tick.
+                    pass
+
+
+# ---------------------------------------------------------------------------
+# Cross-group search
+# ---------------------------------------------------------------------------
+
+
+def search_memory_groups(
+    client: "CCCCClient",
+    *,
+    group_ids: Iterable[str],
+    query: str,
+    top_k: int = 10,
+    max_workers: int = 8,
+    timeout_s: Optional[float] = None,
+    min_score: Optional[float] = None,
+    sources: Optional[List[str]] = None,
+    vector_weight: Optional[float] = None,
+    candidate_multiplier: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Run `memory_reme_search` across groups concurrently and merge a global top-k.
+
+    Each group is asked for up to `top_k` hits (capped at the daemon's 50);
+    hits are tagged with `group_id` and merged through a bounded min-heap, so
+    the merge is O(n log k). `timeout_s` is a per-group deadline measured from
+    when that group's search starts (groups queued behind busy workers are
+    not penalized); it is also the socket timeout for the call, so a stuck
+    group frees its worker instead of holding it for the client default.
+    Groups that miss their deadline are reported as `"timeout"` and left out
+    of the merge; failures are reported per group as `"error"`.
+
+    Returns `{"hits": [...], "count": n, "groups": {group_id: {...}}}` where
+    each group entry has `status` ("ok" | "error" | "timeout") and, when ok,
+    `count` and `took_ms`.
+    """
+    gids = list(dict.fromkeys(str(g) for g in group_ids if str(g or "").strip()))
+    k = max(1, int(top_k))
+    per_group = min(k, 50)
+    groups: Dict[str, Dict[str, Any]] = {}
+    if not gids:
+        return {"hits": [], "count": 0, "groups": groups}
+
+    started: Dict[str, float] = {}
+    elapsed: Dict[str, float] = {}
+
+    def run(gid: str) -> Dict[str, Any]:
+        t0 = started[gid] = time.monotonic()
+        try:
+            return client.memory_reme_search(
+                group_id=gid,
+                query=str(query),
+                max_results=per_group,
+                min_score=min_score,
+                sources=sources,
+                vector_weight=vector_weight,
+                candidate_multiplier=candidate_multiplier,
+                timeout_s=timeout_s,
+            )
+        finally:
+            elapsed[gid] = time.monotonic() - t0
+
+    pool = ThreadPoolExecutor(max_workers=max(1, min(int(max_workers), len(gids))), thread_name_prefix="cccc-memsearch")
+    done: Set["Future[Dict[str, Any]]"] = set()
+    not_done: Set["Future[Dict[str, Any]]"] = set()
+    try:
+        futures = {pool.submit(run, gid): gid for gid in gids}
+        pending = set(futures)
+        while pending:
+            wait_s: Optional[float] = None
+            if timeout_s is not None:
+                now = time.monotonic()
+                for fut in list(pending):
+                    t0 = started.get(futures[fut])
+                    if t0 is not None and not fut.done() and now - t0 >= timeout_s:
+                        pending.discard(fut)
+                        not_done.add(fut)
+                deadlines = [started[futures[f]] + timeout_s for f in pending if futures[f] in started]
+                # Only queued groups left: poll until a worker picks one up.
+                wait_s = max(0.0, min(deadlines) - now) if deadlines else 0.05
+            finished, _ = wait(pending, timeout=wait_s, return_when=FIRST_COMPLETED)
+            pending -= finished
+            for fut in finished:
+                late = timeout_s is not None and elapsed.get(futures[fut], 0.0) > timeout_s
+                (not_done if late else done).add(fut)
+    finally:
+        # Do not wait for stragglers (their socket timeout bounds them).
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    heap: List[Tuple[float, int, int, Dict[str, Any]]] = []
+    seq = 0
+    order = {gid: i for i, gid in enumerate(gids)}
+    for fut in done:
+        gid = futures[fut]
+        try:
+            res = fut.result()
+        except Exception as e:
+            groups[gid] = {"status": "error", "error": str(e)}
+            continue
+        hits = res.get("hits") if isinstance(res.get("hits"), list) else []
+        groups[gid] = {"status": "ok", "count": len(hits), "took_ms": res.get("took_ms")}
+        for hit in hits:
+            if not isinstance(hit, dict):
+                continue
+            seq += 1
+            # Ties break towards the caller's group order, then the daemon's hit order.
+            item = (float(hit.get("score") or 0.0), -order[gid], -seq, {**hit, "group_id": gid})
+            if len(heap) < k:
+                heapq.heappush(heap, item)
+            elif item[:3] > heap[0][:3]:
+                heapq.heapreplace(heap, item)
+    for fut in not_done:
+        groups[futures[fut]] = {"status": "timeout"}
+
+    merged = [item[3] for item in sorted(heap, key=lambda x: x[:3], reverse=True)]
+    return {"hits": merged, "count": len(merged), "groups": {gid: groups[gid] for gid in gids}}
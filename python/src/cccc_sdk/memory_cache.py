@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import copy
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from .cache import SearchCacheStats, TTLCache
+
+
+def search_cache_key(group_id: str, args: Dict[str, Any]) -> Tuple[Hashable, ...]:
+    """Normalize `memory_reme_search` args into a cache key.
+
+    Whitespace in the query is collapsed, `sources` is order-insensitive and
+    numeric knobs are compared as floats, so trivially different spellings of
+    the same search share one entry.
+    """
+    query = " ".join(str(args.get("query") or "").split())
+    sources = tuple(sorted({str(x) for x in (args.get("sources") or ["memory"])}))
+    knobs = tuple(
+        (k, float(args[k]))
+        for k in ("max_results", "min_score", "vector_weight", "candidate_multiplier")
+        if args.get(k) is not None
+    )
+    return (str(group_id), query, sources, knobs)
+
+
+def _took_ms(res: Dict[str, Any]) -> float:
+    try:
+        return float(res.get("took_ms") or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+class MemorySearchCache:
+    """LRU cache for `memory_reme_search` results, per group.
+
+    The client drops a group's entries after `memory_reme_write`,
+    `memory_reme_index_sync` or `memory_reme_daily_flush` made through it; the
+    TTL bounds staleness from writers outside this process. A search in
+    flight across an invalidation is returned but not cached, and callers get
+    deep copies so mutating hits never leaks into the cache.
+    """
+
+    def __init__(self, *, max_entries: int = 256, ttl_s: Optional[float] = 60.0) -> None:
+        self._cache: TTLCache[Dict[str, Any]] = TTLCache(ttl_s=ttl_s, max_entries=int(max_entries))
+        self._lock = threading.Lock()
+        self._daemon_took_ms = 0.0
+        self._saved_took_ms = 0.0
+        self._epoch = 0
+        self._generation: Dict[str, int] = {}
+
+    def get(self, group_id: str, args: Dict[str, Any], loader: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        key = search_cache_key(group_id, args)
+        found, res = self._cache.get(key)
+        if found and res is not None:
+            with self._lock:
+                self._saved_took_ms += _took_ms(res)
+            return copy.deepcopy(res)
+        gid = str(group_id)
+        with self._lock:
+            version = self._version(gid)
+        res = loader()
+        with self._lock:
+            self._daemon_took_ms += _took_ms(res)
+            if self._version(gid) == version:
+                self._cache.put(key, copy.deepcopy(res))
+        return res
+
+    def invalidate(self, group_id: Optional[str] = None) -> None:
+        with self._lock:
+            if group_id is None:
+                self._epoch += 1
+            else:
+                self._generation[str(group_id)] = self._generation.get(str(group_id), 0) + 1
+        if group_id is None:
+            self._cache.clear()
+        else:
+            gid = str(group_id)
+            self._cache.invalidate_where(lambda k: k[0] == gid)
+
+    def _version(self, gid: str) -> Tuple[int, int]:
+        # Bumped by invalidate(); a load only caches if this did not change meanwhile.
+        return (self._epoch, self._generation.get(gid, 0))
+
+    def stats(self) -> SearchCacheStats:
+        base = self._cache.stats()
+        with self._lock:
+            return SearchCacheStats(
+                hits=base.hits,
+                misses=base.misses,
+                invalidations=base.invalidations,
+                evictions=base.evictions,
+                daemon_took_ms=self._daemon_took_ms,
+                saved_took_ms=self._saved_took_ms,
+            )
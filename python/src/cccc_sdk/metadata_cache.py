@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import copy
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from .cache import CacheStats, TTLCache
+
+METADATA_OPS = ("groups", "group_show", "actor_list")
+DEFAULT_METADATA_TTLS: Dict[str, float] = {"groups": 5.0, "group_show": 10.0, "actor_list": 5.0}
+
+
+class MetadataCache:
+    """Read-through cache for `groups`, `group_show` and `actor_list` with per-op TTLs.
+
+    Keys are `("groups",)` or `(op, group_id)`. The client invalidates a group
+    (plus the `groups` summary, which carries running/state) after its own
+    `group_*` / `actor_*` mutations; `observe()` does the same for `group.*`
+    and `actor.*` events from `events_stream`. A load that overlaps an
+    invalidation of its key is returned but not cached. Callers always get
+    their own deep copy.
+    """
+
+    def __init__(self, *, ttls: Optional[Dict[str, float]] = None, max_entries: int = 1024) -> None:
+        self._ttls = {**DEFAULT_METADATA_TTLS, **{str(k): float(v) for k, v in (ttls or {}).items()}}
+        self._cache: TTLCache[Dict[str, Any]] = TTLCache(max_entries=int(max_entries))
+        self._lock = threading.Lock()
+        self._hits: Dict[str, int] = {op: 0 for op in METADATA_OPS}
+        self._misses: Dict[str, int] = {op: 0 for op in METADATA_OPS}
+        self._epoch = 0
+        self._summary_generation = 0  # bumped by every invalidation, since each one drops `groups`
+        self._generation: Dict[str, int] = {}
+
+    def ttl(self, op: str) -> float:
+        return self._ttls.get(str(op), 0.0)
+
+    def get(self, op: str, group_id: str, loader: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        key: Tuple[Hashable, ...] = (op,) if op == "groups" else (op, str(group_id))
+        found, res = self._cache.get(key)
+        with self._lock:
+            if found:
+                self._hits[op] = self._hits.get(op, 0) + 1
+            else:
+                self._misses[op] = self._misses.get(op, 0) + 1
+            version = self._version(key)
+        if found and res is not None:
+            return copy.deepcopy(res)
+        res = loader()
+        if self.ttl(op) > 0:
+            with self._lock:
+                if self._version(key) == version:
+                    self._cache.put(key, copy.deepcopy(res), ttl_s=self.ttl(op))
+        return res
+
+    def invalidate(self, group_id: Optional[str] = None) -> None:
+        """Drop one group's entries and the `groups` summary (or everything when no group is given)."""
+        with self._lock:
+            if group_id is None:
+                self._epoch += 1
+            else:
+                self._summary_generation += 1
+                self._generation[str(group_id)] = self._generation.get(str(group_id), 0) + 1
+        if group_id is None:
+            self._cache.clear()
+            return
+        gid = str(group_id)
+        self._cache.invalidate_where(lambda k: k[0] == "groups" or (len(k) > 1 and k[1] == gid))
+
+    def _version(self, key: Tuple[Hashable, ...]) -> Tuple[int, int]:
+        # Bumped by invalidate(); a load only caches if this did not change meanwhile.
+        if len(key) == 1:
+            return (self._epoch, self._summary_generation)
+        return (self._epoch, self._generation.get(str(key[1]), 0))
+
+    def observe(self, item: Dict[str, Any]) -> None:
+        """Invalidate on `group.*` / `actor.*` events (accepts a raw event or an events_stream item)."""
+        event = item.get("event") if isinstance(item.get("event"), dict) else item
+        kind = str(event.get("kind") or "")
+        if kind.startswith("group.") or kind.startswith("actor."):
+            self.invalidate(str(event.get("group_id") or "") or None)
+
+    def stats(self) -> CacheStats:
+        return self._cache.stats()
+
+    def op_stats(self) -> Dict[str, CacheStats]:
+        """Hit/miss counts per op."""
+        with self._lock:
+            return {op: CacheStats(hits=self._hits.get(op, 0), misses=self._misses.get(op, 0)) for op in self._hits}
@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import uuid
+from collections import deque
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Deque, Dict, List, Optional
+
+from .errors import DaemonAPIError, DaemonUnavailableError
+
+if TYPE_CHECKING:
+    from .client import CCCCClient
+
+
+_OUTBOX_OPS = ("send", "reply")
+# `call_daemon` only wraps connect/decode failures; a daemon restart mid-request
+# surfaces as a raw socket error (`socket.timeout` and resets are OSErrors).
+_UNAVAILABLE = (DaemonUnavailableError, OSError)
+
+
+def new_client_id() -> str:
+    """Generate a client-side idempotency marker (CCCS `chat.message.data.client_id`)."""
+    return f"sdk_{uuid.uuid4().hex}"
+
+
+class Outbox:
+    """Durable local outbox for `send` / `reply` while the daemon is unavailable.
+
+    Every queued message is appended to a JSONL journal (default:
+    `${CCCC_HOME}/sdk/outbox.jsonl`) with a client-generated `client_id`. The
+    journal is replayed in order once the daemon is reachable again; each
+    delivered entry is marked `done` in the journal. A send that landed right
+    before a crash is replayed with the same `client_id`, which the daemon
+    deduplicates on a best-effort basis within its client_id window (a few
+    minutes); replaying a journal after a longer outage can post the same
+    message twice.
+
+    Ordering: once anything is pending, new messages are queued behind it
+    instead of being sent directly.
+    """
+
+    def __init__(
+        self,
+        client: "CCCCClient",
+        *,
+        path: Optional[str] = None,
+        batch_size: int = 50,
+        retry_interval_s: float = 1.0,
+        fsync: bool = False,
+    ) -> None:
+        self._client = client
+        self._path = Path(path).expanduser() if path else client.home / "sdk" / "outbox.jsonl"
+        self._batch_size = max(1, int(batch_size))
+        self._retry_interval_s = max(0.01, float(retry_interval_s))
+        self._fsync = bool(fsync)
+
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending: Deque[Dict[str, Any]] = deque()
+        self._failed: List[Dict[str, Any]] = []
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._load()
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def failed(self) -> List[Dict[str, Any]]:
+        """Entries the daemon rejected permanently (ok=false) during replay."""
+        with self._lock:
+            return list(self._failed)
+
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    # ------------------------------------------------------------------
+    # Producer API
+    # ------------------------------------------------------------------
+
+    def send(self, **kwargs: Any) -> Dict[str, Any]:
+        """Like `CCCCClient.send`, but queues locally when the daemon is down."""
+        return self._submit("send", kwargs)
+
+    def reply(self, **kwargs: Any) -> Dict[str, Any]:
+        """Like `CCCCClient.reply`, but queues locally when the daemon is down."""
+        return self._submit("reply", kwargs)
+
+    def _submit(self, op: str, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        entry = {"t": "msg", "op": op, "id": str(kwargs.pop("client_id", "") or new_client_id()), "kwargs": kwargs}
+        with self._lock:
+            direct = not self._pending
+        if direct:
+            try:
+                return self._deliver(entry)
+            except _UNAVAILABLE:
+                pass
+        with self._lock:
+            self._append(entry)
+            self._pending.append(entry)
+            n = len(self._pending)
+        self._wake.set()
+        return {"queued": True, "client_id": entry["id"], "pending": n}
+
+    # ------------------------------------------------------------------
+    # Replay
+    # ------------------------------------------------------------------
+
+    def flush(self, *, max_batches: Optional[int] = None) -> int:
+        """Replay pending entries in order (in batches); return how many were delivered.
+
+        Stops at the first transport failure (`DaemonUnavailableError` or a raw
+        socket error) and keeps the rest queued.
+        """
+        delivered = 0
+        batches = 0
+        with self._flush_lock:
+            while max_batches is None or batches < int(max_batches):
+                with self._lock:
+                    batch = list(self._pending)[: self._batch_size]
+                if not batch:
+                    break
+                batches += 1
+                done: List[str] = []
+                failed: List[Dict[str, Any]] = []
+                unavailable = False
+                try:
+                    for entry in batch:
+                        try:
+                            self._deliver(entry)
+                            done.append(entry["id"])
+                        except _UNAVAILABLE:
+                            unavailable = True
+                            break
+                        except DaemonAPIError as e:
+                            failed.append({**entry, "error": {"code": e.code, "message": e.message}})
+                            done.append(entry["id"])
+                finally:
+                    # Commit what was delivered even if an unexpected error escapes.
+                    with self._lock:
+                        for _ in done:
+                            self._pending.popleft()
+                        self._failed.extend(failed)
+                        for cid in done:
+                            self._append({"t": "done", "id": cid})
+                        if not self._pending:
+                            self._truncate()
+                delivered += len(done) - len(failed)
+                if unavailable:
+                    break
+        return delivered
+
+    def start(self) -> "Outbox":
+        """Replay in the background whenever entries are pending."""
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="cccc-outbox", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, *, timeout_s: Optional[float] = None) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout_s)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait(self._retry_interval_s)
+            self._wake.clear()
+            if self._stop.is_set():
+                break
+            if self.pending():
+                try:
+                    self.flush()
+                except Exception:
+                    # Never let the background replayer die; retry next tick.
+                    pass
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _deliver(self, entry: Dict[str, Any]) -> Dict[str, Any]:
+        fn = getattr(self._client, str(entry["op"]))
+        return fn(**dict(entry["kwargs"]), client_id=str(entry["id"]))
+
+    def _load(self) -> None:
+        try:
+            raw = self._path.read_text(encoding="utf-8", errors="replace")
+        except FileNotFoundError:
+            return
+        entries: Dict[str, Dict[str, Any]] = {}
+        for line in raw.splitlines():
+            try:
+                rec = json.loads(line)
+            except Exception:
+                continue  # torn trailing write
+            if not isinstance(rec, dict):
+                continue
+            cid = str(rec.get("id") or "")
+            if rec.get("t") == "msg" and rec.get("op") in _OUTBOX_OPS and isinstance(rec.get("kwargs"), dict):
+                entries.setdefault(cid, rec)
+            elif rec.get("t") == "done":
+                entries.pop(cid, None)
+        self._pending.extend(entries.values())
+        if not self._pending:
+            self._truncate()
+
+    def _append(self, rec: Dict[str, Any]) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        with self._path.open("a", encoding="utf-8") as f:
+            f.write(json.dumps(rec, ensure_ascii=False) + "\n")
+            if self._fsync:
+                f.flush()
+                os.fsync(f.fileno())
+
+    def _truncate(self) -> None:
+        try:
+            if self._path.exists():
+                self._path.write_text("", encoding="utf-8")
+        except OSError:
+            pass
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import json
+import re
+from typing import Any, Callable, Dict, Iterable, Optional, Union
+
+# A projection tree: key -> True (keep the whole value) or a nested tree.
+ProjectionTree = Dict[str, Union[bool, "ProjectionTree"]]
+
+_WS = re.compile(r"[ \t\r\n]*")
+# Unrolled-loop patterns keep the regex engine in C for long runs of text.
+_STRING = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+_STRING_BODY = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*', re.DOTALL)
+_FILLER = re.compile(r'[^\[\]{}"]*(?:"[^"\\]*(?:\\.[^"\\]*)*"[^\[\]{}"]*)*', re.DOTALL)
+_SCALAR = re.compile(r"[^,\]}\s]*")
+
+
+class ProjectionError(ValueError):
+    """Raised when the input is not valid JSON for projection purposes."""
+
+
+def parse_paths(paths: Iterable[str]) -> ProjectionTree:
+    """Build a projection tree from dotted paths such as `result.coordination.brief`."""
+    tree: ProjectionTree = {}
+    for raw in paths:
+        parts = [p for p in str(raw or "").strip().split(".") if p]
+        if not parts:
+            continue
+        node = tree
+        for i, part in enumerate(parts):
+            last = i == len(parts) - 1
+            cur = node.get(part)
+            if cur is True:
+                break  # an ancestor is already kept whole
+            if last:
+                node[part] = True
+            else:
+                if not isinstance(cur, dict):
+                    cur = {}
+                    node[part] = cur
+                node = cur
+    return tree
+
+
+class _Scanner:
+    """Incremental text buffer over a chunk reader; consumed text is discarded."""
+
+    def __init__(self, read: Callable[[], str]) -> None:
+        self._read = read
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+        self._mark: Optional[int] = None
+
+    def fill(self) -> bool:
+        if self.eof:
+            return False
+        chunk = self._read()
+        if not chunk:
+            self.eof = True
+            return False
+        keep = self.pos if self._mark is None else min(self.pos, self._mark)
+        if keep > 0:
+            # Drop everything before the oldest position we may still need.
+            self.buf = self.buf[keep:]
+            self.pos -= keep
+            if self._mark is not None:
+                self._mark -= keep
+        self.buf += chunk
+        return True
+
+    def peek(self) -> str:
+        while True:
+            m = _WS.match(self.buf, self.pos)
+            self.pos = m.end() if m else self.pos
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.fill():
+                raise ProjectionError("unexpected end of input")
+
+    def expect(self, ch: str) -> None:
+        if self.peek() != ch:
+            raise ProjectionError(f"expected {ch!r} at offset {self.pos}")
+        self.pos += 1
+
+    def _match_complete(self, pattern: "re.Pattern[str]") -> "re.Match[str]":
+        while True:
+            m = pattern.match(self.buf, self.pos)
+            if m is not None and (m.end() < len(self.buf) or self.eof):
+                return m
+            if not self.fill():
+                m = pattern.match(self.buf, self.pos)
+                if m is None:
+                    raise ProjectionError(f"invalid token at offset {self.pos}")
+                return m
+
+    def read_string(self) -> str:
+        self.peek()
+        m = self._match_complete(_STRING)
+        self.pos = m.end()
+        return json.loads(m.group(0))
+
+    def skip_value(self) -> None:
+        ch = self.peek()
+        if ch == '"':
+            self.pos += 1
+            self._skip_string_body()
+            return
+        if ch not in "[{":
+            self.pos = self._match_complete(_SCALAR).end()
+            return
+        depth = 0
+        while True:
+            # Jump over everything that is not a bracket (including whole strings).
+            self.pos = _FILLER.match(self.buf, self.pos).end()
+            if self.pos >= len(self.buf):
+                if not self.fill():
+                    raise ProjectionError("unexpected end of input")
+                continue
+            if self.buf[self.pos] == '"':
+                # A string that runs past the buffer: finish it incrementally.
+                self.pos += 1
+                self._skip_string_body()
+                continue
+            c = self.buf[self.pos]
+            self.pos += 1
+            depth += 1 if c in "[{" else -1
+            if depth == 0:
+                return
+
+    def _skip_string_body(self) -> None:
+        # `pos` is just after the opening quote; resume across chunk refills
+        # without rescanning what was already consumed.
+        while True:
+            self.pos = _STRING_BODY.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf) and self.buf[self.pos] == '"':
+                self.pos += 1
+                return
+            if not self.fill():
+                raise ProjectionError("unterminated string")
+
+    def read_value(self) -> Any:
+        self.peek()
+        self._mark = self.pos
+        try:
+            self.skip_value()
+            text = self.buf[self._mark : self.pos]
+        finally:
+            self._mark = None
+        try:
+            return json.loads(text)
+        except ValueError as e:
+            raise ProjectionError(str(e)) from e
+
+
+def _project_object(sc: _Scanner, tree: ProjectionTree) -> Dict[str, Any]:
+    out: Dict[str, Any] = {}
+    sc.expect("{")
+    if sc.peek() == "}":
+        sc.pos += 1
+        return out
+    while True:
+        key = sc.read_string()
+        sc.expect(":")
+        want = tree.get(key)
+        if want is True:
+            out[key] = sc.read_value()
+        elif isinstance(want, dict) and sc.peek() == "{":
+            out[key] = _project_object(sc, want)
+        else:
+            sc.skip_value()
+        ch = sc.peek()
+        sc.pos += 1
+        if ch == "}":
+            return out
+        if ch != ",":
+            raise ProjectionError(f"expected ',' or '}}' at offset {sc.pos - 1}")
+
+
+def project_json(read: Callable[[], str], paths: Union[ProjectionTree, Iterable[str]]) -> Dict[str, Any]:
+    """Parse one JSON object from `read()` chunks, keeping only `paths`.
+
+    Unrequested subtrees are skipped with a structural scan and never
+    materialized; consumed input is dropped from the buffer as parsing
+    advances, so memory is bounded by the largest kept value plus one chunk.
+    """
+    tree = paths if isinstance(paths, dict) else parse_paths(paths)
+    return _project_object(_Scanner(read), tree)
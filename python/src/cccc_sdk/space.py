@@ -0,0 +1,548 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, InvalidStateError, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+    from .client import CCCCClient
+
+
+JOB_TERMINAL_STATES = ("succeeded", "failed", "canceled")
+
+_Lane = Tuple[str, str]  # (group_id, lane)
+
+
+def _job_id(job: Dict[str, Any]) -> str:
+    return str(job.get("job_id") or job.get("id") or "")
+
+
+def _job_state(job: Dict[str, Any]) -> str:
+    return str(job.get("state") or job.get("status") or "")
+
+
+class SpaceJobWaiter:
+    """Wait for many Group Space jobs with one `group_space_jobs` list per (group, lane).
+
+    `watch()` returns a `concurrent.futures.Future` that resolves with the job
+    record once it reaches a terminal state (`succeeded` / `failed` /
+    `canceled`); an optional callback runs at the same time. Each (group, lane)
+    is polled on its own schedule: the interval resets to `min_interval_s`
+    whenever a watched job changes state or a new job is watched, and backs
+    off by `backoff` up to `max_interval_s` while nothing moves. Polling load
+    therefore scales with the number of lanes, not the number of jobs.
+
+    Drive it with `start()` / `stop()` (background thread) or by calling
+    `poll_once()` / `wait()` from your own loop; cancelling a future stops
+    watching that job. A job missing from the list window stays pending; raise
+    `list_limit` if many jobs are in flight per lane.
+    """
+
+    def __init__(
+        self,
+        client: "CCCCClient",
+        *,
+        provider: str = "notebooklm",
+        min_interval_s: float = 0.5,
+        max_interval_s: float = 10.0,
+        backoff: float = 1.6,
+        list_limit: int = 200,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._client = client
+        self._provider = str(provider)
+        self._min_interval_s = max(0.0, float(min_interval_s))
+        self._max_interval_s = max(self._min_interval_s, float(max_interval_s))
+        self._backoff = max(1.0, float(backoff))
+        self._list_limit = max(1, int(list_limit))
+        self._clock = clock
+        self._lock = threading.Lock()
+        # (group, lane) -> job_id -> (future, last seen state)
+        self._watched: Dict[_Lane, Dict[str, Tuple["Future[Dict[str, Any]]", str]]] = {}
+        self._interval: Dict[_Lane, float] = {}
+        self._next_at: Dict[_Lane, float] = {}
+        self._polls = 0
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def polls(self) -> int:
+        """Number of `group_space_jobs` list calls made so far."""
+        return self._polls
+
+    def pending(self) -> int:
+        with self._lock:
+            return sum(len(jobs) for jobs in self._watched.values())
+
+    def watch(
+        self,
+        *,
+        group_id: str,
+        lane: str,
+        job_id: str,
+        callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> "Future[Dict[str, Any]]":
+        key = (str(group_id), str(lane))
+        jid = str(job_id)
+        with self._lock:
+            jobs = self._watched.setdefault(key, {})
+            if jid in jobs:
+                fut = jobs[jid][0]
+            else:
+                fut = Future()
+                jobs[jid] = (fut, "")
+            self._interval[key] = self._min_interval_s
+            self._next_at[key] = self._clock()
+        if callback is not None:
+
+            def _done(f: "Future[Dict[str, Any]]") -> None:
+                if not f.cancelled() and f.exception() is None:
+                    callback(f.result())
+
+            fut.add_done_callback(_done)
+        self._wake.set()
+        return fut
+
+    def poll_once(self) -> Optional[float]:
+        """Poll every lane that is due; return seconds until the next lane is due (None if idle)."""
+        now = self._clock()
+        with self._lock:
+            due = [k for k, jobs in self._watched.items() if jobs and self._next_at.get(k, now) <= now]
+        for key in due:
+            self._poll_lane(key)
+        with self._lock:
+            times = [self._next_at[k] for k, jobs in self._watched.items() if jobs]
+        if not times:
+            return None
+        return max(0.0, min(times) - self._clock())
+
+    def wait(self, futures: List["Future[Dict[str, Any]]"], *, timeout_s: Optional[float] = None) -> bool:
+        """Drive polling in the calling thread until `futures` are all done (or timeout)."""
+        deadline = None if timeout_s is None else self._clock() + float(timeout_s)
+        while not all(f.done() for f in futures):
+            delay = self.poll_once()
+            if all(f.done() for f in futures):
+                break
+            if deadline is not None:
+                remaining = deadline - self._clock()
+                if remaining <= 0:
+                    return False
+                delay = remaining if delay is None else min(delay, remaining)
+            time.sleep(self._min_interval_s if delay is None else delay)
+        return True
+
+    def start(self) -> "SpaceJobWaiter":
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="cccc-space-jobs", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, *, timeout_s: Optional[float] = None) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout_s)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                delay = self.poll_once()
+            except Exception:
+                delay = self._max_interval_s
+            self._wake.wait(self._max_interval_s if delay is None else delay)
+            self._wake.clear()
+
+    def _poll_lane(self, key: _Lane) -> None:
+        group_id, lane = key
+        self._polls += 1
+        try:
+            res = self._client.group_space_jobs(
+                group_id=group_id, lane=lane, action="list", limit=self._list_limit, provider=self._provider
+            )
+        except Exception:
+            with self._lock:
+                self._reschedule(key, changed=False)
+            return
+        jobs = res.get("jobs") if isinstance(res.get("jobs"), list) else []
+        by_id = {_job_id(j): j for j in jobs if isinstance(j, dict)}
+        finished: List[Tuple["Future[Dict[str, Any]]", Dict[str, Any]]] = []
+        changed = False
+        with self._lock:
+            watched = self._watched.get(key, {})
+            for jid, (fut, last_state) in list(watched.items()):
+                if fut.cancelled():
+                    del watched[jid]  # the caller stopped waiting
+                    continue
+                job = by_id.get(jid)
+                if job is None:
+                    continue
+                state = _job_state(job)
+                if state != last_state:
+                    changed = True
+                    watched[jid] = (fut, state)
+                if state in JOB_TERMINAL_STATES:
+                    del watched[jid]
+                    finished.append((fut, job))
+            self._reschedule(key, changed=changed)
+        for fut, job in finished:
+            try:
+                fut.set_result(dict(job))
+            except InvalidStateError:
+                pass  # cancelled meanwhile
+
+    def _reschedule(self, key: _Lane, *, changed: bool) -> None:
+        cur = self._interval.get(key, self._min_interval_s)
+        nxt = self._min_interval_s if changed else min(self._max_interval_s, max(cur, 0.05) * self._backoff)
+        self._interval[key] = nxt
+        self._next_at[key] = self._clock() + nxt
+
+
+# ---------------------------------------------------------------------------
+# Bulk ingest
+# ---------------------------------------------------------------------------
+
+
+def ingest_key(payload: Dict[str, Any], *, kind: str = "resource_ingest") -> str:
+    """Content-derived idempotency key for a `group_space_ingest` payload."""
+    canon = json.dumps({"kind": str(kind), "payload": payload}, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return "sdk_" + hashlib.sha256(canon.encode("utf-8")).hexdigest()[:40]
+
+
+@dataclass
+class BulkIngestReport:
+    accepted: int = 0  # new jobs created by this run
+    deduped: int = 0  # daemon recognized the idempotency key
+    skipped: int = 0  # already accepted in a previous run (resume journal)
+    failed: List[Tuple[str, str]] = field(default_factory=list)  # (idempotency_key, error)
+    job_ids: List[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed
+
+
+def bulk_ingest(
+    client: "CCCCClient",
+    *,
+    group_id: str,
+    payloads: Iterable[Dict[str, Any]],
+    kind: str = "resource_ingest",
+    lane: str = "work",
+    max_workers: int = 4,
+    journal_path: Optional[str] = None,
+    provider: str = "notebooklm",
+    by: str = "user",
+    on_progress: Optional[Callable[[BulkIngestReport], None]] = None,
+) -> BulkIngestReport:
+    """Ingest many payloads with content-hash idempotency keys and bounded concurrency.
+
+    Every accepted item is appended to a JSONL resume journal (default:
+    `${CCCC_HOME}/sdk/space_ingest/<group_id>.jsonl`), so a rerun over the
+    same corpus skips what was already accepted and only sends new or failed
+    items. Duplicate payloads within one run are sent once. Failures are
+    collected in the report rather than aborting the batch.
+    """
+    gid = str(group_id)
+    path = Path(journal_path).expanduser() if journal_path else client.home / "sdk" / "space_ingest" / f"{gid}.jsonl"
+    done = _load_ingest_journal(path)
+    report = BulkIngestReport()
+    lock = threading.Lock()
+
+    def run(key: str, payload: Dict[str, Any]) -> None:
+        try:
+            res = client.group_space_ingest(
+                group_id=gid,
+                lane=str(lane),
+                payload=payload,
+                kind=str(kind),
+                idempotency_key=key,
+                provider=str(provider),
+                by=str(by),
+            )
+        except Exception as e:
+            with lock:
+                report.failed.append((key, str(e)))
+            return
+        job_id = str(res.get("job_id") or "")
+        rec = {"key": key, "job_id": job_id, "deduped": bool(res.get("deduped"))}
+        with lock:
+            with path.open("a", encoding="utf-8") as f:
+                f.write(json.dumps(rec, ensure_ascii=False) + "\n")
+            if rec["deduped"]:
+                report.deduped += 1
+            else:
+                report.accepted += 1
+            if job_id:
+                report.job_ids.append(job_id)
+            if on_progress is not None:
+                on_progress(report)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    workers = max(1, int(max_workers))
+    seen: Set[str] = set()
+    inflight: Set["Future[None]"] = set()
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="cccc-ingest") as pool:
+        for payload in payloads:
+            key = ingest_key(payload, kind=kind)
+            if key in done or key in seen:
+                report.skipped += 1
+                continue
+            seen.add(key)
+            if len(inflight) >= workers * 2:
+                # Keep the queue bounded so huge corpora are streamed, not materialized.
+                _, inflight = wait(inflight, return_when=FIRST_COMPLETED)
+            inflight.add(pool.submit(run, key, dict(payload)))
+    return report
+
+
+def _load_ingest_journal(path: Path) -> Set[str]:
+    try:
+        raw = path.read_text(encoding="utf-8", errors="replace")
+    except FileNotFoundError:
+        return set()
+    keys: Set[str] = set()
+    for line in raw.splitlines():
+        try:
+            rec = json.loads(line)
+        except Exception:
+            continue  # torn trailing write
+        if isinstance(rec, dict) and rec.get("key"):
+            keys.add(str(rec["key"]))
+    return keys
+
+
+# ---------------------------------------------------------------------------
+# Source manifest sync
+# ---------------------------------------------------------------------------
+
+
+def _result_source_id(res: Dict[str, Any]) -> str:
+    """Best-effort `source_id` from an ingest result (top level, `ingest_result` or the job record)."""
+    job = res.get("job") if isinstance(res.get("job"), dict) else {}
+    candidates = [res, res.get("ingest_result"), job, job.get("result")]
+    for doc in candidates:
+        if not isinstance(doc, dict):
+            continue
+        ids = doc.get("source_ids") if isinstance(doc.get("source_ids"), list) else []
+        sid = str(doc.get("source_id") or (ids[0] if ids else "") or "")
+        if sid:
+            return sid
+    return ""
+
+
+def _default_source_payload(rel_path: str, content: str) -> Dict[str, Any]:
+    return {"source_type": "text", "title": rel_path, "content": content}
+
+
+@dataclass
+class SourceSyncReport:
+    added: List[str] = field(default_factory=list)
+    updated: List[str] = field(default_factory=list)
+    deleted: List[str] = field(default_factory=list)
+    unchanged: int = 0
+    failed: List[Tuple[str, str]] = field(default_factory=list)  # (rel_path, error)
+    dry_run: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed
+
+
+class SpaceManifest:
+    """Local record of what was ingested into one (group, lane): path -> hash, title, source_id.
+
+    Stored as JSON (default: `${CCCC_HOME}/sdk/space_manifest/<group_id>.<lane>.json`)
+    and written atomically.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.generation = 0  # bumped per recorded ingest; part of the idempotency key
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            data = {}
+        if isinstance(data, dict) and isinstance(data.get("sources"), dict):
+            self.entries = {str(k): dict(v) for k, v in data["sources"].items() if isinstance(v, dict)}
+        if isinstance(data, dict):
+            try:
+                self.generation = int(data.get("generation") or 0)
+            except (TypeError, ValueError):
+                self.generation = 0
+
+    @classmethod
+    def for_lane(cls, client: "CCCCClient", *, group_id: str, lane: str) -> "SpaceManifest":
+        return cls(client.home / "sdk" / "space_manifest" / f"{group_id}.{lane}.json")
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        doc = {"v": 1, "generation": self.generation, "sources": self.entries}
+        tmp.write_text(json.dumps(doc, ensure_ascii=False, indent=1), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+
+def sync_space_sources(
+    client: "CCCCClient",
+    *,
+    group_id: str,
+    root: str,
+    lane: str = "work",
+    patterns: Iterable[str] = ("**/*.md",),
+    manifest_path: Optional[str] = None,
+    build_payload: Callable[[str, str], Dict[str, Any]] = _default_source_payload,
+    check_remote: bool = False,
+    dry_run: bool = False,
+    provider: str = "notebooklm",
+    by: str = "user",
+) -> SourceSyncReport:
+    """Bring a lane's sources in step with local files, touching only what changed.
+
+    Files under `root` matching `patterns` are hashed and diffed against the
+    local manifest: new files are ingested, changed files are re-ingested and
+    their previous remote source is deleted, and files that disappeared have
+    their remote source deleted. Unchanged files cost nothing. With
+    `check_remote`, one `group_space_sources` list drops manifest entries whose
+    source no longer exists remotely so they are re-added.
+
+    `build_payload(rel_path, content)` produces the `resource_ingest` payload;
+    check `group_space_capabilities` for the source types your provider accepts.
+
+    Ingest may run asynchronously and return no `source_id`; such entries are
+    resolved by title from one `group_space_sources` list (now, or on a later
+    run), and the source they replace is deleted only once the new one is
+    known. Idempotency keys include a manifest generation counter, so a
+    revert (A -> B -> A) re-ingests instead of deduping to a deleted source.
+    """
+    gid, ln = str(group_id), str(lane)
+    if manifest_path:
+        manifest = SpaceManifest(Path(manifest_path).expanduser())
+    else:
+        manifest = SpaceManifest.for_lane(client, group_id=gid, lane=ln)
+    report = SourceSyncReport(dry_run=bool(dry_run))
+
+    if check_remote and manifest.entries:
+        listed = client.group_space_sources(group_id=gid, lane=ln, action="list", provider=provider, by=by)
+        sources = [s for s in listed.get("sources") or [] if isinstance(s, dict)]
+        remote = {str(s.get("source_id") or s.get("id") or "") for s in sources}
+        for rel in [r for r, e in manifest.entries.items() if e.get("source_id") and e["source_id"] not in remote]:
+            del manifest.entries[rel]
+
+    base = Path(root).expanduser()
+    local: Dict[str, Tuple[str, Path]] = {}
+    for pattern in patterns:
+        for p in base.glob(pattern):
+            if p.is_file():
+                rel = p.relative_to(base).as_posix()
+                if rel not in local:
+                    local[rel] = (hashlib.sha256(p.read_bytes()).hexdigest(), p)
+
+    def delete_remote(source_id: str) -> None:
+        if source_id:
+            client.group_space_sources(
+                group_id=gid, lane=ln, action="delete", source_id=source_id, provider=provider, by=by
+            )
+
+    def resolve_pending() -> None:
+        # One list resolves every entry whose ingest did not report a source_id.
+        unresolved = [e for e in manifest.entries.values() if not e.get("source_id")]
+        if dry_run or not unresolved:
+            return
+        listed = client.group_space_sources(group_id=gid, lane=ln, action="list", provider=provider, by=by)
+        known = {str(e.get("source_id")) for e in manifest.entries.values() if e.get("source_id")}
+        for e in manifest.entries.values():
+            known.update(str(x) for x in e.get("replaces") or [])
+        by_title: Dict[str, List[str]] = {}
+        for src in listed.get("sources") or []:
+            if not isinstance(src, dict):
+                continue
+            sid = str(src.get("source_id") or src.get("id") or "")
+            if sid and sid not in known:
+                by_title.setdefault(str(src.get("title") or src.get("name") or ""), []).append(sid)
+        for e in unresolved:
+            matches = by_title.get(str(e.get("title") or ""))
+            if matches:
+                e["source_id"] = matches.pop()  # newest listed last
+
+    def retire_replaced(entry: Dict[str, Any]) -> None:
+        if not entry.get("source_id"):
+            return
+        for old in list(entry.get("replaces") or []):
+            if old != entry["source_id"]:
+                delete_remote(old)
+            entry["replaces"].remove(old)
+        entry.pop("replaces", None)
+
+    try:
+        for rel in sorted(local):
+            digest, p = local[rel]
+            prev = manifest.entries.get(rel)
+            if prev is not None and prev.get("hash") == digest:
+                report.unchanged += 1
+                continue
+            (report.added if prev is None else report.updated).append(rel)
+            if dry_run:
+                continue
+            try:
+                payload = build_payload(rel, p.read_text(encoding="utf-8", errors="replace"))
+                generation = manifest.generation + 1
+                res = client.group_space_ingest(
+                    group_id=gid,
+                    lane=ln,
+                    payload=payload,
+                    kind="resource_ingest",
+                    idempotency_key=ingest_key({"payload": payload, "path": rel, "generation": generation}),
+                    provider=provider,
+                    by=by,
+                )
+                manifest.generation = generation
+                replaces = list((prev or {}).get("replaces") or [])
+                if prev is not None and prev.get("source_id"):
+                    replaces.append(str(prev["source_id"]))
+                entry: Dict[str, Any] = {
+                    "hash": digest,
+                    "title": str(payload.get("title") or rel),
+                    "source_id": _result_source_id(res),
+                    "job_id": str(res.get("job_id") or ""),
+                }
+                if replaces:
+                    entry["replaces"] = replaces
+                manifest.entries[rel] = entry
+                retire_replaced(entry)
+            except Exception as e:
+                report.failed.append((rel, str(e)))
+
+        try:
+            resolve_pending()
+            for entry in manifest.entries.values():
+                retire_replaced(entry)
+        except Exception as e:
+            report.failed.append(("", f"source_id resolution failed: {e}"))
+
+        for rel in sorted(set(manifest.entries) - set(local)):
+            report.deleted.append(rel)
+            if dry_run:
+                continue
+            entry = manifest.entries[rel]
+            if not entry.get("source_id"):
+                report.failed.append((rel, "remote source_id not resolved yet; will retry on the next sync"))
+                continue
+            try:
+                for old in entry.get("replaces") or []:
+                    delete_remote(str(old))
+                delete_remote(str(entry["source_id"]))
+                del manifest.entries[rel]
+            except Exception as e:
+                report.failed.append((rel, str(e)))
+    finally:
+        if not dry_run:
+            manifest.save()
+    return report
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import copy
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from .cache import SpaceQueryCacheStats, TTLCache
+
+
+def query_cache_key(group_id: str, args: Dict[str, Any]) -> Tuple[Hashable, ...]:
+    """Normalize `group_space_query` args into a cache key.
+
+    Whitespace in the query is collapsed and `options.source_ids` is treated
+    as a set; the key starts with `(group_id, lane)` for invalidation.
+    """
+    options = args.get("options") if isinstance(args.get("options"), dict) else {}
+    source_ids = tuple(sorted({str(x) for x in (options.get("source_ids") or [])}))
+    query = " ".join(str(args.get("query") or "").split())
+    return (str(group_id), str(args.get("lane") or ""), str(args.get("provider") or ""), query, source_ids)
+
+
+class SpaceQueryCache:
+    """Singleflight + TTL cache for `group_space_query`, per (group, lane).
+
+    Identical queries that arrive while one is in flight wait for that call
+    instead of issuing their own. Answers with `degraded=true` are returned
+    but never cached. The client drops a lane's entries after its own
+    `group_space_ingest` / `group_space_sync` calls, and the work lane after
+    `context_sync`; an invalidation that lands while a query is in flight
+    keeps that (possibly stale) answer out of the cache.
+
+    Callers always get their own deep copy of an answer. A waiter gives up on
+    the in-flight call after `wait_timeout_s` and queries the daemon itself.
+    """
+
+    def __init__(
+        self, *, max_entries: int = 256, ttl_s: Optional[float] = 60.0, wait_timeout_s: Optional[float] = 60.0
+    ) -> None:
+        self._wait_timeout_s = None if wait_timeout_s is None else max(0.0, float(wait_timeout_s))
+        self._cache: TTLCache[Dict[str, Any]] = TTLCache(ttl_s=ttl_s, max_entries=int(max_entries))
+        self._lock = threading.Lock()
+        self._inflight: Dict[Hashable, "Future[Dict[str, Any]]"] = {}
+        self._epoch = 0
+        self._generation: Dict[Tuple[str, str], int] = {}
+        self._coalesced = 0
+        self._degraded = 0
+
+    def get(self, group_id: str, args: Dict[str, Any], loader: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        key = query_cache_key(group_id, args)
+        gid, lane = str(key[0]), str(key[1])
+        found, res = self._cache.get(key)
+        if found and res is not None:
+            return copy.deepcopy(res)
+        with self._lock:
+            waiting = self._inflight.get(key)
+            if waiting is None:
+                fut: "Future[Dict[str, Any]]" = Future()
+                self._inflight[key] = fut
+                version = self._version(gid, lane)
+            else:
+                self._coalesced += 1
+        if waiting is not None:
+            try:
+                return copy.deepcopy(waiting.result(timeout=self._wait_timeout_s))
+            except FutureTimeoutError:
+                return loader()  # the leader looks hung; don't wait on it any longer
+        try:
+            res = loader()
+        except BaseException as e:
+            with self._lock:
+                self._inflight.pop(key, None)
+            fut.set_exception(e)
+            raise
+        with self._lock:
+            self._inflight.pop(key, None)
+            if bool(res.get("degraded")):
+                self._degraded += 1
+            elif self._version(gid, lane) == version:
+                self._cache.put(key, copy.deepcopy(res))
+        fut.set_result(copy.deepcopy(res))
+        return res
+
+    def invalidate(self, group_id: Optional[str] = None, lane: Optional[str] = None) -> None:
+        """Drop cached answers for a lane, a whole group, or everything (no args)."""
+        with self._lock:
+            if group_id is None:
+                self._epoch += 1
+            else:
+                gid = str(group_id)
+                scope = (gid, str(lane)) if lane else (gid, "")
+                self._generation[scope] = self._generation.get(scope, 0) + 1
+        if group_id is None:
+            self._cache.clear()
+        elif lane:
+            self._cache.invalidate_where(lambda k: k[0] == gid and k[1] == str(lane))
+        else:
+            self._cache.invalidate_where(lambda k: k[0] == gid)
+
+    def _version(self, gid: str, lane: str) -> Tuple[int, int, int]:
+        # Bumped by invalidate(); a load only caches if this did not change meanwhile.
+        return (self._epoch, self._generation.get((gid, ""), 0), self._generation.get((gid, lane), 0))
+
+    def stats(self) -> SpaceQueryCacheStats:
+        base = self._cache.stats()
+        with self._lock:
+            return SpaceQueryCacheStats(
+                hits=base.hits,
+                misses=base.misses,
+                invalidations=base.invalidations,
+                evictions=base.evictions,
+                coalesced=self._coalesced,
+                degraded_uncached=self._degraded,
+            )
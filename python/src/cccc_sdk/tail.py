@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .client import CCCCClient
+
+
+TailKey = Tuple[str, str, str]  # ("terminal", group_id, actor_id) | ("logs", component, group_id)
+TailCallback = Callable[[TailKey, List[str], bool], None]
+
+_ANCHOR_LINES = 3
+
+
+def diff_tail(previous: List[str], current: List[str]) -> Tuple[List[str], bool]:
+    """Return `(new_lines, gap)` for two successive tails of the same stream.
+
+    The longest suffix of `previous` that is a prefix of `current` is taken as
+    the overlap (the window slid forward). Failing that, the last few lines of
+    `previous` are searched for anywhere in `current` (the head of the window
+    was rewritten). If neither matches, all of `current` is new and `gap` is
+    True: output outran the window between polls, or the log was cleared.
+    Runs of identical lines are inherently ambiguous; the longest overlap wins.
+    """
+    if not previous:
+        return list(current), False
+    if not current:
+        return [], False
+    n = len(previous)
+    last = previous[-1]
+    for i in range(min(len(current), n) - 1, -1, -1):
+        if current[i] == last and current[: i + 1] == previous[n - i - 1 :]:
+            return current[i + 1 :], False
+    anchor = previous[-min(_ANCHOR_LINES, n) :]
+    k = len(anchor)
+    for i in range(len(current) - k, -1, -1):
+        if current[i : i + k] == anchor:
+            return current[i + k :], False
+    return list(current), True
+
+
+@dataclass
+class _Source:
+    callback: TailCallback
+    limit: int  # terminal: max_chars; logs: lines
+    strip_ansi: bool = True
+    lines: Optional[List[str]] = None  # None until the baseline fetch
+    interval: float = 0.0
+    next_at: float = 0.0
+
+
+class TailFollower:
+    """Follow many `terminal_tail` / `debug_tail_logs` streams on one poll scheduler.
+
+    Each source keeps its previous tail and `diff_tail` reduces every poll to
+    the lines that are actually new, delivered as `callback(key, lines, gap)`.
+    The first poll only records a baseline unless `initial=True`. Polling
+    adapts per source: any new output resets the interval to `min_interval_s`,
+    quiet polls back off by `backoff` up to `max_interval_s`, so idle actors
+    cost a daemon call every few seconds instead of every second.
+
+    Terminal text is compared on complete lines: an unterminated last line
+    (e.g. a prompt being typed) is held back until it ends, and the first
+    line is dropped when the window is full because it may be cut mid-line.
+
+    A callback that raises does not affect the other sources: the error is
+    counted in `callback_errors` and the source keeps its previous tail, so
+    the same lines are offered again on its next poll.
+
+    Drive it with `start()` / `stop()` (background thread) or by calling
+    `poll_once()` from your own loop.
+    """
+
+    def __init__(
+        self,
+        client: "CCCCClient",
+        *,
+        min_interval_s: float = 0.5,
+        max_interval_s: float = 10.0,
+        backoff: float = 1.6,
+        by: str = "user",
+        initial: bool = False,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._client = client
+        self._min_interval_s = max(0.0, float(min_interval_s))
+        self._max_interval_s = max(self._min_interval_s, float(max_interval_s))
+        self._backoff = max(1.0, float(backoff))
+        self._by = str(by)
+        self._initial = bool(initial)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._sources: Dict[TailKey, _Source] = {}
+        self._polls = 0
+        self._lines_emitted = 0
+        self._callback_errors = 0
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def polls(self) -> int:
+        """Number of tail calls made so far."""
+        return self._polls
+
+    @property
+    def lines_emitted(self) -> int:
+        return self._lines_emitted
+
+    @property
+    def callback_errors(self) -> int:
+        return self._callback_errors
+
+    def follow_terminal(
+        self,
+        *,
+        group_id: str,
+        actor_id: str,
+        callback: TailCallback,
+        max_chars: int = 8000,
+        strip_ansi: bool = True,
+    ) -> TailKey:
+        key = ("terminal", str(group_id), str(actor_id))
+        self._add(key, _Source(callback, max(1, int(max_chars)), bool(strip_ansi)))
+        return key
+
+    def follow_logs(self, *, component: str, callback: TailCallback, group_id: str = "", lines: int = 200) -> TailKey:
+        key = ("logs", str(component), str(group_id))
+        self._add(key, _Source(callback, max(1, int(lines))))
+        return key
+
+    def unfollow(self, key: TailKey) -> None:
+        with self._lock:
+            self._sources.pop(key, None)
+
+    def following(self) -> List[TailKey]:
+        with self._lock:
+            return list(self._sources)
+
+    def poll_once(self) -> Optional[float]:
+        """Poll every source that is due; return seconds until the next one is due (None if idle)."""
+        now = self._clock()
+        with self._lock:
+            due = [k for k, src in self._sources.items() if src.next_at <= now]
+        for key in due:
+            self._poll_source(key)
+        with self._lock:
+            times = [src.next_at for src in self._sources.values()]
+        if not times:
+            return None
+        return max(0.0, min(times) - self._clock())
+
+    def start(self) -> "TailFollower":
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="cccc-tail", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, *, timeout_s: Optional[float] = None) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout_s)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                delay = self.poll_once()
+            except Exception:
+                delay = self._max_interval_s
+            self._wake.wait(self._max_interval_s if delay is None else delay)
+            self._wake.clear()
+
+    def _add(self, key: TailKey, src: _Source) -> None:
+        src.interval = self._min_interval_s
+        src.next_at = self._clock()
+        with self._lock:
+            self._sources[key] = src
+        self._wake.set()
+
+    def _fetch(self, key: TailKey, src: _Source) -> List[str]:
+        kind, a, b = key
+        if kind == "logs":
+            res = self._client.debug_tail_logs(component=a, group_id=b, by=self._by, lines=src.limit)
+            return [str(line) for line in res.get("lines") or []]
+        res = self._client.terminal_tail(
+            group_id=a, actor_id=b, by=self._by, max_chars=src.limit, strip_ansi=src.strip_ansi
+        )
+        text = str(res.get("text") or "")
+        lines = text.split("\n")
+        lines.pop()  # "" after a trailing newline, otherwise the unterminated line
+        if len(text) >= src.limit and lines:
+            lines.pop(0)
+        return [line.rstrip("\r") for line in lines]
+
+    def _poll_source(self, key: TailKey) -> None:
+        with self._lock:
+            src = self._sources.get(key)
+        if src is None:
+            return
+        self._polls += 1
+        try:
+            current = self._fetch(key, src)
+        except Exception:
+            with self._lock:
+                self._reschedule(src, changed=False)
+            return
+        if src.lines is None:
+            new, gap = (current, False) if self._initial else ([], False)
+        else:
+            new, gap = diff_tail(src.lines, current)
+        if new:
+            try:
+                src.callback(key, new, gap)
+            except Exception:
+                # Keep the old tail so these lines are delivered again next poll.
+                with self._lock:
+                    self._callback_errors += 1
+                    self._reschedule(src, changed=True)
+                return
+            self._lines_emitted += len(new)
+        with self._lock:
+            src.lines = current
+            self._reschedule(src, changed=bool(new))
+
+    def _reschedule(self, src: _Source, *, changed: bool) -> None:
+        nxt = self._min_interval_s if changed else min(self._max_interval_s, max(src.interval, 0.05) * self._backoff)
+        src.interval = nxt
+        src.next_at = self._clock() + nxt
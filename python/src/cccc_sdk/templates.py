@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+from .errors import DaemonAPIError
+
+if TYPE_CHECKING:
+    from .client import CCCCClient
+
+
+def template_hash(template: str) -> str:
+    return hashlib.sha256(str(template).encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class ProvisionTarget:
+    path: str
+    title: str = ""
+    topic: str = ""
+
+
+@dataclass(frozen=True)
+class ProvisionOutcome:
+    target: ProvisionTarget
+    ok: bool
+    group_id: str = ""
+    result: Dict[str, Any] = field(default_factory=dict)
+    error_code: str = ""
+    error: str = ""
+
+
+@dataclass
+class ProvisionReport:
+    template_hash: str
+    outcomes: List[ProvisionOutcome] = field(default_factory=list)
+
+    @property
+    def succeeded(self) -> List[ProvisionOutcome]:
+        return [o for o in self.outcomes if o.ok]
+
+    @property
+    def failed(self) -> List[ProvisionOutcome]:
+        return [o for o in self.outcomes if not o.ok]
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed
+
+    @property
+    def group_ids(self) -> List[str]:
+        return [o.group_id for o in self.outcomes if o.ok and o.group_id]
+
+
+class TemplateProvisioner:
+    """Create many groups from one template with bounded parallelism.
+
+    The template text is resolved once (given directly, or exported from a
+    source group) and shared by every `group_create_from_template` request.
+    Exports are cached per source group and previews per (template hash,
+    group), for the lifetime of the provisioner; pass `fresh=True` or call
+    `clear()` after changing the source groups outside this object.
+    """
+
+    def __init__(self, client: "CCCCClient", *, max_workers: int = 4, by: str = "user") -> None:
+        self._client = client
+        self._max_workers = max(1, int(max_workers))
+        self._by = str(by)
+        self._lock = threading.Lock()
+        self._exports: Dict[str, Dict[str, Any]] = {}
+        self._previews: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
+    def export(self, group_id: str, *, fresh: bool = False) -> Dict[str, Any]:
+        """`group_template_export` result, plus `template_hash`."""
+        gid = str(group_id)
+        with self._lock:
+            cached = self._exports.get(gid)
+        if cached is not None and not fresh:
+            return cached
+        res = dict(self._client.group_template_export(group_id=gid))
+        res["template_hash"] = template_hash(str(res.get("template") or ""))
+        with self._lock:
+            self._exports[gid] = res
+        return res
+
+    def preview(self, group_id: str, template: str, *, fresh: bool = False) -> Dict[str, Any]:
+        key = (template_hash(template), str(group_id))
+        with self._lock:
+            cached = self._previews.get(key)
+        if cached is not None and not fresh:
+            return cached
+        res = self._client.group_template_preview(group_id=str(group_id), template=str(template), by=self._by)
+        with self._lock:
+            self._previews[key] = res
+        return res
+
+    def clear(self) -> None:
+        with self._lock:
+            self._exports.clear()
+            self._previews.clear()
+
+    def provision(
+        self,
+        targets: List[ProvisionTarget],
+        *,
+        template: str = "",
+        source_group_id: str = "",
+        on_progress: Optional[Callable[[ProvisionOutcome, int, int], None]] = None,
+    ) -> ProvisionReport:
+        """Create one group per target from `template` (or the export of `source_group_id`).
+
+        Outcomes are collected in completion order; failures are reported,
+        never raised.
+        """
+        if not template:
+            if not source_group_id:
+                raise ValueError("provision requires a template or a source_group_id")
+            template = str(self.export(source_group_id).get("template") or "")
+            if not template:
+                raise ValueError(f"group {source_group_id!r} exported an empty template")
+        report = ProvisionReport(template_hash=template_hash(template))
+        if not targets:
+            return report
+
+        def run_one(target: ProvisionTarget) -> ProvisionOutcome:
+            try:
+                res = self._client.group_create_from_template(
+                    path=target.path, template=template, title=target.title, topic=target.topic, by=self._by
+                )
+                return ProvisionOutcome(target, True, str(res.get("group_id") or ""), res)
+            except DaemonAPIError as e:
+                return ProvisionOutcome(target, False, error_code=e.code, error=e.message)
+            except Exception as e:
+                return ProvisionOutcome(target, False, error_code="error", error=str(e))
+
+        workers = min(self._max_workers, len(targets))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="cccc-provision") as pool:
+            for fut in as_completed([pool.submit(run_one, t) for t in targets]):
+                outcome = fut.result()
+                report.outcomes.append(outcome)
+                if on_progress is not None:
+                    on_progress(outcome, len(report.outcomes), len(targets))
+        return report
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import socket
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional, Union
+
+if TYPE_CHECKING:
+    from .client import CCCCClient
+
+
+class Scrollback:
+    """Fixed-capacity byte ring buffer keeping the most recent terminal output."""
+
+    def __init__(self, capacity: int) -> None:
+        if int(capacity) <= 0:
+            raise ValueError("scrollback capacity must be positive")
+        self._cap = int(capacity)
+        self._buf = bytearray(self._cap)
+        self._end = 0  # next write position
+        self._size = 0
+        self._lock = threading.Lock()
+        self.total_bytes = 0  # bytes ever written, including overwritten ones
+
+    def __len__(self) -> int:
+        return self._size
+
+    def write(self, data: Union[bytes, bytearray, memoryview]) -> None:
+        view = memoryview(data).cast("B")
+        n = len(view)
+        with self._lock:
+            self.total_bytes += n
+            if n >= self._cap:
+                view, n = view[n - self._cap :], self._cap
+            first = min(n, self._cap - self._end)
+            self._buf[self._end : self._end + first] = view[:first]
+            if n > first:
+                self._buf[: n - first] = view[first:]
+            self._end = (self._end + n) % self._cap
+            self._size = min(self._cap, self._size + n)
+
+    def getvalue(self) -> bytes:
+        with self._lock:
+            if self._size < self._cap:
+                return bytes(self._buf[: self._size])
+            return bytes(self._buf[self._end :]) + bytes(self._buf[: self._end])
+
+    def clear(self) -> None:
+        with self._lock:
+            self._end = 0
+            self._size = 0
+
+
+class TermSession:
+    """A raw PTY stream opened with `term_attach` (spec §4.4).
+
+    Output is read with `recv_into` into one reusable buffer. `pump()` does a
+    single read and returns a memoryview over that buffer (valid until the
+    next read), which lets many sessions be multiplexed from one selector
+    loop via `fileno()`; `chunks()` is the simple blocking iterator. When
+    `scrollback_bytes` is set, all output is also kept in a `Scrollback`
+    ring. `resize()` goes over a separate daemon connection, as required.
+    Create sessions with `CCCCClient.term_attach`.
+    """
+
+    def __init__(
+        self,
+        client: "CCCCClient",
+        sock: socket.socket,
+        handshake: Dict[str, Any],
+        *,
+        group_id: str,
+        actor_id: str,
+        initial: bytes = b"",
+        chunk_bytes: int = 65536,
+        scrollback_bytes: int = 0,
+    ) -> None:
+        self._client = client
+        self._sock = sock
+        self.handshake = handshake
+        self.group_id = str(group_id)
+        self.actor_id = str(actor_id)
+        self._buf = bytearray(max(1024, int(chunk_bytes)))
+        self._view = memoryview(self._buf)
+        self._pending = initial
+        self._write_lock = threading.Lock()
+        self.scrollback: Optional[Scrollback] = Scrollback(scrollback_bytes) if int(scrollback_bytes) > 0 else None
+        self.closed = False
+        self.bytes_read = len(initial)
+        if initial and self.scrollback is not None:
+            self.scrollback.write(initial)
+
+    def __enter__(self) -> "TermSession":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def fileno(self) -> int:
+        return self._sock.fileno()
+
+    def pump(self) -> Optional[memoryview]:
+        """Read once; return the new bytes (possibly empty on timeout), or None at EOF."""
+        if self._pending:
+            data, self._pending = self._pending, b""
+            return memoryview(data)
+        if self.closed:
+            return None
+        try:
+            n = self._sock.recv_into(self._buf)
+        except socket.timeout:
+            return self._view[:0]
+        except OSError:
+            if self.closed:
+                return None
+            raise
+        if n == 0:
+            self.close()
+            return None
+        chunk = self._view[:n]
+        self.bytes_read += n
+        if self.scrollback is not None:
+            self.scrollback.write(chunk)
+        return chunk
+
+    def chunks(self, *, copy: bool = True) -> Iterator[Union[bytes, memoryview]]:
+        """Yield output chunks until the stream ends.
+
+        With `copy=False` the chunks are memoryviews over the shared read
+        buffer and must be consumed before the next iteration.
+        """
+        while True:
+            chunk = self.pump()
+            if chunk is None:
+                return
+            if len(chunk):
+                yield bytes(chunk) if copy else chunk
+
+    def write(self, data: Union[bytes, str]) -> None:
+        """Send raw input to the PTY (the daemon may treat extra attachers as read-only)."""
+        raw = data.encode("utf-8") if isinstance(data, str) else bytes(data)
+        with self._write_lock:
+            self._sock.sendall(raw)
+
+    def resize(self, *, cols: int, rows: int) -> Dict[str, Any]:
+        return self._client.term_resize(group_id=self.group_id, actor_id=self.actor_id, cols=cols, rows=rows)
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        try:
+            self._sock.shutdown(socket.SHUT_RDWR)
+        except Exception:
+            pass
+        try:
+            self._sock.close()
+        except Exception:
+            pass
+
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import json
+import socket
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple, Union
+
+from .cache import CacheStats, TTLCache
+from .errors import DaemonAPIError
+
+if TYPE_CHECKING:
+    from .client import CCCCClient
+
+
+@dataclass(frozen=True)
+class ToolCall:
+    tool_name: str
+    arguments: Dict[str, Any] = field(default_factory=dict)
+    timeout_s: Optional[float] = None  # per-call deadline (defaults to the executor's)
+    pure: bool = False  # same arguments -> same result; safe to memoize
+
+
+@dataclass(frozen=True)
+class ToolCallResult:
+    tool_name: str
+    ok: bool
+    result: Dict[str, Any] = field(default_factory=dict)  # the `capability_tool_call` result
+    error_code: str = ""  # daemon error code, or "timeout" / "error"
+    error: str = ""
+    cached: bool = False
+    elapsed_s: float = 0.0
+
+    @property
+    def timed_out(self) -> bool:
+        return self.error_code == "timeout"
+
+
+def tool_memo_key(group_id: str, actor_id: str, tool_name: str, arguments: Dict[str, Any]) -> Tuple[Hashable, ...]:
+    canon = json.dumps(arguments, ensure_ascii=False, sort_keys=True, separators=(",", ":"), default=str)
+    return (str(group_id), str(actor_id), str(tool_name), canon)
+
+
+class ToolExecutor:
+    """Run a turn's `capability_tool_call`s concurrently with per-call deadlines.
+
+    Each call's deadline (`timeout_s`, default `default_timeout_s`) is measured
+    from the start of `run()`, including time spent queued behind other calls
+    when the batch exceeds `max_workers`; a call that finishes after its own
+    deadline is reported as `error_code="timeout"` even if it succeeded.
+    `run()` returns once every call finished or the latest deadline passed.
+
+    The same value is the call's socket timeout, which applies per socket
+    operation (connect, send, each receive), so a slow daemon can hold a
+    worker for longer than the deadline. Abandoned calls that are still queued
+    are cancelled; ones already running cannot be interrupted and keep
+    occupying a pool worker until their socket operations return. Results of tools marked
+    pure (per call, or by name via `pure_tools`) are memoized by
+    (tool_name, canonical arguments), and identical pure calls within one
+    batch are sent once.
+    """
+
+    def __init__(
+        self,
+        client: "CCCCClient",
+        *,
+        group_id: str,
+        actor_id: str = "",
+        by: str = "user",
+        max_workers: int = 8,
+        default_timeout_s: float = 30.0,
+        pure_tools: Iterable[str] = (),
+        memo_size: int = 512,
+        memo_ttl_s: Optional[float] = None,
+    ) -> None:
+        self._client = client
+        self._group_id = str(group_id)
+        self._actor_id = str(actor_id)
+        self._by = str(by)
+        self._default_timeout_s = float(default_timeout_s)
+        self._pure_tools = {str(t) for t in pure_tools}
+        self._memo: TTLCache[Dict[str, Any]] = TTLCache(ttl_s=memo_ttl_s, max_entries=int(memo_size))
+        self._pool = ThreadPoolExecutor(max_workers=max(1, int(max_workers)), thread_name_prefix="cccc-tools")
+
+    def memo_stats(self) -> CacheStats:
+        return self._memo.stats()
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def __enter__(self) -> "ToolExecutor":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def call(self, tool_name: str, arguments: Optional[Dict[str, Any]] = None, **kwargs: Any) -> ToolCallResult:
+        return self.run([ToolCall(str(tool_name), dict(arguments or {}), **kwargs)])[0]
+
+    def run(self, calls: Sequence[Union[ToolCall, Dict[str, Any]]]) -> List[ToolCallResult]:
+        """Execute `calls` concurrently; results come back in input order."""
+        specs = [c if isinstance(c, ToolCall) else ToolCall(**c) for c in calls]
+        results: List[Optional[ToolCallResult]] = [None] * len(specs)
+        pending: Dict["Future[Dict[str, Any]]", List[int]] = {}
+        by_key: Dict[Tuple[Hashable, ...], "Future[Dict[str, Any]]"] = {}
+        started = time.monotonic()
+        deadline = started
+        timeouts: List[float] = []
+        finished_at: Dict["Future[Dict[str, Any]]", float] = {}
+        for i, spec in enumerate(specs):
+            timeout = self._default_timeout_s if spec.timeout_s is None else float(spec.timeout_s)
+            timeouts.append(timeout)
+            deadline = max(deadline, started + timeout)
+            pure = spec.pure or spec.tool_name in self._pure_tools
+            key = tool_memo_key(self._group_id, self._actor_id, spec.tool_name, spec.arguments) if pure else None
+            if key is not None:
+                found, value = self._memo.get(key)
+                if found and value is not None:
+                    results[i] = ToolCallResult(spec.tool_name, True, dict(value), cached=True)
+                    continue
+                if key in by_key:
+                    pending[by_key[key]].append(i)
+                    continue
+            fut = self._pool.submit(self._invoke, spec, timeout, key)
+            fut.add_done_callback(lambda f: finished_at.setdefault(f, time.monotonic()))
+            pending[fut] = [i]
+            if key is not None:
+                by_key[key] = fut
+
+        done, not_done = wait(pending, timeout=max(0.0, deadline - time.monotonic()) + 0.05)
+        for fut in not_done:
+            fut.cancel()  # queued calls never start; running ones keep their worker until the socket returns
+        now = time.monotonic()
+        for fut, indexes in pending.items():
+            end = finished_at.get(fut, now) if fut in done else now
+            elapsed = end - started
+            for i in indexes:
+                # Each call is judged against its own deadline, not the batch's latest one.
+                in_time = fut in done and elapsed <= timeouts[i]
+                results[i] = self._outcome(specs[i].tool_name, fut if in_time else None, elapsed)
+        return [r for r in results if r is not None]
+
+    def _invoke(self, spec: ToolCall, timeout_s: float, key: Optional[Tuple[Hashable, ...]]) -> Dict[str, Any]:
+        res = self._client.capability_tool_call(
+            group_id=self._group_id,
+            tool_name=spec.tool_name,
+            arguments=dict(spec.arguments),
+            actor_id=self._actor_id,
+            by=self._by,
+            timeout_s=timeout_s,
+        )
+        if key is not None:
+            self._memo.put(key, res)
+        return res
+
+    @staticmethod
+    def _outcome(tool_name: str, fut: Optional["Future[Dict[str, Any]]"], elapsed: float) -> ToolCallResult:
+        if fut is None:
+            return ToolCallResult(tool_name, False, error_code="timeout", error="deadline exceeded", elapsed_s=elapsed)
+        try:
+            return ToolCallResult(tool_name, True, fut.result(), elapsed_s=elapsed)
+        except DaemonAPIError as e:
+            return ToolCallResult(tool_name, False, error_code=e.code, error=e.message, elapsed_s=elapsed)
+        except (socket.timeout, TimeoutError) as e:
+            return ToolCallResult(tool_name, False, error_code="timeout", error=str(e) or "timed out", elapsed_s=elapsed)
+        except Exception as e:
+            return ToolCallResult(tool_name, False, error_code="error", error=str(e), elapsed_s=elapsed)
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
+import codecs
 import json
 import os
 import socket
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, Iterable, Optional, Tuple
 
 from .errors import DaemonUnavailableError
+from .projection import ProjectionError, parse_paths, project_json
 
 
 MAX_DAEMON_LINE_BYTES = 4_000_000  # 4MB safety limit (match CCCC)
@@ -115,6 +117,50 @@ def call_daemon(
             pass
 
 
+def call_daemon_projected(
+    *,
+    endpoint: DaemonEndpoint,
+    request: Dict[str, Any],
+    timeout_s: float,
+    paths: Iterable[str],
+    chunk_bytes: int = 65536,
+) -> Dict[str, Any]:
+    """Like `call_daemon`, but parse the response incrementally and keep only `paths`.
+
+    Paths are dotted and rooted at the response envelope (e.g.
+    `result.tasks_summary`); `v`, `ok` and `error` are always kept.
+    """
+    tree = parse_paths(list(paths) + ["v", "ok", "error"])
+    try:
+        s = _connect(endpoint, timeout_s=timeout_s)
+    except Exception as e:
+        raise DaemonUnavailableError(str(e)) from e
+
+    try:
+        payload = (json.dumps(request, ensure_ascii=False) + "\n").encode("utf-8")
+        s.sendall(payload)
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        total = 0
+
+        def read() -> str:
+            nonlocal total
+            if total >= MAX_DAEMON_LINE_BYTES:
+                return decoder.decode(b"", final=True)
+            data = s.recv(min(int(chunk_bytes), MAX_DAEMON_LINE_BYTES - total))
+            total += len(data)
+            return decoder.decode(data, final=not data)
+
+        try:
+            return project_json(read, tree)
+        except ProjectionError as e:
+            raise DaemonUnavailableError(f"invalid daemon response (not json): {e}") from e
+    finally:
+        try:
+            s.close()
+        except Exception:
+            pass
+
+
 def open_events_stream(
     *,
     endpoint: DaemonEndpoint,
@@ -135,3 +181,48 @@ def open_events_stream(
     f = s.makefile("rb")
     return s, f
 
+
+def open_term_attach(
+    *,
+    endpoint: DaemonEndpoint,
+    request: Dict[str, Any],
+    timeout_s: float,
+    chunk_bytes: int = 65536,
+) -> Tuple[socket.socket, Dict[str, Any], bytes]:
+    """Send a `term_attach` request and read the handshake line.
+
+    Returns (socket, handshake response, leftover bytes). PTY output can
+    arrive in the same segment as the handshake, so whatever follows the
+    first newline is returned rather than dropped. The caller owns the
+    socket (also on an `ok=false` response).
+    """
+    try:
+        s = _connect(endpoint, timeout_s=timeout_s)
+    except Exception as e:
+        raise DaemonUnavailableError(str(e)) from e
+
+    try:
+        payload = (json.dumps(request, ensure_ascii=False) + "\n").encode("utf-8")
+        s.sendall(payload)
+        buf = bytearray()
+        while b"\n" not in buf:
+            if len(buf) >= MAX_DAEMON_LINE_BYTES:
+                raise DaemonUnavailableError("invalid daemon response (handshake line too long)")
+            data = s.recv(int(chunk_bytes))
+            if not data:
+                raise DaemonUnavailableError("daemon closed the connection during term_attach handshake")
+            buf += data
+        line, _, rest = bytes(buf).partition(b"\n")
+        try:
+            resp = json.loads(line.decode("utf-8", errors="replace"))
+        except Exception as e:
+            raise DaemonUnavailableError(f"invalid daemon response (not json): {e}") from e
+        if not isinstance(resp, dict):
+            raise DaemonUnavailableError("invalid daemon response (not an object)")
+        return s, resp, rest
+    except BaseException:
+        try:
+            s.close()
+        except Exception:
+            pass
+        raise
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import unittest
+from unittest.mock import patch
+
+from cccc_sdk.automation import diff_automation, reconcile_automation
+from cccc_sdk.client import CCCCClient
+from cccc_sdk.transport import DaemonEndpoint
+
+CURRENT = {
+    "rules": [
+        {"id": "standup", "enabled": True, "trigger": {"kind": "interval", "every_seconds": 3600}, "action": {"kind": "notify"}},
+        {"id": "nightly", "enabled": True, "trigger": {"kind": "cron", "cron": "0 2 * * *"}, "action": {"kind": "notify"}},
+        {"id": "legacy", "enabled": False, "trigger": {"kind": "interval"}, "action": {"kind": "notify"}},
+    ],
+    "snippets": {"hello": "hi"},
+}
+
+
+class TestAutomation(unittest.TestCase):
+    def test_diff_is_minimal(self) -> None:
+        desired = {
+            "rules": [
+                {"id": "standup", "enabled": False},
+                {"id": "nightly", "trigger": {"kind": "cron", "cron": "0 3 * * *"}},
+                {"id": "weekly", "enabled": True, "trigger": {"kind": "cron", "cron": "0 9 * * 1"}},
+            ]
+        }
+        actions = diff_automation(CURRENT, desired, prune=True)
+        self.assertEqual([a["type"] for a in actions], ["set_rule_enabled", "update_rule", "create_rule", "delete_rule"])
+        self.assertEqual(actions[1]["rule"]["action"], {"kind": "notify"})  # unspecified fields kept
+        self.assertEqual(actions[3]["rule_id"], "legacy")
+        self.assertEqual(diff_automation(CURRENT, {"rules": [{"id": "standup", "enabled": True}]}), [])
+
+        snip = diff_automation(CURRENT, {"rules": [{"id": "standup", "enabled": False}], "snippets": {"bye": "cya"}})
+        self.assertEqual(len(snip), 1)
+        self.assertEqual(snip[0]["type"], "replace_all_rules")
+        self.assertEqual(snip[0]["ruleset"]["snippets"], {"hello": "hi", "bye": "cya"})
+        self.assertFalse(snip[0]["ruleset"]["rules"][0]["enabled"])
+
+    def test_reconcile_one_batch_per_group(self) -> None:
+        captured: list[dict] = []
+
+        def fake_call_daemon(*, endpoint, request, timeout_s):  # type: ignore[no-untyped-def]
+            captured.append(request)
+            gid = request["args"]["group_id"]
+            if request["op"] == "group_automation_state":
+                if gid == "g_bad":
+                    return {"ok": False, "error": {"code": "group_not_found", "message": "missing"}}
+                return {"ok": True, "result": {"group_id": gid, "ruleset": CURRENT, "version": 7}}
+            return {"ok": True, "result": {"version": 8, "changed": True}}
+
+        client = CCCCClient(endpoint=DaemonEndpoint(transport="tcp", host="127.0.0.1", port=9000))
+        desired = {
+            "g_1": {"rules": [{"id": "standup", "enabled": False}, {"id": "nightly", "enabled": False}]},
+            "g_2": {"rules": [{"id": "standup", "enabled": True}]},
+            "g_bad": {"rules": []},
+        }
+        with patch("cccc_sdk.client.call_daemon", side_effect=fake_call_daemon):
+            plan = reconcile_automation(client, desired, dry_run=True)
+            self.assertEqual([r["op"] for r in captured].count("group_automation_manage"), 0)
+            report = reconcile_automation(client, desired)
+
+        self.assertEqual([len(g.actions) for g in plan.groups], [2, 0, 0])
+        manages = [r for r in captured if r["op"] == "group_automation_manage"]
+        self.assertEqual(len(manages), 1)
+        self.assertEqual(manages[0]["args"]["expected_version"], 7)
+        self.assertEqual(len(manages[0]["args"]["actions"]), 2)
+        self.assertEqual([g.group_id for g in report.changed], ["g_1"])
+        self.assertEqual(report.groups[0].version, 8)
+        self.assertEqual([(g.group_id, g.error_code) for g in report.failed], [("g_bad", "group_not_found")])
+
+
+if __name__ == "__main__":
+    unittest.main()
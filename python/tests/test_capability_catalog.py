@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import unittest
+from unittest.mock import patch
+
+from cccc_sdk.client import CCCCClient
+from cccc_sdk.errors import DaemonUnavailableError
+from cccc_sdk.transport import DaemonEndpoint
+
+
+def _item(cid: str, name: str, **extra):  # type: ignore[no-untyped-def]
+    kind = "skill" if cid.startswith("skill:") else "mcp_toolpack"
+    return {"capability_id": cid, "name": name, "kind": kind, "source_id": "builtin", "trust_tier": "trusted", **extra}
+
+
+class TestCapabilityCatalog(unittest.TestCase):
+    def test_prefix_search_facets_and_incremental_refresh(self) -> None:
+        catalog = [
+            _item("mcp:github", "GitHub Tools", tool_names=["create_issue"]),
+            _item("mcp:gitlab", "GitLab", trust_tier="community"),
+            _item("skill:writing", "Technical Writing", tags=["docs"]),
+        ]
+        captured: list[dict] = []
+
+        def fake_call_daemon(*, endpoint, request, timeout_s):  # type: ignore[no-untyped-def]
+            captured.append(request)
+            op, args = request["op"], request["args"]
+            if op == "capability_overview":
+                q = args.get("query", "")
+                items = [it for it in catalog if not q or it["capability_id"] == q]
+                return {"ok": True, "result": {"items": items, "count": len(items), "allowlist_revision": "r1"}}
+            if op == "capability_import":
+                catalog.append(_item(args["record"]["capability_id"], args["record"]["name"]))
+                return {"ok": True, "result": {"capability_id": args["record"]["capability_id"], "imported": True}}
+            return {"ok": True, "result": {"updated": True}}
+
+        client = CCCCClient(endpoint=DaemonEndpoint(transport="tcp", host="127.0.0.1", port=9000), capability_catalog=True)
+        cat = client.capability_catalog
+        assert cat is not None
+        with patch("cccc_sdk.client.call_daemon", side_effect=fake_call_daemon):
+            self.assertEqual([it["capability_id"] for it in cat.search("gi")], ["mcp:github", "mcp:gitlab"])
+            self.assertEqual([it["capability_id"] for it in cat.search("git", trust_tier="community")], ["mcp:gitlab"])
+            self.assertEqual([it["capability_id"] for it in cat.search("create iss")], ["mcp:github"])
+            self.assertEqual([it["capability_id"] for it in cat.search("", kind="skill")], ["skill:writing"])
+            self.assertEqual(cat.search("docs")[0]["name"], "Technical Writing")
+            self.assertEqual(cat.loads, 1)
+            self.assertEqual(captured[0]["args"], {"limit": 2000, "include_indexed": True})
+
+            client.capability_import(group_id="g_1", record={"capability_id": "mcp:gitea", "kind": "mcp_toolpack", "name": "Gitea"})
+            self.assertEqual(len(cat.search("git")), 3)
+            self.assertEqual((cat.loads, cat.refreshes), (1, 1))
+
+            client.capability_allowlist_update(patch={"x": 1})
+            cat.search("git")
+            self.assertEqual(cat.loads, 2)
+
+        overview_calls = [r for r in captured if r["op"] == "capability_overview"]
+        self.assertEqual(len(overview_calls), 3)
+
+    def test_dirty_ids_survive_a_failed_refetch(self) -> None:
+        catalog = [_item("mcp:github", "GitHub Tools")]
+        down = [False]
+
+        def fake_call_daemon(*, endpoint, request, timeout_s):  # type: ignore[no-untyped-def]
+            if down[0]:
+                raise DaemonUnavailableError("daemon down")
+            q = request["args"].get("query", "")
+            items = [it for it in catalog if not q or it["capability_id"] == q]
+            return {"ok": True, "result": {"items": items}}
+
+        client = CCCCClient(endpoint=DaemonEndpoint(transport="tcp", host="127.0.0.1", port=9000), capability_catalog=True)
+        cat = client.capability_catalog
+        assert cat is not None
+        with patch("cccc_sdk.client.call_daemon", side_effect=fake_call_daemon):
+            cat.search("git")
+            catalog[0] = _item("mcp:github", "GitHub Enterprise")
+            cat.mark_dirty("mcp:github")
+            down[0] = True
+            with self.assertRaises(DaemonUnavailableError):
+                cat.search("git")
+            down[0] = False
+            self.assertEqual(cat.search("git")[0]["name"], "GitHub Enterprise")
+            self.assertEqual(cat.loads, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import unittest
+from unittest.mock import patch
+
+from cccc_sdk.cache import TTLCache
+from cccc_sdk.client import CCCCClient
+from cccc_sdk.transport import DaemonEndpoint
+
+
+class TestContextCache(unittest.TestCase):
+    def _client(self) -> CCCCClient:
+        return CCCCClient(
+            endpoint=DaemonEndpoint(transport="tcp", host="127.0.0.1", port=9000),
+            context_cache_ttl_s=60.0,
+        )
+
+    def test_context_get_is_served_from_cache_until_version_changes(self) -> None:
+        captured: list[dict] = []
+        state = {"version": "v1"}
+
+        def fake_call_daemon(*, endpoint, request, timeout_s):  # type: ignore[no-untyped-def]
+            captured.append(request)
+            if request["op"] == "context_get":
+                return {"ok": True, "result": {"version": state["version"], "coordination": {}}}
+            return {"ok": True, "result": {"success": True, "changes": [], "version": state["version"]}}
+
+        client = self._client()
+        with patch("cccc_sdk.client.call_daemon", side_effect=fake_call_daemon):
+            self.assertEqual(client.context_get(group_id="g_1")["version"], "v1")
+            self.assertEqual(client.context_get(group_id="g_1")["version"], "v1")
+
+            # A no-op sync returns the same version: cache stays valid.
+            client.context_sync(group_id="g_1", ops=[])
+            client.context_get(group_id="g_1")
+
+            state["version"] = "v2"
+            client.context_sync(group_id="g_1", ops=[{"op": "meta.merge", "data": {"project_status": "ok"}}])
+            self.assertEqual(client.context_get(group_id="g_1")["version"], "v2")
+
+        self.assertEqual([r["op"] for r in captured].count("context_get"), 2)
+        assert client.context_cache is not None
+        stats = client.context_cache.stats()
+        self.assertEqual((stats.hits, stats.misses, stats.invalidations), (2, 2, 1))
+
+    def test_context_events_invalidate(self) -> None:
+        client = self._client()
+        cache = client.context_cache
+        assert cache is not None
+        cache.get("g_1", lambda: {"version": "v1"})
+        cache.observe({"t": "event", "event": {"kind": "chat.message", "group_id": "g_1"}})
+        self.assertEqual(cache.version("g_1"), "v1")
+        cache.observe({"t": "event", "event": {"kind": "context.sync", "group_id": "g_1"}})
+        self.assertEqual(cache.version("g_1"), "")
+
+    def test_results_are_isolated_and_racing_loads_not_cached(self) -> None:
+        client = self._client()
+        cache = client.context_cache
+        assert cache is not None
+        doc = cache.get("g_1", lambda: {"version": "v1", "coordination": {"tasks": []}})
+        doc["coordination"]["tasks"].append({"id": "T1"})
+        self.assertEqual(cache.get("g_1", lambda: {})["coordination"]["tasks"], [])
+
+        def racing_loader() -> dict:
+            cache.note_version("g_2", "v2")  # a context_sync lands while this load is in flight
+            return {"version": "v1"}
+
+        self.assertEqual(cache.get("g_2", racing_loader)["version"], "v1")
+        self.assertEqual(cache.version("g_2"), "")  # the stale document was not cached
+
+    def test_ttl_expiry(self) -> None:
+        now = [0.0]
+        cache: TTLCache[int] = TTLCache(ttl_s=1.0, clock=lambda: now[0])
+        cache.put("k", 1)
+        self.assertEqual(cache.get("k"), (True, 1))
+        now[0] = 2.0
+        self.assertEqual(cache.get("k"), (False, None))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import unittest
+from unittest.mock import patch
+
+from cccc_sdk.client import CCCCClient
+from cccc_sdk.context_diff import diff_context, sync_desired_context
+from cccc_sdk.context_ops import validate_context_ops
+from cccc_sdk.transport import DaemonEndpoint
+
+
+CURRENT = {
+    "version": "v1",
+    "coordination": {
+        "brief": {"objective": "ship", "current_focus": "", "constraints": ["no rewrites"], "project_brief_stale": False},
+        "tasks": [
+            {"id": "T1", "title": "Parser", "status": "active", "assignee": "p1", "blocked_by": [], "notes": ""},
+            {"id": "T2", "title": "Docs", "status": "planned", "assignee": None},
+        ],
+    },
+    "agent_states": [{"id": "p1", "hot": {"focus": "parser", "blockers": []}, "warm": {"open_loops": []}}],
+    "meta": {"project_status": "green"},
+}
+
+
+class TestContextDiff(unittest.TestCase):
+    def test_identical_desired_state_emits_no_ops(self) -> None:
+        self.assertEqual(diff_context(CURRENT, CURRENT), [])
+
+    def test_emits_only_changed_fields(self) -> None:
+        desired = {
+            "coordination": {
+                "brief": {"objective": "ship", "current_focus": "release", "constraints": ["no rewrites"]},
+                "tasks": [
+                    {"id": "T1", "title": "Parser", "status": "done", "assignee": "p1"},
+                    {"id": "T2", "title": "Docs", "status": "planned", "assignee": "p2"},
+                    {"title": "Changelog", "assignee": "p2"},
+                ],
+            },
+            "agent_states": [{"id": "p1", "focus": "parser", "next_action": "tag release"}],
+            "meta": {"project_status": "green"},
+        }
+        self.assertEqual(
+            diff_context(CURRENT, desired),
+            [
+                {"op": "task.create", "title": "Changelog", "assignee": "p2"},
+                {"op": "task.update", "task_id": "T2", "assignee": "p2"},
+                {"op": "task.move", "task_id": "T1", "status": "done"},
+                {"op": "coordination.brief.update", "current_focus": "release"},
+                {"op": "agent_state.update", "actor_id": "p1", "next_action": "tag release"},
+            ],
+        )
+
+    def test_nulls_and_restore_produce_valid_ops(self) -> None:
+        current = {
+            "coordination": {
+                "tasks": [
+                    {"id": "T1", "title": "A", "status": "archived", "archived_from": "active"},
+                    {"id": "T2", "title": "B", "status": "archived", "archived_from": "planned"},
+                ]
+            },
+            "agent_states": [{"id": "p1", "hot": {"focus": "parser", "blockers": ["x"]}}],
+        }
+        desired = {
+            "coordination": {"tasks": [{"id": "T1", "status": "active"}, {"id": "T2", "status": "done"}]},
+            "agent_states": [{"id": "p1", "hot": {"focus": None, "blockers": None, "active_task_id": None}}],
+        }
+        ops = diff_context(current, desired)
+        self.assertEqual(validate_context_ops(ops), [])
+        self.assertEqual(
+            [(o["op"], o.get("task_id"), o.get("status")) for o in ops[:3]],
+            [("task.restore", "T1", None), ("task.restore", "T2", None), ("task.move", "T2", "done")],
+        )
+        self.assertEqual(ops[3], {"op": "agent_state.update", "actor_id": "p1", "focus": "", "blockers": []})
+
+    def test_sync_desired_skips_daemon_when_unchanged_and_forwards_dry_run(self) -> None:
+        captured: list[dict] = []
+
+        def fake_call_daemon(*, endpoint, request, timeout_s):  # type: ignore[no-untyped-def]
+            captured.append(request)
+            if request["op"] == "context_get":
+                return {"ok": True, "result": CURRENT}
+            return {"ok": True, "result": {"success": True, "dry_run": True, "changes": [{"index": 0}], "version": "v1"}}
+
+        client = CCCCClient(endpoint=DaemonEndpoint(transport="tcp", host="127.0.0.1", port=9000))
+        with patch("cccc_sdk.client.call_daemon", side_effect=fake_call_daemon):
+            res = sync_desired_context(client, group_id="g_1", desired={"meta": {"project_status": "green"}})
+            self.assertEqual(res["ops"], [])
+            res = sync_desired_context(client, group_id="g_1", desired={"meta": {"project_status": "red"}}, dry_run=True)
+
+        self.assertEqual([r["op"] for r in captured], ["context_get", "context_get", "context_sync"])
+        self.assertIs(captured[-1]["args"]["dry_run"], True)
+        self.assertEqual(res["ops"], [{"op": "meta.merge", "data": {"project_status": "red"}}])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import unittest
+
+from cccc_sdk.context_index import ContextSnapshot
+
+
+def _context() -> dict:
+    return {
+        "version": "v1",
+        "coordination": {
+            "brief": {"objective": "ship"},
+            "tasks": [
+                {"id": "T1", "title": "root", "status": "active", "assignee": "lead", "parent_id": None},
+                {"id": "T2", "title": "a", "status": "active", "assignee": "p1", "parent_id": "T1"},
+                {"id": "T3", "title": "b", "status": "planned", "assignee": "p1", "parent_id": "T1"},
+                {"id": "T4", "title": "c", "status": "done", "assignee": "p2", "parent_id": "T2"},
+            ],
+        },
+        "agent_states": [{"id": "p1", "hot": {"focus": "a"}, "warm": {}}],
+    }
+
+
+class TestContextSnapshot(unittest.TestCase):
+    def test_indexed_queries(self) -> None:
+        snap = ContextSnapshot(_context())
+        self.assertEqual([t["id"] for t in snap.active_tasks_for("p1")], ["T2"])
+        self.assertEqual([t["id"] for t in snap.tasks(assignee="p1")], ["T2", "T3"])
+        self.assertEqual([t["id"] for t in snap.children("T1")], ["T2", "T3"])
+        self.assertEqual([t["id"] for t in snap.roots()], ["T1"])
+        self.assertEqual(snap.tasks_summary(), {"planned": 1, "active": 2, "done": 1, "archived": 0, "total": 4, "root_count": 1})
+        self.assertEqual((snap.agent_state("p1") or {}).get("hot"), {"focus": "a"})
+
+    def test_apply_sync_updates_indexes_in_place(self) -> None:
+        snap = ContextSnapshot(_context())
+        ops = [
+            {"op": "task.move", "task_id": "T3", "status": "active"},
+            {"op": "task.update", "task_id": "T2", "assignee": "p2", "parent_id": None},
+            {"op": "task.move", "task_id": "T4", "status": "archived"},
+            {"op": "agent_state.update", "actor_id": "p1", "focus": "b", "resume_hint": "see T3"},
+        ]
+        snap.apply_sync(ops, {"success": True, "dry_run": False, "changes": [{"index": i} for i in range(4)], "version": "v2"})
+
+        self.assertEqual(snap.version, "v2")
+        self.assertFalse(snap.stale)
+        self.assertEqual([t["id"] for t in snap.active_tasks_for("p1")], ["T3"])
+        self.assertEqual([t["id"] for t in snap.active_tasks_for("p2")], ["T2"])
+        self.assertEqual([t["id"] for t in snap.roots()], ["T1", "T2"])
+        self.assertEqual((snap.task("T4") or {}).get("archived_from"), "done")
+        self.assertEqual(snap.agent_state("p1"), {"id": "p1", "hot": {"focus": "b"}, "warm": {"resume_hint": "see T3"}, "updated_at": None})
+
+        snap.apply_op({"op": "task.restore", "task_id": "T4"})
+        self.assertEqual(snap.count("done"), 1)
+        snap.apply_op({"op": "task.create", "title": "new"})
+        self.assertTrue(snap.stale)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import unittest
+from unittest.mock import patch
+
+from cccc_sdk.client import CCCCClient
+from cccc_sdk.context_ops import InvalidContextOpsError, validate_context_ops
+from cccc_sdk.transport import DaemonEndpoint
+
+
+class TestContextOpsValidator(unittest.TestCase):
+    def test_valid_batch_has_no_errors(self) -> None:
+        ops = [
+            {"op": "coordination.brief.update", "objective": "ship", "constraints": ["a"], "project_brief_stale": False},
+            {"op": "coordination.note.add", "kind": "handoff", "summary": "to p2", "task_id": None},
+            {"op": "task.create", "title": "T", "status": "planned", "checklist": [{"text": "x", "status": "pending"}]},
+            {"op": "task.update", "task_id": "T1", "assignee": None, "waiting_on": "user"},
+            {"op": "task.move", "task_id": "T1", "status": "done"},
+            {"op": "agent_state.update", "agent_id": "p1", "focus": "f", "extra_field": 1},
+            {"op": "meta.merge", "data": {"project_status": None}},
+        ]
+        self.assertEqual(validate_context_ops(ops), [])
+
+    def test_reports_structured_errors(self) -> None:
+        ops = [
+            {"op": "task.frobnicate"},
+            {"op": "task.create", "title": " "},
+            {"op": "task.move", "task_id": "T1", "status": "closed"},
+            {"op": "agent_state.update", "actor_id": "p1", "blockers": "none"},
+            {"op": "meta.merge", "data": {"owner": "me"}},
+            "task.create",
+        ]
+        got = [(e.index, e.field, e.code) for e in validate_context_ops(ops)]
+        self.assertEqual(
+            got,
+            [
+                (0, "op", "unknown_op"),
+                (1, "title", "missing_field"),
+                (2, "status", "invalid_enum"),
+                (3, "blockers", "invalid_type"),
+                (4, "data.owner", "forbidden_key"),
+                (5, "op", "invalid_op"),
+            ],
+        )
+
+    def test_context_sync_rejects_locally(self) -> None:
+        client = CCCCClient(endpoint=DaemonEndpoint(transport="tcp", host="127.0.0.1", port=9000))
+        with patch("cccc_sdk.client.call_daemon") as fake:
+            with self.assertRaises(InvalidContextOpsError) as ctx:
+                client.context_sync(group_id="g_1", ops=[{"op": "task.move", "task_id": "T1"}], dry_run=True)
+            fake.assert_not_called()
+        self.assertEqual(ctx.exception.errors[0].code, "missing_field")
+
+
+if __name__ == "__main__":
+    unittest.main()
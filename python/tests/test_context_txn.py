@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import unittest
+from unittest.mock import patch
+
+from cccc_sdk.client import CCCCClient
+from cccc_sdk.context_txn import ContextTxn, coalesce_ops
+from cccc_sdk.errors import DaemonAPIError
+from cccc_sdk.transport import DaemonEndpoint
+
+
+class TestContextTxn(unittest.TestCase):
+    def test_coalesce_merges_redundant_ops(self) -> None:
+        ops = [
+            {"op": "task.update", "task_id": "T1", "notes": "a"},
+            {"op": "agent_state.update", "actor_id": "p1", "focus": "x"},
+            {"op": "task.update", "task_id": "T1", "notes": "b", "priority": "high"},
+            {"op": "agent_state.update", "actor_id": "p1", "next_action": "y"},
+            {"op": "task.move", "task_id": "T1", "status": "active"},
+            {"op": "task.update", "task_id": "T1", "notes": "c"},  # after a move: kept separate
+            {"op": "meta.merge", "data": {"project_status": "amber"}},
+            {"op": "meta.merge", "data": {"project_status": "green"}},
+            {"op": "coordination.note.add", "kind": "decision", "summary": "s"},
+            {"op": "coordination.note.add", "kind": "decision", "summary": "s"},
+        ]
+        self.assertEqual(
+            coalesce_ops(ops),
+            [
+                {"op": "task.update", "task_id": "T1", "notes": "b", "priority": "high"},
+                {"op": "agent_state.update", "actor_id": "p1", "focus": "x", "next_action": "y"},
+                {"op": "task.move", "task_id": "T1", "status": "active"},
+                {"op": "task.update", "task_id": "T1", "notes": "c"},
+                {"op": "meta.merge", "data": {"project_status": "green"}},
+                {"op": "coordination.note.add", "kind": "decision", "summary": "s"},
+                {"op": "coordination.note.add", "kind": "decision", "summary": "s"},
+            ],
+        )
+
+    def test_flush_retries_on_version_conflict(self) -> None:
+        captured: list[dict] = []
+        versions = iter(["v1", "v2"])
+
+        def fake_call_daemon(*, endpoint, request, timeout_s):  # type: ignore[no-untyped-def]
+            captured.append(request)
+            if request["op"] == "context_get":
+                return {"ok": True, "result": {"version": next(versions)}}
+            if request["args"].get("if_version") == "v1":
+                return {"ok": False, "error": {"code": "version_conflict", "message": "stale", "details": {}}}
+            return {"ok": True, "result": {"success": True, "changes": [{}, {}], "version": "v3"}}
+
+        client = CCCCClient(endpoint=DaemonEndpoint(transport="tcp", host="127.0.0.1", port=9000))
+        with patch("cccc_sdk.client.call_daemon", side_effect=fake_call_daemon), patch("cccc_sdk.context_txn.time.sleep"):
+            with ContextTxn(client, group_id="g_1", by="p1") as txn:
+                txn.add({"op": "agent_state.update", "actor_id": "p1", "focus": "a"})
+                txn.add({"op": "agent_state.update", "actor_id": "p1", "focus": "b"})
+
+        syncs = [r for r in captured if r["op"] == "context_sync"]
+        self.assertEqual([r["args"]["if_version"] for r in syncs], ["v1", "v2"])
+        self.assertEqual(syncs[-1]["args"]["ops"], [{"op": "agent_state.update", "actor_id": "p1", "focus": "b"}])
+        stats = txn.stats()
+        self.assertEqual((stats.ops_in, stats.ops_out, stats.conflicts, stats.retries), (2, 1, 1, 1))
+
+    def test_non_conflict_errors_keep_ops_pending(self) -> None:
+        def fake_call_daemon(*, endpoint, request, timeout_s):  # type: ignore[no-untyped-def]
+            if request["op"] == "context_get":
+                return {"ok": True, "result": {"version": "v1"}}
+            return {"ok": False, "error": {"code": "permission_denied", "message": "no", "details": {}}}
+
+        client = CCCCClient(endpoint=DaemonEndpoint(transport="tcp", host="127.0.0.1", port=9000))
+        txn = ContextTxn(client, group_id="g_1")
+        txn.add({"op": "meta.merge", "data": {"project_status": "red"}})
+        with patch("cccc_sdk.client.call_daemon", side_effect=fake_call_daemon):
+            with self.assertRaises(DaemonAPIError):
+                txn.flush()
+        self.assertEqual(txn.pending(), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from cccc_sdk.client import CCCCClient
+from cccc_sdk.fleet import FleetSelector, run_fleet
+from cccc_sdk.transport import DaemonEndpoint
+
+
+class TestFleet(unittest.TestCase):
+    def _fake(self, captured: list):  # type: ignore[no-untyped-def]
+        lock = threading.Lock()
+        groups = [
+            {"group_id": "g_1", "state": "active", "running": True},
+            {"group_id": "g_2", "state": "active", "running": True},
+            {"group_id": "g_3", "state": "paused", "running": False},
+        ]
+        actors = {
+            "g_1": [{"id": "lead", "runtime": "claude", "running": True}, {"id": "peer-1", "runtime": "codex", "running": True}],
+            "g_2": [{"id": "lead", "runtime": "codex", "running": False}],
+            "g_3": [{"id": "lead", "runtime": "codex", "running": True}],
+        }
+
+        def fake_call_daemon(*, endpoint, request, timeout_s):  # type: ignore[no-untyped-def]
+            op, args = request["op"], request["args"]
+            with lock:
+                captured.append((op, args.get("group_id"), args.get("actor_id")))
+            if op == "groups":
+                return {"ok": True, "result": {"groups": groups}}
+            if op == "actor_list":
+                if args["group_id"] not in actors:
+                    return {"ok": False, "error": {"code": "group_not_found", "message": "no such group"}}
+                return {"ok": True, "result": {"actors": actors[args["group_id"]]}}
+            time.sleep(0.05)
+            if args.get("group_id") == "g_2":
+                return {"ok": False, "error": {"code": "actor_not_found", "message": "gone"}}
+            return {"ok": True, "result": {"ok": True}}
+
+        return fake_call_daemon
+
+    def _client(self) -> CCCCClient:
+        return CCCCClient(endpoint=DaemonEndpoint(transport="tcp", host="127.0.0.1", port=9000))
+
+    def test_actor_restart_with_filters_runs_in_parallel(self) -> None:
+        captured: list = []
+        progress: list = []
+        selector = FleetSelector(group_filter={"state": "active"}, actor_filter={"runtime": ["codex"]})
+        t0 = time.monotonic()
+        with patch("cccc_sdk.client.call_daemon", side_effect=self._fake(captured)):
+            report = run_fleet(self._client(), selector, "restart", on_progress=lambda o, d, t: progress.append((d, t)))
+        elapsed = time.monotonic() - t0
+
+        restarts = sorted((g, a) for op, g, a in captured if op == "actor_restart")
+        self.assertEqual(restarts, [("g_1", "peer-1"), ("g_2", "lead")])
+        self.assertLess(elapsed, 0.09)
+        self.assertFalse(report.ok)
+        self.assertEqual([(o.group_id, o.error_code) for o in report.failed], [("g_2", "actor_not_found")])
+        self.assertEqual(len(report.succeeded), 1)
+        self.assertEqual(sorted(progress), [(1, 2), (2, 2)])
+
+    def test_group_scope_and_dry_run(self) -> None:
+        captured: list = []
+        with patch("cccc_sdk.client.call_daemon", side_effect=self._fake(captured)):
+            plan = run_fleet(self._client(), FleetSelector(group_ids=["g_1", "g_3"]), "stop", dry_run=True)
+            report = run_fleet(self._client(), FleetSelector(group_ids=["g_1", "g_3"]), "update", patch={"title": "x"})
+
+        self.assertEqual([(o.group_id, o.actor_id) for o in plan.outcomes], [("g_1", ""), ("g_3", "")])
+        self.assertEqual(sorted(op for op, _, _ in captured), ["group_update", "group_update"])
+        self.assertTrue(report.ok)
+        with self.assertRaises(ValueError):
+            run_fleet(self._client(), FleetSelector(), "update")
+
+    def test_actor_list_failure_is_reported_per_group(self) -> None:
+        captured: list = []
+        selector = FleetSelector(group_ids=["g_1", "g_missing"], actors=True)
+        with patch("cccc_sdk.client.call_daemon", side_effect=self._fake(captured)):
+            plan = run_fleet(self._client(), selector, "stop", dry_run=True)
+            report = run_fleet(self._client(), selector, "stop")
+
+        for r in (plan, report):
+            self.assertEqual([(o.group_id, o.actor_id, o.error_code) for o in r.failed], [("g_missing", "", "group_not_found")])
+            self.assertEqual(sorted(o.actor_id for o in r.succeeded), ["lead", "peer-1"])
+        self.assertEqual(sorted(a for op, _, a in captured if op == "actor_stop"), ["lead", "peer-1"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import unittest
+from unittest.mock import patch
+
+from cccc_sdk.client import CCCCClient
+from cccc_sdk.inbox import InboxCounters, resolve_recipients
+from cccc_sdk.transport import DaemonEndpoint
+
+
+def _msg(eid: str, *, by: str = "user", to: list | None = None, priority: str = "normal", seq: int = 0) -> dict:
+    data: dict = {"text": "hi", "priority": priority}
+    if to is not None:
+        data["to"] = to
+    return {"v": 1, "id": eid, "seq": seq, "kind": "chat.message", "group_id": "g_1", "by": by, "data": data}
+
+
+class TestInboxCounters(unittest.TestCase):
+    def _client(self) -> CCCCClient:
+        return CCCCClient(endpoint=DaemonEndpoint(transport="tcp", host="127.0.0.1", port=9000))
+
+    def test_resolve_recipients_selectors(self) -> None:
+        actors = {"lead": "foreman", "p1": "peer", "p2": "peer"}
+        self.assertEqual(resolve_recipients(None, actors=actors, sender="user"), {"lead", "p1", "p2"})
+        self.assertEqual(resolve_recipients(["@peers"], actors=actors, sender="p1"), {"p2"})
+        self.assertEqual(resolve_recipients(["@foreman", "user"], actors=actors), {"lead", "user"})
+
+    def test_stream_events_update_counts(self) -> None:
+        counters = InboxCounters(self._client(), group_id="g_1", actors={"lead": "foreman", "p1": "peer"})
+        counters.apply({"t": "event", "event": _msg("e1", to=["@all"], priority="attention", seq=1)})
+        counters.apply({"t": "event", "event": _msg("e2", by="lead", to=["p1"], seq=2)})
+        counters.apply({"t": "event", "event": _msg("e2", by="lead", to=["p1"], seq=2)})  # duplicate
+        self.assertEqual(counters.unread("p1"), 2)
+        self.assertEqual(counters.attention("p1"), 1)
+        self.assertEqual(counters.unread("lead"), 1)
+
+        counters.apply({"kind": "chat.ack", "id": "a1", "data": {"actor_id": "p1", "event_id": "e1"}})
+        self.assertEqual(counters.attention("p1"), 0)
+        self.assertEqual(counters.unread("p1"), 2)  # ACK is independent from read cursors
+
+        counters.apply({"kind": "chat.read", "id": "r1", "data": {"actor_id": "p1", "event_id": "e1"}})
+        self.assertEqual(counters.unread("p1"), 1)
+
+        counters.apply(
+            {"kind": "system.notify", "id": "n1", "data": {"kind": "nudge", "target_actor_id": "p1", "requires_ack": True}}
+        )
+        self.assertEqual(counters.counts("p1").notify_ack, 1)
+        counters.apply({"kind": "system.notify_ack", "id": "n2", "data": {"actor_id": "p1", "notify_event_id": "n1"}})
+        self.assertEqual(counters.counts("p1").notify_ack, 0)
+        self.assertEqual(counters.unread("p1"), 2)
+
+    def test_seed_uses_one_inbox_list_per_recipient(self) -> None:
+        captured: list[dict] = []
+        inboxes = {
+            "p1": [_msg("e2", seq=2), _msg("e3", seq=3, priority="attention")],
+            "user": [_msg("e1", by="p1", seq=1)],
+        }
+
+        def fake_call_daemon(*, endpoint, request, timeout_s):  # type: ignore[no-untyped-def]
+            captured.append(request)
+            if request["op"] == "actor_list":
+                return {"ok": True, "result": {"actors": [{"id": "p1", "role": "peer"}]}}
+            return {"ok": True, "result": {"messages": inboxes[request["args"]["actor_id"]]}}
+
+        with patch("cccc_sdk.client.call_daemon", side_effect=fake_call_daemon):
+            counters = InboxCounters(self._client(), group_id="g_1")
+            counters.seed()
+
+        self.assertEqual([r["op"] for r in captured], ["actor_list", "inbox_list", "inbox_list"])
+        self.assertEqual(counters.unread("p1"), 2)
+        self.assertEqual(counters.attention("p1"), 1)
+        self.assertEqual(counters.unread("user"), 1)
+        self.assertEqual(counters.last_event_id, "e3")
+
+    def test_seed_beyond_tracking_window(self) -> None:
+        inboxes = {"p1": [_msg(f"e{i}", seq=i) for i in range(1, 6)], "user": []}
+
+        def fake_call_daemon(*, endpoint, request, timeout_s):  # type: ignore[no-untyped-def]
+            return {"ok": True, "result": {"messages": inboxes[request["args"]["actor_id"]]}}
+
+        with patch("cccc_sdk.client.call_daemon", side_effect=fake_call_daemon):
+            counters = InboxCounters(self._client(), group_id="g_1", actors={"p1": "peer"}, max_tracked_events=3)
+            counters.seed()
+
+        self.assertEqual(counters.unread("p1"), 3)  # only the newest ids that still have a ledger position
+        self.assertEqual(counters.last_event_id, "e5")
+
+    def test_reseed_refreshes_the_roster(self) -> None:
+        roster = [{"id": "p1", "role": "peer"}]
+
+        def fake_call_daemon(*, endpoint, request, timeout_s):  # type: ignore[no-untyped-def]
+            if request["op"] == "actor_list":
+                return {"ok": True, "result": {"actors": list(roster)}}
+            return {"ok": True, "result": {"messages": []}}
+
+        with patch("cccc_sdk.client.call_daemon", side_effect=fake_call_daemon):
+            counters = InboxCounters(self._client(), group_id="g_1")
+            counters.seed()
+            roster.append({"id": "p2", "role": "peer"})
+            counters.seed()
+
+        counters.apply(_msg("e1", to=["@peers"], seq=1))
+        self.assertEqual(counters.unread("p1"), 1)
+        self.assertEqual(counters.unread("p2"), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
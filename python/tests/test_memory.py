@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from cccc_sdk.client import CCCCClient
+from cccc_sdk.memory import ContextGuard, DailyFlushBuffer, estimate_tokens, iter_memory_lines, search_memory_groups
+from cccc_sdk.transport import DaemonEndpoint
+
+
+class TestIterMemoryLines(unittest.TestCase):
+    def _client(self, **kwargs) -> CCCCClient:  # type: ignore[no-untyped-def]
+        return CCCCClient(endpoint=DaemonEndpoint(transport="tcp", host="127.0.0.1", port=9000), **kwargs)
+
+    def test_pages_adaptively_and_prefetches(self) -> None:
+        lines = [f"line {i:04d}" for i in range(1, 1001)]
+        windows: list[tuple[int, int]] = []
+
+        def fake_call_daemon(*, endpoint, request, timeout_s):  # type: ignore[no-untyped-def]
+            args = request["args"]
+            off, lim = args["offset"], args["limit"]
+            windows.append((off, lim))
+            chunk = lines[off - 1 : off - 1 + lim]
+            content = "\n".join(chunk) + ("\n" if chunk else "")
+            result = {"path": args["path"], "offset": off, "limit": lim, "total_lines": len(lines), "content": content}
+            return {"ok": True, "result": result}
+
+        with patch("cccc_sdk.client.call_daemon", side_effect=fake_call_daemon):
+            got = list(
+                iter_memory_lines(
+                    self._client(), group_id="g_1", path="MEMORY.md", limit=100, min_limit=10, target_bytes=3000
+                )
+            )
+
+        self.assertEqual(got, lines)
+        # First page uses the requested limit; later pages are sized from ~10 bytes/line
+        # and the last one is clipped to the remaining lines.
+        self.assertEqual(windows[0], (1, 100))
+        self.assertEqual(windows[1], (101, 300))
+        self.assertEqual(windows[-1], (701, 300))
+        self.assertEqual(sum(lim for _, lim in windows), 1000)
+
+    def test_stops_on_empty_page_without_total(self) -> None:
+        pages = {1: "a\nb\n", 3: ""}
+
+        def fake_call_daemon(*, endpoint, request, timeout_s):  # type: ignore[no-untyped-def]
+            return {"ok": True, "result": {"content": pages[request["args"]["offset"]]}}
+
+        with patch("cccc_sdk.client.call_daemon", side_effect=fake_call_daemon):
+            got = list(iter_memory_lines(self._client(), group_id="g_1", path="x.md", prefetch=False))
+        self.assertEqual(got, ["a", "b"])
+
+    def test_follows_clamped_limit_and_newline_only_model(self) -> None:
+        lines = [f"l{i}" for i in range(1, 121)]
+        lines[4] = "carriage\rreturn \u2028 sep"
+        lines[-1] = ""  # trailing blank line is still a line
+
+        def fake_call_daemon(*, endpoint, request, timeout_s):  # type: ignore[no-untyped-def]
+            off, lim = request["args"]["offset"], min(request["args"]["limit"], 50)  # daemon clamps
+            content = "\n".join(lines[off - 1 : off - 1 + lim])
+            result = {"offset": off, "limit": lim, "total_lines": len(lines), "content": content}
+            return {"ok": True, "result": result}
+
+        with patch("cccc_sdk.client.call_daemon", side_effect=fake_call_daemon):
+            got = list(iter_memory_lines(self._client(), group_id="g_1", path="x.md", limit=200, min_limit=100))
+        self.assertEqual(got, lines)
+
+
+class TestContextGuard(unittest.TestCase):
+    def _client(self) -> CCCCClient:
+        return CCCCClient(endpoint=DaemonEndpoint(transport="tcp", host="127.0.0.1", port=9000))
+
+    def test_estimate_is_conservative(self) -> None:
+        self.assertEqual(estimate_tokens(""), 0)
+        self.assertGreaterEqual(estimate_tokens("hello world, this is a test"), len("hello world, this is a test") // 4)
+        self.assertEqual(estimate_tokens("\u4f60\u597d"), 2)
+
+    def test_calls_daemon_only_near_threshold(self) -> None:
+        captured: list[dict] = []
+
+        def fake_call_daemon(*, endpoint, request, timeout_s):  # type: ignore[no-untyped-def]
+            captured.append(request)
+            n = len(request["args"]["messages"])
+            return {"ok": True, "result": {"needs_compaction": n >= 40, "token_count": n * 30, "threshold": 1000}}
+
+        guard = ContextGuard(self._client(), group_id="g_1", context_window_tokens=2000, margin=0.2)
+        with patch("cccc_sdk.client.call_daemon", side_effect=fake_call_daemon):
+            guard.add({"role": "user", "content": "x" * 90})
+            self.assertFalse(guard.check()["needs_compaction"])  # threshold unknown -> daemon
+            results = []
+            for _ in range(30):
+                guard.add({"role": "assistant", "content": "y" * 90})  # ~34 estimated tokens each
+                results.append(guard.check())
+
+        self.assertEqual(guard.threshold, 1000)
+        self.assertTrue(all(r.get("estimated") for r in results[:21]))
+        self.assertFalse(any(r.get("estimated") for r in results[23:]))
+        self.assertEqual(captured[0]["args"]["context_window_tokens"], 2000)
+        stats = guard.stats()
+        self.assertEqual(stats.checks, 31)
+        self.assertEqual(stats.daemon_calls, len(captured))
+        self.assertGreater(stats.skipped, 20)
+
+        guard.replace([{"role": "user", "content": "summary"}])
+        self.assertLess(guard.estimated_tokens, 10)
+
+
+class TestDailyFlushBuffer(unittest.TestCase):
+    def _client(self) -> CCCCClient:
+        return CCCCClient(endpoint=DaemonEndpoint(transport="tcp", host="127.0.0.1", port=9000))
+
+    def test_batches_by_token_budget_and_skips_duplicates(self) -> None:
+        captured: list[dict] = []
+
+        def fake_call_daemon(*, endpoint, request, timeout_s):  # type: ignore[no-untyped-def]
+            captured.append(request)
+            status = "silent" if len(captured) == 2 else "written"
+            return {"ok": True, "result": {"status": status, "content_hash": "h"}}
+
+        buf = DailyFlushBuffer(self._client(), group_id="g_1", max_tokens=40, date="2026-01-01")
+        msgs = [{"role": "user", "content": f"message number {i}"} for i in range(6)]
+        with patch("cccc_sdk.client.call_daemon", side_effect=fake_call_daemon):
+            results = buf.extend(msgs)  # ~10 tokens each -> flush every 4 messages
+            buf.flush()
+            # The same history replayed: nothing new, answered locally.
+            replay = buf.extend(msgs[:4])
+            buf.add({"role": "user", "content": "message number 2"})
+            local = buf.flush()
+
+        self.assertEqual(len(results), 1)
+        self.assertEqual(len(captured), 2)
+        self.assertEqual(len(captured[0]["args"]["messages"]), 4)
+        self.assertEqual(len(captured[1]["args"]["messages"]), 2)
+        self.assertEqual(captured[0]["args"]["date"], "2026-01-01")
+        self.assertEqual(replay[0]["reason"], "local_content_hash")
+        self.assertEqual(local, {"status": "silent", "reason": "local_content_hash"})
+        stats = buf.stats()
+        self.assertEqual((stats.written, stats.silent, stats.skipped_local), (1, 1, 2))
+        self.assertEqual(stats.deduped_messages, 5)
+        self.assertAlmostEqual(stats.written_ratio, 0.25)
+
+    def test_dedup_scope_follows_the_calendar_day(self) -> None:
+        calls = [0]
+
+        def fake_call_daemon(*, endpoint, request, timeout_s):  # type: ignore[no-untyped-def]
+            calls[0] += 1
+            return {"ok": True, "result": {"status": "written"}}
+
+        day = ["2026-01-01"]
+        buf = DailyFlushBuffer(self._client(), group_id="g_1", today=lambda: day[0])
+        msg = {"role": "user", "content": "standup"}
+        with patch("cccc_sdk.client.call_daemon", side_effect=fake_call_daemon):
+            buf.add(msg)
+            buf.flush()
+            buf.add(msg)
+            self.assertEqual(buf.flush(), {"status": "silent", "reason": "local_content_hash"})
+            day[0] = "2026-01-02"
+            buf.add(msg)
+            buf.flush()
+        self.assertEqual(calls[0], 2)
+
+    def test_age_budget_and_requeue_on_error(self) -> None:
+        now = [0.0]
+        calls = [0]
+
+        def fake_call_daemon(*, endpoint, request, timeout_s):  # type: ignore[no-untyped-def]
+            calls[0] += 1
+            if calls[0] == 1:
+                return {"ok": False, "error": {"code": "internal", "message": "boom"}}
+            return {"ok": True, "result": {"status": "written"}}
+
+        buf = DailyFlushBuffer(self._client(), group_id="g_1", max_age_s=60.0, clock=lambda: now[0])
+        with patch("cccc_sdk.client.call_daemon", side_effect=fake_call_daemon):
+            self.assertIsNone(buf.add({"role": "user", "content": "a"}))
+            now[0] = 61.0
+            with self.assertRaises(Exception):
+                buf.add({"role": "user", "content": "b"})
+            self.assertEqual(buf.pending(), 2)
+            self.assertEqual(buf.flush(), {"status": "written"})
+        self.assertEqual(buf.pending(), 0)
+
+
+class TestSearchMemoryGroups(unittest.TestCase):
+    def test_merges_top_k_and_reports_slow_and_failed_groups(self) -> None:
+        release = threading.Event()
+        scores = {"g_a": [0.9, 0.4], "g_b": [0.7, 0.65, 0.1], "g_c": [0.99]}
+
+        def fake_call_daemon(*, endpoint, request, timeout_s):  # type: ignore[no-untyped-def]
+            gid = request["args"]["group_id"]
+            if gid == "g_slow":
+                release.wait(5)
+                return {"ok": True, "result": {"hits": [{"path": "x", "score": 1.0}]}}
+            if gid == "g_err":
+                return {"ok": False, "error": {"code": "internal", "message": "boom"}}
+            hits = [{"path": f"{gid}/{i}", "score": s} for i, s in enumerate(scores[gid])]
+            return {"ok": True, "result": {"hits": hits, "count": len(hits), "took_ms": 5}}
+
+        client = CCCCClient(endpoint=DaemonEndpoint(transport="tcp", host="127.0.0.1", port=9000))
+        try:
+            with patch("cccc_sdk.client.call_daemon", side_effect=fake_call_daemon):
+                res = search_memory_groups(
+                    client, group_ids=["g_a", "g_slow", "g_b", "g_err", "g_c"], query="q", top_k=4, timeout_s=0.5
+                )
+        finally:
+            release.set()
+
+        self.assertEqual([h["score"] for h in res["hits"]], [0.99, 0.9, 0.7, 0.65])
+        self.assertEqual([h["group_id"] for h in res["hits"]], ["g_c", "g_a", "g_b", "g_b"])
+        self.assertEqual(res["groups"]["g_slow"], {"status": "timeout"})
+        self.assertEqual(res["groups"]["g_err"]["status"], "error")
+        self.assertEqual(res["groups"]["g_b"], {"status": "ok", "count": 3, "took_ms": 5})
+
+    def test_timeout_is_per_group_from_start(self) -> None:
+        socket_timeouts: list = []
+
+        def fake_call_daemon(*, endpoint, request, timeout_s):  # type: ignore[no-untyped-def]
+            socket_timeouts.append(timeout_s)
+            time.sleep(0.15)
+            return {"ok": True, "result": {"hits": [{"path": request["args"]["group_id"], "score": 0.5}]}}
+
+        client = CCCCClient(endpoint=DaemonEndpoint(transport="tcp", host="127.0.0.1", port=9000))
+        with patch("cccc_sdk.client.call_daemon", side_effect=fake_call_daemon):
+            # One worker, three groups: the last one starts ~0.3s in, beyond a total budget of 0.25s.
+            res = search_memory_groups(client, group_ids=["g_1", "g_2", "g_3"], query="q", max_workers=1, timeout_s=0.25)
+
+        self.assertEqual({g["status"] for g in res["groups"].values()}, {"ok"})
+        self.assertEqual(res["count"], 3)
+        self.assertEqual(socket_timeouts, [0.25, 0.25, 0.25])
+
+
+if __name__ == "__main__":
+    unittest.main()
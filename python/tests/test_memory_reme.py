@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import unittest
+from unittest.mock import patch
+
+from cccc_sdk.client import CCCCClient
+from cccc_sdk.memory_cache import MemorySearchCache
+from cccc_sdk.transport import DaemonEndpoint
+
+
+class TestMemoryReme(unittest.TestCase):
+    def _client(self, **kwargs) -> CCCCClient:  # type: ignore[no-untyped-def]
+        return CCCCClient(endpoint=DaemonEndpoint(transport="tcp", host="127.0.0.1", port=9000), **kwargs)
+
+    def test_memory_reme_write_maps_args(self) -> None:
+        captured: list[dict] = []
+
+        def fake_call_daemon(*, endpoint, request, timeout_s):  # type: ignore[no-untyped-def]
+            captured.append(request)
+            return {"ok": True, "result": {"status": "written", "file_path": "state/memory/daily/2026-01-01.md"}}
+
+        with patch("cccc_sdk.client.call_daemon", side_effect=fake_call_daemon):
+            self._client().memory_reme_write(
+                group_id="g_1", target="daily", content="note", date="2026-01-01", tags=["release"], dedup_intent="update"
+            )
+
+        args = captured[0]["args"]
+        self.assertEqual(captured[0]["op"], "memory_reme_write")
+        self.assertEqual(args["target"], "daily")
+        self.assertEqual(args["date"], "2026-01-01")
+        self.assertEqual(args["tags"], ["release"])
+        self.assertEqual(args["dedup_intent"], "update")
+        self.assertNotIn("mode", args)
+
+    def test_search_cache_hits_and_write_invalidation(self) -> None:
+        captured: list[dict] = []
+
+        def fake_call_daemon(*, endpoint, request, timeout_s):  # type: ignore[no-untyped-def]
+            captured.append(request)
+            if request["op"] == "memory_reme_search":
+                return {"ok": True, "result": {"hits": [], "count": 0, "took_ms": 40}}
+            return {"ok": True, "result": {"status": "written"}}
+
+        client = self._client(memory_search_cache_size=16)
+        with patch("cccc_sdk.client.call_daemon", side_effect=fake_call_daemon):
+            client.memory_reme_search(group_id="g_1", query="release  plan", sources=["daily", "memory"])
+            client.memory_reme_search(group_id="g_1", query=" release plan ", sources=["memory", "daily"])
+            client.memory_reme_search(group_id="g_2", query="release plan")
+            client.memory_reme_write(group_id="g_1", target="memory", content="x")
+            client.memory_reme_search(group_id="g_1", query="release plan", sources=["memory", "daily"])
+            client.memory_reme_search(group_id="g_2", query="release plan")
+
+        ops = [r["op"] for r in captured]
+        self.assertEqual(ops.count("memory_reme_search"), 3)
+        assert client.memory_search_cache is not None
+        stats = client.memory_search_cache.stats()
+        self.assertEqual((stats.hits, stats.misses), (2, 3))
+        self.assertAlmostEqual(stats.hit_ratio, 0.4)
+        self.assertEqual((stats.daemon_took_ms, stats.saved_took_ms), (120.0, 80.0))
+
+    def test_search_cache_isolation_and_invalidation_race(self) -> None:
+        cache = MemorySearchCache(max_entries=8)
+        hits = cache.get("g_1", {"query": "q"}, lambda: {"hits": [{"path": "a.md"}]})
+        hits["hits"].append({"path": "mutated.md"})
+        self.assertEqual(cache.get("g_1", {"query": "q"}, lambda: {})["hits"], [{"path": "a.md"}])
+
+        def racing_loader() -> dict:
+            cache.invalidate("g_2")  # a write lands while the search is in flight
+            return {"hits": [{"path": "old.md"}]}
+
+        cache.get("g_2", {"query": "q"}, racing_loader)
+        self.assertEqual(cache.get("g_2", {"query": "q"}, lambda: {"hits": []}), {"hits": []})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import unittest
+from unittest.mock import patch
+
+from cccc_sdk.client import CCCCClient
+from cccc_sdk.metadata_cache import MetadataCache
+from cccc_sdk.transport import DaemonEndpoint
+
+
+class TestMetadataCache(unittest.TestCase):
+    def test_read_through_and_precise_invalidation(self) -> None:
+        captured: list[str] = []
+
+        def fake_call_daemon(*, endpoint, request, timeout_s):  # type: ignore[no-untyped-def]
+            op = request["op"]
+            captured.append(op)
+            if op == "groups":
+                return {"ok": True, "result": {"groups": [{"group_id": "g_1"}, {"group_id": "g_2"}]}}
+            if op == "actor_list":
+                return {"ok": True, "result": {"actors": [{"id": "lead"}]}}
+            if op == "group_show":
+                return {"ok": True, "result": {"group": {"group_id": request["args"]["group_id"]}}}
+            return {"ok": True, "result": {}}
+
+        client = CCCCClient(
+            endpoint=DaemonEndpoint(transport="tcp", host="127.0.0.1", port=9000),
+            metadata_cache_ttls={"group_show": 30.0},
+        )
+        with patch("cccc_sdk.client.call_daemon", side_effect=fake_call_daemon):
+            for _ in range(3):
+                client.groups()
+                client.group_show("g_1")
+                client.group_show("g_2")
+                client.actor_list("g_1")
+            self.assertEqual(len(captured), 4)
+
+            client.actor_stop(group_id="g_1", actor_id="lead")
+            client.actor_list("g_1")
+            client.group_show("g_1")
+            client.group_show("g_2")  # other group untouched
+            client.groups()
+            self.assertEqual(captured[4:], ["actor_stop", "actor_list", "group_show", "groups"])
+
+            assert client.metadata_cache is not None
+            client.metadata_cache.observe({"event": {"kind": "group.updated", "group_id": "g_2"}})
+            client.metadata_cache.observe({"kind": "chat.message", "group_id": "g_1"})
+            client.group_show("g_2")
+            client.actor_list("g_1")
+            client.group_show("g_2", fresh=True)
+            self.assertEqual(captured[8:], ["group_show", "group_show"])
+
+        per_op = client.metadata_cache.op_stats()
+        self.assertEqual((per_op["group_show"].hits, per_op["group_show"].misses), (5, 4))
+        self.assertEqual((per_op["actor_list"].hits, per_op["actor_list"].misses), (3, 2))
+        self.assertEqual(client.metadata_cache.ttl("group_show"), 30.0)
+
+    def test_results_are_isolated_and_racing_loads_not_cached(self) -> None:
+        cache = MetadataCache()
+        loads = [0]
+
+        def loader() -> dict:
+            loads[0] += 1
+            return {"actors": [{"id": "lead", "running": True}]}
+
+        res = cache.get("actor_list", "g_1", loader)
+        res["actors"].append({"id": "leaked"})
+        self.assertEqual(cache.get("actor_list", "g_1", loader)["actors"], [{"id": "lead", "running": True}])
+        self.assertEqual(loads[0], 1)
+
+        def racing_loader() -> dict:
+            cache.invalidate("g_2")  # e.g. actor_stop lands while actor_list is in flight
+            return loader()
+
+        cache.get("actor_list", "g_2", racing_loader)
+        cache.get("actor_list", "g_2", loader)
+        self.assertEqual(loads[0], 3)
+        cache.get("actor_list", "g_2", loader)
+        self.assertEqual(loads[0], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import socket
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from cccc_sdk.client import CCCCClient
+from cccc_sdk.errors import DaemonUnavailableError
+from cccc_sdk.outbox import Outbox
+from cccc_sdk.transport import DaemonEndpoint
+
+
+class TestOutbox(unittest.TestCase):
+    def _client(self, home: str) -> CCCCClient:
+        return CCCCClient(cccc_home=home, endpoint=DaemonEndpoint(transport="tcp", host="127.0.0.1", port=9000))
+
+    def test_queues_while_down_and_replays_in_order(self) -> None:
+        captured: list[dict] = []
+        state = {"up": False}
+
+        def fake_call_daemon(*, endpoint, request, timeout_s):  # type: ignore[no-untyped-def]
+            if not state["up"]:
+                raise DaemonUnavailableError("connection refused")
+            captured.append(request)
+            return {"ok": True, "result": {"event": {"id": f"e{len(captured)}"}}}
+
+        with tempfile.TemporaryDirectory() as td, patch("cccc_sdk.client.call_daemon", side_effect=fake_call_daemon):
+            outbox = Outbox(self._client(td), batch_size=1)
+            self.assertEqual(outbox.path, Path(td) / "sdk" / "outbox.jsonl")
+            r1 = outbox.send(group_id="g_1", text="one")
+            r2 = outbox.reply(group_id="g_1", reply_to="e0", text="two")
+            self.assertTrue(r1["queued"])
+            self.assertEqual(r2["pending"], 2)
+
+            # A fresh outbox (e.g. after a producer restart) sees the same journal.
+            self.assertEqual(Outbox(self._client(td)).pending(), 2)
+
+            state["up"] = True
+            self.assertEqual(outbox.flush(), 2)
+            self.assertEqual(outbox.pending(), 0)
+            self.assertEqual([r["op"] for r in captured], ["send", "reply"])
+            self.assertEqual([r["args"]["client_id"] for r in captured], [r1["client_id"], r2["client_id"]])
+            self.assertEqual(Outbox(self._client(td)).pending(), 0)
+
+    def test_direct_send_when_daemon_is_up(self) -> None:
+        captured: list[dict] = []
+
+        def fake_call_daemon(*, endpoint, request, timeout_s):  # type: ignore[no-untyped-def]
+            captured.append(request)
+            return {"ok": True, "result": {"event": {"id": "e1"}}}
+
+        with tempfile.TemporaryDirectory() as td, patch("cccc_sdk.client.call_daemon", side_effect=fake_call_daemon):
+            outbox = Outbox(self._client(td))
+            res = outbox.send(group_id="g_1", text="hello", client_id="c1")
+
+        self.assertEqual(res, {"event": {"id": "e1"}})
+        self.assertEqual(captured[0]["args"]["client_id"], "c1")
+
+    def test_raw_socket_errors_count_as_unavailable(self) -> None:
+        captured: list[str] = []
+        failures = {"reset": ConnectionResetError("reset by peer"), "slow": socket.timeout("timed out")}
+
+        def fake_call_daemon(*, endpoint, request, timeout_s):  # type: ignore[no-untyped-def]
+            text = request["args"]["text"]
+            if text in failures:
+                raise failures.pop(text)
+            captured.append(text)
+            return {"ok": True, "result": {"event": {"id": text}}}
+
+        with tempfile.TemporaryDirectory() as td, patch("cccc_sdk.client.call_daemon", side_effect=fake_call_daemon):
+            outbox = Outbox(self._client(td), batch_size=10)
+            self.assertTrue(outbox.send(group_id="g_1", text="reset")["queued"])
+            outbox.send(group_id="g_1", text="a")
+            outbox.send(group_id="g_1", text="slow")
+            outbox.send(group_id="g_1", text="b")
+
+            self.assertEqual(outbox.flush(), 2)  # "reset" and "a" delivered, then the timeout stops the batch
+            self.assertEqual(Outbox(self._client(td)).pending(), 2)  # delivered entries were journaled as done
+            self.assertEqual(outbox.flush(), 2)
+
+        self.assertEqual(captured, ["reset", "a", "slow", "b"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import json
+import socket
+import threading
+import unittest
+
+from cccc_sdk.client import CCCCClient
+from cccc_sdk.projection import ProjectionError, parse_paths, project_json
+from cccc_sdk.transport import DaemonEndpoint
+
+
+def _chunks(text: str, size: int):  # type: ignore[no-untyped-def]
+    parts = [text[i : i + size] for i in range(0, len(text), size)]
+    it = iter(parts)
+    return lambda: next(it, "")
+
+
+DOC = {
+    "v": 1,
+    "ok": True,
+    "result": {
+        "version": "v9",
+        "coordination": {
+            "brief": {"objective": 'quote " and brace } inside', "constraints": ["a", "b\\\\c"]},
+            "tasks": [{"id": f"T{i}", "title": "[{x}]", "n": i} for i in range(50)],
+        },
+        "tasks_summary": {"total": 50, "done": 3},
+        "panorama": {"mermaid": "graph TD; A-->B " * 20},
+        "flag": False,
+        "nothing": None,
+    },
+}
+
+
+class TestProjection(unittest.TestCase):
+    def test_projects_requested_paths_across_chunk_boundaries(self) -> None:
+        text = json.dumps(DOC, ensure_ascii=False)
+        for size in (1, 3, 7, 64, len(text)):
+            out = project_json(_chunks(text, size), ["ok", "result.tasks_summary", "result.coordination.brief", "result.flag"])
+            self.assertEqual(
+                out,
+                {
+                    "ok": True,
+                    "result": {
+                        "tasks_summary": DOC["result"]["tasks_summary"],
+                        "coordination": {"brief": DOC["result"]["coordination"]["brief"]},
+                        "flag": False,
+                    },
+                },
+            )
+
+    def test_parse_paths_collapses_descendants(self) -> None:
+        self.assertEqual(parse_paths(["result.a.b", "result.a", "result.c"]), {"result": {"a": True, "c": True}})
+
+    def test_truncated_input_raises(self) -> None:
+        with self.assertRaises(ProjectionError):
+            project_json(_chunks('{"result": {"a": [1, 2', 4), ["result.b"])
+
+    def test_client_call_with_projection_over_tcp(self) -> None:
+        srv = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        srv.bind(("127.0.0.1", 0))
+        srv.listen(1)
+        requests: list[dict] = []
+
+        def serve() -> None:
+            conn, _ = srv.accept()
+            with conn, conn.makefile("rb") as f:
+                requests.append(json.loads(f.readline()))
+                conn.sendall((json.dumps(DOC) + "\n").encode("utf-8"))
+
+        t = threading.Thread(target=serve, daemon=True)
+        t.start()
+        try:
+            client = CCCCClient(endpoint=DaemonEndpoint(transport="tcp", host="127.0.0.1", port=srv.getsockname()[1]))
+            res = client.call("context_get", {"group_id": "g_1"}, projection=["result.tasks_summary"])
+        finally:
+            t.join(5)
+            srv.close()
+
+        self.assertEqual(requests[0]["op"], "context_get")
+        self.assertEqual(res, {"tasks_summary": {"total": 50, "done": 3}})
+
+
+if __name__ == "__main__":
+    unittest.main()
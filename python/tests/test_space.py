@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from cccc_sdk.client import CCCCClient
+from cccc_sdk.space import SpaceJobWaiter, bulk_ingest, ingest_key, sync_space_sources
+from cccc_sdk.space_cache import SpaceQueryCache
+from cccc_sdk.transport import DaemonEndpoint
+
+
+class TestSpaceJobWaiter(unittest.TestCase):
+    def _client(self, **kwargs) -> CCCCClient:  # type: ignore[no-untyped-def]
+        return CCCCClient(endpoint=DaemonEndpoint(transport="tcp", host="127.0.0.1", port=9000), **kwargs)
+
+    def test_one_list_per_lane_and_adaptive_interval(self) -> None:
+        now = [0.0]
+        states = {"j1": "running", "j2": "pending", "j3": "running"}
+        captured: list[dict] = []
+
+        def fake_call_daemon(*, endpoint, request, timeout_s):  # type: ignore[no-untyped-def]
+            captured.append(request["args"])
+            jobs = [{"job_id": j, "state": s} for j, s in states.items()]
+            return {"ok": True, "result": {"jobs": jobs}}
+
+        waiter = SpaceJobWaiter(self._client(), min_interval_s=1.0, max_interval_s=8.0, backoff=2.0, clock=lambda: now[0])
+        done: list[str] = []
+        with patch("cccc_sdk.client.call_daemon", side_effect=fake_call_daemon):
+            f1 = waiter.watch(group_id="g_1", lane="work", job_id="j1", callback=lambda job: done.append(job["job_id"]))
+            f2 = waiter.watch(group_id="g_1", lane="work", job_id="j2")
+            f3 = waiter.watch(group_id="g_2", lane="memory", job_id="j3")
+
+            self.assertEqual(waiter.poll_once(), 1.0)  # first sight counts as a change
+            self.assertEqual(len(captured), 2)  # one list per (group, lane), not per job
+            self.assertEqual({(a["group_id"], a["lane"], a["action"]) for a in captured}, {("g_1", "work", "list"), ("g_2", "memory", "list")})
+
+            now[0] = 1.0
+            self.assertEqual(waiter.poll_once(), 2.0)  # nothing moved -> back off
+            states["j1"] = "succeeded"
+            now[0] = 3.0
+            waiter.poll_once()
+
+        self.assertTrue(f1.done())
+        self.assertEqual(f1.result()["state"], "succeeded")
+        self.assertEqual(done, ["j1"])
+        self.assertFalse(f2.done() or f3.done())
+        self.assertEqual(waiter.pending(), 2)
+        self.assertEqual(waiter.polls, 6)
+
+    def test_wait_drives_polling(self) -> None:
+        polls = [0]
+
+        def fake_call_daemon(*, endpoint, request, timeout_s):  # type: ignore[no-untyped-def]
+            polls[0] += 1
+            state = "failed" if polls[0] >= 3 else "running"
+            return {"ok": True, "result": {"jobs": [{"job_id": "j1", "state": state, "last_error": "x"}]}}
+
+        waiter = SpaceJobWaiter(self._client(), min_interval_s=0.0, max_interval_s=0.01)
+        with patch("cccc_sdk.client.call_daemon", side_effect=fake_call_daemon):
+            fut = waiter.watch(group_id="g_1", lane="work", job_id="j1")
+            self.assertTrue(waiter.wait([fut], timeout_s=2.0))
+        self.assertEqual(fut.result()["state"], "failed")
+
+
+class TestBulkIngest(unittest.TestCase):
+    def test_content_keys_concurrency_and_resume(self) -> None:
+        captured: list[dict] = []
+
+        def fake_call_daemon(*, endpoint, request, timeout_s):  # type: ignore[no-untyped-def]
+            args = request["args"]
+            captured.append(args)
+            if args["payload"].get("url") == "https://bad":
+                return {"ok": False, "error": {"code": "invalid_request", "message": "bad url"}}
+            return {"ok": True, "result": {"job_id": "job_" + args["idempotency_key"][-6:], "accepted": True, "deduped": False}}
+
+        client = CCCCClient(endpoint=DaemonEndpoint(transport="tcp", host="127.0.0.1", port=9000))
+        docs = [{"source_type": "web_page", "url": f"https://example.com/{i}"} for i in range(20)]
+        with tempfile.TemporaryDirectory() as td:
+            journal = str(Path(td) / "ingest.jsonl")
+            with patch("cccc_sdk.client.call_daemon", side_effect=fake_call_daemon):
+                first = bulk_ingest(
+                    client, group_id="g_1", payloads=docs + [docs[0], {"url": "https://bad"}], journal_path=journal, max_workers=3
+                )
+                second = bulk_ingest(client, group_id="g_1", payloads=docs + [{"url": "https://new"}], journal_path=journal)
+
+        self.assertEqual((first.accepted, first.skipped, len(first.failed)), (20, 1, 1))
+        self.assertFalse(first.ok)
+        self.assertEqual(len(first.job_ids), 20)
+        self.assertEqual((second.accepted, second.skipped), (1, 20))
+        self.assertEqual(len(captured), 22)
+        self.assertEqual(captured[0]["kind"], "resource_ingest")
+        self.assertEqual(ingest_key({"a": 1, "b": 2}), ingest_key({"b": 2, "a": 1}))
+
+
+class TestSpaceQueryCache(unittest.TestCase):
+    def _client(self) -> CCCCClient:
+        return CCCCClient(
+            endpoint=DaemonEndpoint(transport="tcp", host="127.0.0.1", port=9000), space_query_cache_size=32
+        )
+
+    def test_coalesces_concurrent_identical_queries(self) -> None:
+        calls = [0]
+
+        def fake_call_daemon(*, endpoint, request, timeout_s):  # type: ignore[no-untyped-def]
+            calls[0] += 1
+            time.sleep(0.1)
+            return {"ok": True, "result": {"answer": "42", "degraded": False}}
+
+        client = self._client()
+        out: list[dict] = []
+        with patch("cccc_sdk.client.call_daemon", side_effect=fake_call_daemon):
+            threads = [
+                threading.Thread(target=lambda: out.append(client.group_space_query(group_id="g_1", lane="work", query="why?")))
+                for _ in range(5)
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            client.group_space_query(group_id="g_1", lane="work", query=" why? ")
+
+        self.assertEqual(calls[0], 1)
+        self.assertEqual([r["answer"] for r in out], ["42"] * 5)
+        assert client.space_query_cache is not None
+        stats = client.space_query_cache.stats()
+        self.assertEqual((stats.coalesced, stats.hits), (4, 1))
+
+    def test_invalidation_and_degraded_answers(self) -> None:
+        captured: list[dict] = []
+        degraded = [True]
+
+        def fake_call_daemon(*, endpoint, request, timeout_s):  # type: ignore[no-untyped-def]
+            captured.append(request)
+            if request["op"] == "group_space_query":
+                return {"ok": True, "result": {"answer": "", "degraded": degraded[0]}}
+            return {"ok": True, "result": {"job_id": "j", "version": "v2"}}
+
+        client = self._client()
+        q = {"group_id": "g_1", "query": "status", "options": {"source_ids": ["b", "a"]}}
+        with patch("cccc_sdk.client.call_daemon", side_effect=fake_call_daemon):
+            client.group_space_query(lane="work", **q)  # degraded -> not cached
+            degraded[0] = False
+            client.group_space_query(lane="work", **q)
+            client.group_space_query(lane="work", group_id="g_1", query="status", options={"source_ids": ["a", "b"]})
+            client.group_space_query(lane="memory", **q)
+            client.group_space_ingest(group_id="g_1", lane="work", payload={"x": 1})
+            client.group_space_query(lane="work", **q)
+            client.group_space_query(lane="memory", **q)  # other lane still cached
+            client.context_sync(group_id="g_1", ops=[{"op": "meta.merge", "data": {"project_status": "ok"}}])
+            client.group_space_query(lane="work", **q)
+
+        queries = [r for r in captured if r["op"] == "group_space_query"]
+        self.assertEqual(len(queries), 5)
+
+    def test_results_are_isolated_and_hung_leader_is_bypassed(self) -> None:
+        cache = SpaceQueryCache(wait_timeout_s=0.1)
+        args = {"lane": "work", "query": "q"}
+        first = cache.get("g_1", args, lambda: {"answer": "a", "references": [{"id": "r1"}]})
+        first["references"].append({"id": "leaked"})
+        self.assertEqual(cache.get("g_1", args, lambda: {})["references"], [{"id": "r1"}])
+
+        release = threading.Event()
+        slow_args = {"lane": "work", "query": "slow"}
+
+        def hung() -> dict:
+            release.wait(5)
+            return {"answer": "late"}
+
+        leader = threading.Thread(target=lambda: cache.get("g_1", slow_args, hung))
+        leader.start()
+        time.sleep(0.05)
+        t0 = time.monotonic()
+        res = cache.get("g_1", slow_args, lambda: {"answer": "direct"})
+        waited = time.monotonic() - t0
+        release.set()
+        leader.join()
+
+        self.assertEqual(res["answer"], "direct")
+        self.assertLess(waited, 1.0)
+
+
+class TestSyncSpaceSources(unittest.TestCase):
+    def test_only_changes_reach_the_daemon(self) -> None:
+        captured: list[dict] = []
+        counter = [0]
+
+        def fake_call_daemon(*, endpoint, request, timeout_s):  # type: ignore[no-untyped-def]
+            captured.append(request)
+            if request["op"] == "group_space_ingest":
+                counter[0] += 1
+                return {"ok": True, "result": {"job_id": "j", "source_id": f"src_{counter[0]}"}}
+            return {"ok": True, "result": {"action": request["args"]["action"]}}
+
+        client = CCCCClient(endpoint=DaemonEndpoint(transport="tcp", host="127.0.0.1", port=9000))
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td) / "docs"
+            root.mkdir()
+            for name in ("a.md", "b.md", "c.md"):
+                (root / name).write_text(f"# {name}\n", encoding="utf-8")
+            manifest = str(Path(td) / "manifest.json")
+            kw = {"group_id": "g_1", "root": str(root), "manifest_path": manifest}
+            with patch("cccc_sdk.client.call_daemon", side_effect=fake_call_daemon):
+                first = sync_space_sources(client, **kw)
+                again = sync_space_sources(client, **kw)
+                (root / "b.md").write_text("# b changed\n", encoding="utf-8")
+                (root / "c.md").unlink()
+                (root / "d.md").write_text("# d\n", encoding="utf-8")
+                plan = sync_space_sources(client, dry_run=True, **kw)
+                before = len(captured)
+                third = sync_space_sources(client, **kw)
+
+        self.assertEqual(first.added, ["a.md", "b.md", "c.md"])
+        self.assertEqual((again.unchanged, again.added), (3, []))
+        self.assertEqual((plan.added, plan.updated, plan.deleted), (["d.md"], ["b.md"], ["c.md"]))
+        self.assertEqual((third.added, third.updated, third.deleted, third.unchanged), (["d.md"], ["b.md"], ["c.md"], 1))
+        ops = [(r["op"], r["args"].get("action"), r["args"].get("source_id")) for r in captured[before:]]
+        self.assertEqual(
+            ops,
+            [
+                ("group_space_ingest", None, None),
+                ("group_space_sources", "delete", "src_2"),
+                ("group_space_ingest", None, None),
+                ("group_space_sources", "delete", "src_3"),
+            ],
+        )
+
+    def test_async_ingest_resolves_source_by_title_and_revert_reingests(self) -> None:
+        captured: list[dict] = []
+        remote: dict = {}  # source_id -> title
+        jobs: dict = {}  # idempotency_key -> source_id (daemon-side dedupe)
+
+        def fake_call_daemon(*, endpoint, request, timeout_s):  # type: ignore[no-untyped-def]
+            args = request["args"]
+            captured.append(request)
+            if request["op"] == "group_space_ingest":
+                key = args["idempotency_key"]
+                if key not in jobs:
+                    jobs[key] = f"src_{len(jobs) + 1}"
+                    remote[jobs[key]] = args["payload"]["title"]
+                return {"ok": True, "result": {"job_id": key, "accepted": True, "job": {"state": "running"}}}
+            if args["action"] == "list":
+                return {"ok": True, "result": {"sources": [{"source_id": k, "title": t} for k, t in remote.items()]}}
+            remote.pop(args["source_id"], None)
+            return {"ok": True, "result": {"action": "delete"}}
+
+        client = CCCCClient(endpoint=DaemonEndpoint(transport="tcp", host="127.0.0.1", port=9000))
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td) / "docs"
+            root.mkdir()
+            doc = root / "a.md"
+            kw = {"group_id": "g_1", "root": str(root), "manifest_path": str(Path(td) / "m.json")}
+            with patch("cccc_sdk.client.call_daemon", side_effect=fake_call_daemon):
+                for text in ("A", "B", "A"):
+                    doc.write_text(text, encoding="utf-8")
+                    self.assertTrue(sync_space_sources(client, **kw).ok)
+                doc.unlink()
+                self.assertTrue(sync_space_sources(client, **kw).ok)
+
+        keys = [r["args"]["idempotency_key"] for r in captured if r["op"] == "group_space_ingest"]
+        self.assertEqual(len(set(keys)), 3)  # the revert is a new ingest, not a dedupe to a deleted source
+        deletes = [r["args"]["source_id"] for r in captured if r["args"].get("action") == "delete"]
+        self.assertEqual(deletes, ["src_1", "src_2", "src_3"])
+        self.assertEqual(remote, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import unittest
+from unittest.mock import patch
+
+from cccc_sdk.client import CCCCClient
+from cccc_sdk.tail import TailFollower, diff_tail
+from cccc_sdk.transport import DaemonEndpoint
+
+
+class TestDiffTail(unittest.TestCase):
+    def test_overlap_anchor_and_gap(self) -> None:
+        self.assertEqual(diff_tail(["a", "b", "c"], ["b", "c", "d", "e"]), (["d", "e"], False))
+        self.assertEqual(diff_tail(["a", "b", "c"], ["a", "b", "c"]), ([], False))
+        self.assertEqual(diff_tail(["x", "x"], ["x", "x", "x"]), (["x"], False))
+        # head of the window rewritten, but the old tail is still there
+        self.assertEqual(diff_tail(["a", "b", "c", "d"], ["zz", "b", "c", "d", "e"]), (["e"], False))
+        self.assertEqual(diff_tail(["a", "b"], ["p", "q"]), (["p", "q"], True))
+        self.assertEqual(diff_tail([], ["p"]), (["p"], False))
+
+
+class TestTailFollower(unittest.TestCase):
+    def test_emits_only_new_lines_and_adapts(self) -> None:
+        now = [0.0]
+        term = {"text": "boot\n$ "}
+        logs = {"lines": ["l1", "l2"]}
+        ops: list[str] = []
+
+        def fake_call_daemon(*, endpoint, request, timeout_s):  # type: ignore[no-untyped-def]
+            ops.append(request["op"])
+            if request["op"] == "terminal_tail":
+                self.assertEqual(request["args"]["max_chars"], 100)
+                return {"ok": True, "result": {"text": term["text"]}}
+            return {"ok": True, "result": {"lines": logs["lines"]}}
+
+        client = CCCCClient(endpoint=DaemonEndpoint(transport="tcp", host="127.0.0.1", port=9000))
+        follower = TailFollower(client, min_interval_s=1.0, max_interval_s=8.0, backoff=2.0, clock=lambda: now[0])
+        got: list[tuple] = []
+        with patch("cccc_sdk.client.call_daemon", side_effect=fake_call_daemon):
+            follower.follow_terminal(group_id="g_1", actor_id="peer-1", max_chars=100, callback=lambda k, n, g: got.append((k[0], n, g)))
+            follower.follow_logs(component="daemon", lines=50, callback=lambda k, n, g: got.append((k[0], n, g)))
+
+            self.assertEqual(follower.poll_once(), 2.0)  # baseline only, nothing emitted
+            self.assertEqual(got, [])
+
+            term["text"] = "boot\n$ ls\nfile.txt\n$ "
+            logs["lines"] = ["l2", "l3"]
+            now[0] = 2.0
+            self.assertEqual(follower.poll_once(), 1.0)  # output arrived -> back to min interval
+            now[0] = 3.0
+            follower.poll_once()  # quiet -> both back off to 2s
+            now[0] = 4.0
+            self.assertEqual(follower.poll_once(), 1.0)  # nothing due until t=5
+
+        self.assertEqual(got, [("terminal", ["$ ls", "file.txt"], False), ("logs", ["l3"], False)])
+        self.assertEqual(follower.lines_emitted, 3)
+        self.assertEqual(follower.polls, 6)
+        self.assertEqual(ops.count("terminal_tail"), 3)
+
+    def test_raising_callback_is_isolated_and_redelivered(self) -> None:
+        now = [0.0]
+        logs = {"a": ["a1"], "b": ["b1"]}
+
+        def fake_call_daemon(*, endpoint, request, timeout_s):  # type: ignore[no-untyped-def]
+            return {"ok": True, "result": {"lines": logs[request["args"]["component"]]}}
+
+        failures = [1]
+        got: list[tuple] = []
+
+        def flaky(key, lines, gap):  # type: ignore[no-untyped-def]
+            if failures[0]:
+                failures[0] -= 1
+                raise RuntimeError("consumer down")
+            got.append((key[1], lines))
+
+        client = CCCCClient(endpoint=DaemonEndpoint(transport="tcp", host="127.0.0.1", port=9000))
+        follower = TailFollower(client, min_interval_s=1.0, clock=lambda: now[0])
+        with patch("cccc_sdk.client.call_daemon", side_effect=fake_call_daemon):
+            follower.follow_logs(component="a", callback=flaky)
+            follower.follow_logs(component="b", callback=lambda k, n, g: got.append((k[1], n)))
+            follower.poll_once()
+
+            logs["a"], logs["b"] = ["a1", "a2"], ["b1", "b2"]
+            now[0] = 2.0
+            follower.poll_once()  # "a" raises, "b" is still polled
+            self.assertEqual(got, [("b", ["b2"])])
+
+            now[0] = 3.0
+            follower.poll_once()  # "a2" offered again
+
+        self.assertEqual(got, [("b", ["b2"]), ("a", ["a2"])])
+        self.assertEqual(follower.callback_errors, 1)
+        self.assertEqual(follower.lines_emitted, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from cccc_sdk.client import CCCCClient
+from cccc_sdk.templates import ProvisionTarget, TemplateProvisioner, template_hash
+from cccc_sdk.transport import DaemonEndpoint
+
+TEMPLATE = "kind: cccc.group_template\nv: 1\nactors: []\n"
+
+
+class TestTemplates(unittest.TestCase):
+    def test_bindings(self) -> None:
+        captured: list[dict] = []
+
+        def fake_call_daemon(*, endpoint, request, timeout_s):  # type: ignore[no-untyped-def]
+            captured.append(request)
+            return {"ok": True, "result": {"group_id": "g_new", "applied": True}}
+
+        client = CCCCClient(endpoint=DaemonEndpoint(transport="tcp", host="127.0.0.1", port=9000))
+        with patch("cccc_sdk.client.call_daemon", side_effect=fake_call_daemon):
+            client.group_create_from_template(path="/repo", template=TEMPLATE, title="T")
+            client.group_template_import_replace(group_id="g_1", template=TEMPLATE, confirm="g_1")
+
+        self.assertEqual(captured[0]["op"], "group_create_from_template")
+        self.assertEqual(captured[0]["args"], {"path": "/repo", "by": "user", "template": TEMPLATE, "title": "T"})
+        self.assertEqual(captured[1]["args"]["confirm"], "g_1")
+
+    def test_provision_bounded_and_cached(self) -> None:
+        lock = threading.Lock()
+        ops: list[str] = []
+        in_flight = [0, 0]  # current, peak
+
+        def fake_call_daemon(*, endpoint, request, timeout_s):  # type: ignore[no-untyped-def]
+            op, args = request["op"], request["args"]
+            with lock:
+                ops.append(op)
+            if op == "group_template_export":
+                return {"ok": True, "result": {"template": TEMPLATE, "filename": "t.yaml"}}
+            if op == "group_template_preview":
+                return {"ok": True, "result": {"template": {}, "diff": {}}}
+            with lock:
+                in_flight[0] += 1
+                in_flight[1] = max(in_flight)
+            time.sleep(0.03)
+            with lock:
+                in_flight[0] -= 1
+            self.assertEqual(args["template"], TEMPLATE)
+            if args["path"] == "/bad":
+                return {"ok": False, "error": {"code": "invalid_path", "message": "nope"}}
+            return {"ok": True, "result": {"group_id": "g" + args["path"].replace("/", "_"), "applied": True}}
+
+        client = CCCCClient(endpoint=DaemonEndpoint(transport="tcp", host="127.0.0.1", port=9000))
+        prov = TemplateProvisioner(client, max_workers=3)
+        targets = [ProvisionTarget(path=f"/p{i}") for i in range(8)] + [ProvisionTarget(path="/bad")]
+        progress: list[int] = []
+        with patch("cccc_sdk.client.call_daemon", side_effect=fake_call_daemon):
+            report = prov.provision(targets, source_group_id="g_src", on_progress=lambda o, d, t: progress.append(t))
+            prov.provision(targets[:1], source_group_id="g_src")
+            prov.preview("g_p0", TEMPLATE)
+            prov.preview("g_p0", TEMPLATE)
+
+        self.assertEqual(ops.count("group_template_export"), 1)
+        self.assertEqual(ops.count("group_template_preview"), 1)
+        self.assertLessEqual(in_flight[1], 3)
+        self.assertEqual(report.template_hash, template_hash(TEMPLATE))
+        self.assertEqual(len(report.succeeded), 8)
+        self.assertEqual([(o.target.path, o.error_code) for o in report.failed], [("/bad", "invalid_path")])
+        self.assertEqual(progress, [9] * 9)
+        with self.assertRaises(ValueError):
+            prov.provision(targets)
+
+
+if __name__ == "__main__":
+    unittest.main()
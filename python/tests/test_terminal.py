@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import json
+import socket
+import threading
+import unittest
+from unittest.mock import patch
+
+from cccc_sdk.client import CCCCClient
+from cccc_sdk.errors import DaemonAPIError
+from cccc_sdk.terminal import Scrollback
+from cccc_sdk.transport import DaemonEndpoint
+
+
+class _FakePtyDaemon:
+    """One-connection TCP server: handshake, then raw bytes, then echo of the client's input."""
+
+    def __init__(self, *, ok: bool = True) -> None:
+        self.ok = ok
+        self.request: dict = {}
+        self.received = b""
+        self._srv = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._srv.bind(("127.0.0.1", 0))
+        self._srv.listen(1)
+        self.port = self._srv.getsockname()[1]
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+    def _serve(self) -> None:
+        conn, _ = self._srv.accept()
+        with conn, conn.makefile("rb") as f:
+            self.request = json.loads(f.readline())
+            if not self.ok:
+                err = {"code": "not_pty_actor", "message": "headless"}
+                conn.sendall((json.dumps({"v": 1, "ok": False, "error": err}) + "\n").encode())
+                return
+            hs = {"v": 1, "ok": True, "result": self.request["args"]}
+            conn.sendall((json.dumps(hs) + "\n").encode() + b"$ ")  # output in the handshake segment
+            conn.sendall(b"x" * 5000)
+            self.received = f.read(4)
+            conn.sendall(b"echo:" + self.received)
+        self._srv.close()
+
+    def join(self) -> None:
+        self._thread.join(5)
+
+
+class TestTerminal(unittest.TestCase):
+    def test_scrollback_ring(self) -> None:
+        sb = Scrollback(8)
+        sb.write(b"hello")
+        self.assertEqual(sb.getvalue(), b"hello")
+        sb.write(b" world")
+        self.assertEqual(sb.getvalue(), b"lo world")
+        sb.write(b"0123456789abc")
+        self.assertEqual(sb.getvalue(), b"56789abc")
+        self.assertEqual(sb.total_bytes, 24)
+
+    def test_attach_stream_write_and_resize(self) -> None:
+        daemon = _FakePtyDaemon()
+        client = CCCCClient(endpoint=DaemonEndpoint(transport="tcp", host="127.0.0.1", port=daemon.port))
+        resized: list[dict] = []
+
+        def fake_call_daemon(*, endpoint, request, timeout_s):  # type: ignore[no-untyped-def]
+            resized.append(request)
+            return {"ok": True, "result": request["args"]}
+
+        with client.term_attach(group_id="g_1", actor_id="peer-1", chunk_bytes=1024, scrollback_bytes=64) as term:
+            self.assertEqual(term.handshake, {"group_id": "g_1", "actor_id": "peer-1"})
+            with patch("cccc_sdk.client.call_daemon", side_effect=fake_call_daemon):
+                term.resize(cols=120, rows=40)
+            out = b""
+            sent = False
+            for chunk in term.chunks():
+                self.assertLessEqual(len(chunk), 1024)
+                out += chunk
+                if not sent and len(out) >= 5002:
+                    term.write("ls\r\n")
+                    sent = True
+        daemon.join()
+
+        self.assertEqual(daemon.request["op"], "term_attach")
+        self.assertEqual(out, b"$ " + b"x" * 5000 + b"echo:ls\r\n")
+        self.assertEqual(daemon.received, b"ls\r\n")
+        self.assertEqual(term.bytes_read, len(out))
+        assert term.scrollback is not None
+        self.assertEqual(term.scrollback.getvalue(), out[-64:])
+        self.assertEqual(resized[0]["op"], "term_resize")
+        self.assertEqual(resized[0]["args"]["cols"], 120)
+
+    def test_attach_error(self) -> None:
+        daemon = _FakePtyDaemon(ok=False)
+        client = CCCCClient(endpoint=DaemonEndpoint(transport="tcp", host="127.0.0.1", port=daemon.port))
+        with self.assertRaises(DaemonAPIError) as ctx:
+            client.term_attach(group_id="g_1", actor_id="peer-1")
+        daemon.join()
+        self.assertEqual(ctx.exception.code, "not_pty_actor")
+
+
+if __name__ == "__main__":
+    unittest.main()
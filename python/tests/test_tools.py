@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from cccc_sdk.client import CCCCClient
+from cccc_sdk.tools import ToolCall, ToolExecutor
+from cccc_sdk.transport import DaemonEndpoint
+
+
+class TestToolExecutor(unittest.TestCase):
+    def test_concurrent_calls_deadlines_and_memo(self) -> None:
+        delays = {"slow": 0.3, "fast": 0.05, "hang": 5.0}
+        lock = threading.Lock()
+        sent: list[tuple[str, float]] = []
+
+        def fake_call_daemon(*, endpoint, request, timeout_s):  # type: ignore[no-untyped-def]
+            name = request["args"]["tool_name"]
+            with lock:
+                sent.append((name, timeout_s))
+            if name == "broken":
+                return {"ok": False, "error": {"code": "capability_tool_failed", "message": "nope"}}
+            delay = delays[name]
+            time.sleep(min(delay, timeout_s))
+            if delay > timeout_s:
+                raise TimeoutError("timed out")
+            return {"ok": True, "result": {"tool_name": name, "result": {"args": request["args"]["arguments"]}}}
+
+        client = CCCCClient(endpoint=DaemonEndpoint(transport="tcp", host="127.0.0.1", port=9000))
+        with patch("cccc_sdk.client.call_daemon", side_effect=fake_call_daemon), ToolExecutor(
+            client, group_id="g_1", actor_id="peer-1", default_timeout_s=1.0, pure_tools=["fast"]
+        ) as ex:
+            t0 = time.monotonic()
+            results = ex.run(
+                [
+                    ToolCall("slow"),
+                    {"tool_name": "fast", "arguments": {"b": 2, "a": 1}},
+                    ToolCall("fast", {"a": 1, "b": 2}),
+                    ToolCall("hang", timeout_s=0.2),
+                    ToolCall("broken"),
+                ]
+            )
+            elapsed = time.monotonic() - t0
+            again = ex.call("fast", {"a": 1, "b": 2})
+
+        self.assertLess(elapsed, 0.6)  # ~ the slowest successful call, not the sum
+        self.assertEqual([r.ok for r in results], [True, True, True, False, False])
+        self.assertEqual(results[1].result["result"]["args"], {"a": 1, "b": 2})
+        self.assertTrue(results[3].timed_out)
+        self.assertEqual(results[4].error_code, "capability_tool_failed")
+        self.assertTrue(again.cached)
+        self.assertEqual([n for n, _ in sent].count("fast"), 1)
+        self.assertIn(("hang", 0.2), sent)
+        self.assertEqual(ex.memo_stats().hits, 1)
+
+    def test_queued_call_finishing_after_its_deadline_times_out(self) -> None:
+        def fake_call_daemon(*, endpoint, request, timeout_s):  # type: ignore[no-untyped-def]
+            name = request["args"]["tool_name"]
+            time.sleep(0.3 if name == "slow" else 0.05)
+            return {"ok": True, "result": {"tool_name": name, "result": {}}}
+
+        client = CCCCClient(endpoint=DaemonEndpoint(transport="tcp", host="127.0.0.1", port=9000))
+        with patch("cccc_sdk.client.call_daemon", side_effect=fake_call_daemon), ToolExecutor(
+            client, group_id="g_1", actor_id="peer-1", max_workers=1, default_timeout_s=1.0
+        ) as ex:
+            slow, quick = ex.run([ToolCall("slow"), ToolCall("quick", timeout_s=0.2)])
+
+        self.assertTrue(slow.ok)
+        # queued behind "slow", so it only completes at ~0.35s, past its own 0.2s deadline
+        self.assertTrue(quick.timed_out)
+        self.assertGreater(quick.elapsed_s, 0.2)
+
+
+if __name__ == "__main__":
+    unittest.main()